@@ -164,3 +164,7 @@ class STCWrapper:
         """Clear cached stream context."""
         cache_key = (session_id, stream_id)
         self._stream_contexts.pop(cache_key, None)
+    
+    def clear_stream_contexts(self):
+        """Clear every cached stream context."""
+        self._stream_contexts.clear()
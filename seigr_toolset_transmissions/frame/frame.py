@@ -16,8 +16,6 @@ from typing import Optional, TYPE_CHECKING, Callable, Dict
 from ..utils.constants import (
     STT_MAGIC,
     STT_SESSION_ID_LENGTH,
-    STT_SEQUENCE_LENGTH,
-    STT_TIMESTAMP_LENGTH,
     STT_MAX_FRAME_SIZE,
 )
 from ..utils.exceptions import STTFrameError
@@ -33,6 +31,9 @@ FRAME_TYPE_STT_MAX = 0x7F
 FRAME_TYPE_CUSTOM_MIN = 0x80
 FRAME_TYPE_CUSTOM_MAX = 0xFF
 
+# Fixed header: type | flags | session_id | sequence | timestamp | stream_id
+_HEADER = struct.Struct('!BB8sQQI')
+
 
 @dataclass
 class STTFrame:
@@ -174,8 +175,7 @@ class STTFrame:
             STTFrameError: If encoding fails
         """
         # Build header (without magic and length)
-        header = struct.pack(
-            '!BB8sQQI',
+        header = _HEADER.pack(
             self.frame_type,
             self.flags,
             self.session_id,
@@ -185,19 +185,13 @@ class STTFrame:
         )
         
         # Add crypto metadata if present
-        frame_body = header
-        if self.crypto_metadata:
-            meta_len = encode_varint(len(self.crypto_metadata))
-            frame_body += meta_len + self.crypto_metadata
-        else:
-            # No metadata, encode zero length
-            frame_body += encode_varint(0)
-        
-        # Add payload
-        frame_body += self.payload
+        crypto_metadata = self.crypto_metadata or b''
+        meta_len = encode_varint(len(crypto_metadata))
         
         # Calculate total length
-        total_length = len(frame_body)
+        total_length = (
+            len(header) + len(meta_len) + len(crypto_metadata) + len(self.payload)
+        )
         
         if total_length > STT_MAX_FRAME_SIZE:
             raise STTFrameError(
@@ -207,10 +201,10 @@ class STTFrame:
         # Encode length as varint
         length_bytes = encode_varint(total_length)
         
-        # Assemble complete frame
-        frame = STT_MAGIC + length_bytes + frame_body
-        
-        return frame
+        # Assemble complete frame (payload is copied once)
+        return b''.join((
+            STT_MAGIC, length_bytes, header, meta_len, crypto_metadata, self.payload
+        ))
     
     @classmethod
     def from_bytes(cls, data: bytes, decrypt: bool = False, 
@@ -254,18 +248,14 @@ class STTFrame:
             )
         
         # Parse header
-        header_size = 1 + 1 + STT_SESSION_ID_LENGTH + STT_SEQUENCE_LENGTH + \
-                      STT_TIMESTAMP_LENGTH + 4  # stream_id is 4 bytes
+        header_size = _HEADER.size
         
         if total_length < header_size:
             raise STTFrameError(f"Frame too small: {total_length} < {header_size}")
         
-        header_data = data[header_offset:header_offset + header_size]
-        
         try:
-            frame_type, flags, session_id, sequence, timestamp, stream_id = struct.unpack(
-                '!BB8sQQI',
-                header_data
+            frame_type, flags, session_id, sequence, timestamp, stream_id = _HEADER.unpack_from(
+                data, header_offset
             )
         except struct.error as e:
             raise STTFrameError(f"Failed to parse header: {e}")
@@ -317,8 +307,7 @@ class STTFrame:
         Returns:
             AD = type | flags | session_id | seq | timestamp | stream_id
         """
-        return struct.pack(
-            '!BB8sQQI',
+        return _HEADER.pack(
             self.frame_type,
             self.flags,
             self.session_id,
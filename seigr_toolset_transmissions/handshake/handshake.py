@@ -6,13 +6,19 @@ Simplified symmetric trust model with STC-based authentication.
 
 import time
 import secrets
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from ..crypto.stc_wrapper import STCWrapper
 from ..utils.serialization import serialize_stt, deserialize_stt
 from ..utils.exceptions import STTHandshakeError
 
 
+# PHE context for HELLO commitments (hash_data copies it, never mutates)
+_COMMITMENT_CONTEXT = {'purpose': 'hello_commitment'}
+
+NONCE_SIZE = 32
+
+
 class STTHandshake:
     """
     Simplified STC-based handshake protocol.
@@ -24,6 +30,12 @@ class STTHandshake:
     4. Session established with derived session key
     """
     
+    __slots__ = (
+        'node_id', 'stc_wrapper', 'is_initiator',
+        'session_id', 'our_nonce', 'peer_nonce', 'peer_node_id',
+        'session_key', 'challenge', 'challenge_metadata', 'completed',
+    )
+    
     def __init__(self, node_id: bytes, stc_wrapper: STCWrapper, is_initiator: bool = True):
         """
         Initialize handshake.
@@ -55,12 +67,12 @@ class STTHandshake:
             Serialized HELLO message
         """
         # Generate fresh nonce
-        self.our_nonce = secrets.token_bytes(32)
+        self.our_nonce = secrets.token_bytes(NONCE_SIZE)
         
         # Create commitment: hash of (node_id + nonce)
         commitment = self.stc_wrapper.hash_data(
             self.node_id + self.our_nonce,
-            {'purpose': 'hello_commitment'}
+            _COMMITMENT_CONTEXT
         )
         
         # Serialize HELLO message
@@ -95,7 +107,7 @@ class STTHandshake:
         self.peer_nonce = hello_msg['nonce']
         
         # Generate our nonce
-        self.our_nonce = secrets.token_bytes(32)
+        self.our_nonce = secrets.token_bytes(NONCE_SIZE)
         
         # Create challenge payload: combine both nonces
         challenge_payload = self.peer_nonce + self.our_nonce
@@ -342,6 +354,22 @@ class HandshakeManager:
         
         return hello_data, handshake
     
+    def derive_commitments(self, messages: List[bytes]) -> List[bytes]:
+        """
+        Derive HELLO commitments for a batch of (node_id + nonce) payloads.
+        
+        Runs sequentially on purpose: STC's PHE digest morphs shared context
+        state on every call, so it cannot be fanned out across threads.
+        
+        Args:
+            messages: Commitment inputs, one per handshake
+            
+        Returns:
+            Commitments in the same order as messages
+        """
+        hash_data = self.stc_wrapper.hash_data
+        return [hash_data(message, _COMMITMENT_CONTEXT) for message in messages]
+    
     def handle_hello(self, hello_data: bytes) -> bytes:
         """
         Handle incoming HELLO message.
@@ -400,9 +428,11 @@ class HandshakeManager:
         
         return None
     
-    async def initiate_handshake(self, peer_address: tuple) -> STTHandshake:
+    def begin_handshake(self, peer_address: tuple) -> STTHandshake:
         """
-        Async-compatible initiate handshake.
+        Register a new initiator handshake for peer (synchronous).
+        
+        No I/O is performed - the caller sends HELLO via create_hello().
         
         Args:
             peer_address: Peer address tuple (ip, port)
@@ -419,6 +449,18 @@ class HandshakeManager:
         self.active_handshakes[peer_address] = handshake
         return handshake
     
+    async def initiate_handshake(self, peer_address: tuple) -> STTHandshake:
+        """
+        Async-compatible initiate handshake.
+        
+        Args:
+            peer_address: Peer address tuple (ip, port)
+            
+        Returns:
+            STTHandshake instance
+        """
+        return self.begin_handshake(peer_address)
+    
     async def handle_incoming(self, peer_address: tuple, data: bytes) -> bytes:
         """
         Handle incoming handshake message.
@@ -2,21 +2,40 @@
 STT Session management with STC-based key rotation.
 """
 
+import secrets
 import time
+from collections import deque
 from typing import Optional, Dict, TYPE_CHECKING
 
 from ..crypto.stc_wrapper import STCWrapper
+from ..utils.constants import STT_SESSION_ID_LENGTH
 from ..utils.exceptions import STTSessionError
 
 if TYPE_CHECKING:
     from .continuity import CryptoSessionContinuity
 
+# Bytes of fresh randomness mixed into each key rotation
+ROTATION_NONCE_SIZE = 32
+
 
 class STTSession:
     """
     STT session with cryptographic state and key rotation.
     """
     
+    # No per-instance __dict__: relays hold many sessions at once
+    __slots__ = (
+        'session_id', '_id_hex', 'peer_node_id', 'stc_wrapper',
+        'is_active', 'key_version', 'session_key', 'created_at', 'last_activity',
+        'state', 'peer_addr', 'transport_type',
+        'bytes_sent', 'bytes_received', 'frames_sent', 'frames_received',
+        'rtt_samples', 'max_rtt_samples', 'frame_send_times',
+        'encryption_time_total', 'decryption_time_total',
+        'encryption_ops', 'decryption_ops',
+        'throughput_window', 'throughput_window_size', '_window_bytes',
+        'metadata',
+    )
+    
     def __init__(self, session_id: bytes, peer_node_id: bytes, stc_wrapper: STCWrapper, metadata: Optional[Dict] = None):
         """
         Initialize session.
@@ -27,19 +46,30 @@ class STTSession:
             stc_wrapper: STC wrapper for crypto operations
             metadata: Optional metadata dictionary
         """
-        if len(session_id) != 8:
-            raise STTSessionError(f"Session ID must be 8 bytes, got {len(session_id)}")
+        # Views and bytearrays are copied once so the ID is hashable and
+        # immutable as a SessionManager key; bytes pass through untouched
+        if isinstance(session_id, (bytearray, memoryview)):
+            session_id = bytes(session_id)
+        
+        sid_len = len(session_id)
+        if sid_len != STT_SESSION_ID_LENGTH:
+            raise STTSessionError(
+                f"Session ID must be {STT_SESSION_ID_LENGTH} bytes, got {sid_len}"
+            )
         
         self.session_id = session_id
         self.peer_node_id = peer_node_id
         self.stc_wrapper = stc_wrapper
         
+        # session_id never changes; encode it for stats/repr once
+        self._id_hex = session_id.hex()
+        
         # Session state
         self.is_active = True
         self.key_version = 0
         self.session_key: Optional[bytes] = None
         self.created_at = time.time()
-        self.last_activity = time.time()
+        self.last_activity = self.created_at
         
         # Peer transport address (for sending)
         self.peer_addr: Optional[tuple] = None  # (ip, port)
@@ -61,12 +91,26 @@ class STTSession:
         self.decryption_ops = 0
         
         # Throughput tracking
-        self.throughput_window = []  # (timestamp, bytes) tuples
+        self.throughput_window: deque = deque()  # (timestamp, bytes), oldest first
         self.throughput_window_size = 10  # seconds
+        self._window_bytes = 0  # Running byte total of throughput_window
         
         # Metadata
         self.metadata: Dict = metadata if metadata is not None else {}
     
+    def __repr__(self) -> str:
+        state = 'active' if self.is_active else 'closed'
+        return f"STTSession({self._id_hex}, {state}, key_version={self.key_version})"
+    
+    @property
+    def _last_activity(self) -> float:
+        """Alias of last_activity (name used by SessionManager.cleanup_expired)."""
+        return self.last_activity
+    
+    @_last_activity.setter
+    def _last_activity(self, value: float) -> None:
+        self.last_activity = value
+    
     def rotate_keys(self, stc_wrapper: STCWrapper) -> None:
         """
         Rotate session keys.
@@ -95,25 +139,27 @@ class STTSession:
         # Track for throughput calculation
         current_time = time.time()
         self.throughput_window.append((current_time, size))
+        self._window_bytes += size
         
         # Clean old entries
-        cutoff = current_time - self.throughput_window_size
-        self.throughput_window = [(t, s) for t, s in self.throughput_window if t > cutoff]
+        self._prune_throughput(current_time)
         
         # Track frame send time for RTT calculation
         if frame_id is not None:
             self.frame_send_times[frame_id] = current_time
         
-        self.update_activity()
+        # Same clock reading as above; no second time.time() call
+        self.last_activity = current_time
     
     def record_frame_received(self, size: int, frame_id: Optional[int] = None) -> None:
         """Record received frame statistics and calculate RTT if applicable."""
         self.frames_received += 1
         self.bytes_received += size
+        current_time = time.time()
         
         # Calculate RTT if this is a response to our frame
         if frame_id is not None and frame_id in self.frame_send_times:
-            rtt = time.time() - self.frame_send_times[frame_id]
+            rtt = current_time - self.frame_send_times[frame_id]
             self.rtt_samples.append(rtt)
             
             # Keep only recent samples
@@ -123,7 +169,7 @@ class STTSession:
             # Clean up send time
             del self.frame_send_times[frame_id]
         
-        self.update_activity()
+        self.last_activity = current_time
     
     def record_encryption(self, duration: float) -> None:
         """Record encryption operation timing."""
@@ -147,19 +193,25 @@ class STTSession:
             return 0.0
         
         current_time = time.time()
-        cutoff = current_time - self.throughput_window_size
-        recent = [(t, s) for t, s in self.throughput_window if t > cutoff]
+        self._prune_throughput(current_time)
         
-        if not recent:
+        if not self.throughput_window:
             return 0.0
         
-        total_bytes = sum(s for _, s in recent)
-        time_span = current_time - recent[0][0]
+        time_span = current_time - self.throughput_window[0][0]
         
         if time_span == 0:
             return 0.0
         
-        return total_bytes / time_span
+        return self._window_bytes / time_span
+    
+    def _prune_throughput(self, current_time: float) -> None:
+        """Drop window entries older than throughput_window_size."""
+        window = self.throughput_window
+        cutoff = current_time - self.throughput_window_size
+        # Entries are appended in time order, so expired ones sit at the left
+        while window and window[0][0] <= cutoff:
+            self._window_bytes -= window.popleft()[1]
     
     def record_sent_bytes(self, size: int) -> None:
         """Record sent bytes (alias for compatibility)."""
@@ -185,7 +237,7 @@ class STTSession:
         throughput = self.get_current_throughput()
         
         stats = {
-            'session_id': self.session_id.hex(),
+            'session_id': self._id_hex,
             'peer_node_id': self.peer_node_id.hex(),
             'key_version': self.key_version,
             'is_active': self.is_active,
@@ -226,18 +278,17 @@ class STTSession:
         """Check if session is active (method version)."""
         return self.is_active
     
-    async def rotate_key(self, stc_wrapper: STCWrapper) -> None:
+    async def rotate_key(self, stc_wrapper: STCWrapper, rotation_nonce: Optional[bytes] = None) -> None:
         """Rotate session key using STC.
         
         Args:
             stc_wrapper: STC wrapper for key derivation
+            rotation_nonce: Fresh nonce for this rotation (drawn here if omitted)
         """
-        # Generate rotation nonce
-        import secrets
-        rotation_nonce = secrets.token_bytes(32)
-        
         # Derive new session key from current key + nonce
         if self.session_key:
+            if rotation_nonce is None:
+                rotation_nonce = secrets.token_bytes(ROTATION_NONCE_SIZE)
             new_key = stc_wrapper.rotate_session_key(self.session_key, rotation_nonce)
             self.session_key = new_key
             self.key_version += 1
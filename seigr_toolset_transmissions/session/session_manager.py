@@ -3,10 +3,11 @@ Session manager for handling multiple active sessions.
 """
 
 import asyncio
+import secrets
 import time
 from typing import Dict, Optional, List
 
-from .session import STTSession
+from .session import STTSession, ROTATION_NONCE_SIZE
 from ..utils.exceptions import STTSessionError
 from ..utils.logging import get_logger
 
@@ -31,6 +32,8 @@ class SessionManager:
         self.local_node_id = node_id
         self.stc_wrapper = stc_wrapper
         self.sessions: Dict[bytes, STTSession] = {}
+        # peer_node_id -> {session_id: session}, kept in step with sessions
+        self._by_peer: Dict[bytes, Dict[bytes, STTSession]] = {}
         self._lock = asyncio.Lock()
     
     async def create_session(
@@ -65,6 +68,7 @@ class SessionManager:
             )
             
             self.sessions[session_id] = session
+            self._by_peer.setdefault(peer_node_id, {})[session_id] = session
             
             logger.info(
                 f"Created session {session_id.hex()} "
@@ -140,7 +144,7 @@ class SessionManager:
             ]
             
             for sid in closed_ids:
-                del self.sessions[sid]
+                self._remove(sid)
             
             if closed_ids:
                 logger.debug(f"Cleaned up {len(closed_ids)} closed sessions")
@@ -153,9 +157,17 @@ class SessionManager:
     
     async def rotate_all_keys(self, stc_wrapper) -> None:
         """Rotate keys for all active sessions."""
-        for session in self.get_active_sessions():
+        sessions = self.get_active_sessions()
+        
+        # One CSPRNG read covers every session's rotation nonce
+        nonces = secrets.token_bytes(ROTATION_NONCE_SIZE * len(sessions))
+        
+        for idx, session in enumerate(sessions):
+            offset = idx * ROTATION_NONCE_SIZE
             # Rotate session key using STC
-            await session.rotate_key(stc_wrapper)
+            await session.rotate_key(
+                stc_wrapper, nonces[offset:offset + ROTATION_NONCE_SIZE]
+            )
     
     async def cleanup_inactive(self, timeout: float = 600) -> int:
         """Remove inactive sessions."""
@@ -179,9 +191,7 @@ class SessionManager:
             ]
             
             for sid in expired_ids:
-                session = self.sessions[sid]
-                session.close()
-                del self.sessions[sid]
+                self._remove(sid).close()
             
             if expired_ids:
                 logger.debug(f"Cleaned up {len(expired_ids)} expired sessions")
@@ -201,12 +211,21 @@ class SessionManager:
         Returns:
             Active session or None
         """
-        for session in self.sessions.values():
-            if (session.peer_node_id == peer_node_id and
-                session.is_active):
+        for session in self._by_peer.get(peer_node_id, {}).values():
+            if session.is_active:
                 return session
         return None
     
+    def _remove(self, session_id: bytes) -> STTSession:
+        """Drop session from both the ID map and the peer index."""
+        session = self.sessions.pop(session_id)
+        bucket = self._by_peer.get(session.peer_node_id)
+        if bucket is not None:
+            bucket.pop(session_id, None)
+            if not bucket:
+                del self._by_peer[session.peer_node_id]
+        return session
+    
     def get_stats(self) -> dict:
         """Get statistics for all sessions."""
         return {
@@ -9,11 +9,15 @@ Based purely on local content analysis, no external dependencies.
 """
 
 import asyncio
+import hashlib
 import math
+from collections import Counter, OrderedDict, deque
 import secrets  # Use secrets instead of random for better randomness
+import struct
 import time
-from typing import List, TYPE_CHECKING
+from typing import Iterator, List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .stream import STTStream
 from ..utils.logging import get_logger
@@ -24,10 +28,69 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Entropy results remembered per stream (keyed by 16-byte content digest)
+ENTROPY_CACHE_SIZE = 1024
+
+# Segments sent concurrently by send_probabilistic (per stream)
+MAX_INFLIGHT_SEGMENTS = 8
+
+# Floor for the adaptive per-attempt send timeout (seconds)
+MIN_SEND_TIMEOUT = 0.5
+
+# Largest segment size given a precomputed -c*log2(c/n) table (~32 B/entry);
+# covers the 16KB default (~0.5 MB, built once per size per process)
+LOG_TABLE_MAX_SEGMENT = 16384
+
+
+class _AdaptiveTimeout:
+    """
+    Per-attempt send timeout derived from observed send latency.
+    
+    timeout = clamp(safety * p99 * 2^attempt, min_timeout, max_timeout)
+    
+    Until min_samples latencies are recorded there is no distribution to
+    trust, so max_timeout is used and retries rely on plain backoff.
+    """
+    
+    def __init__(
+        self,
+        safety: float = 2.0,
+        min_timeout: float = MIN_SEND_TIMEOUT,
+        max_timeout: float = 5.0,
+        min_samples: int = 20,
+        window: int = 256
+    ):
+        self.safety = safety
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.min_samples = min_samples
+        self._samples: deque = deque(maxlen=window)
+        # p99 of _samples; None until recomputed after the latest record()
+        self._p99: Optional[float] = None
+    
+    def record(self, latency: float) -> None:
+        """Record one send latency (seconds); a timeout records its limit."""
+        self._samples.append(latency)
+        self._p99 = None
+    
+    def select(self, attempt: int) -> float:
+        """Timeout (seconds) for zero-based attempt number."""
+        count = len(self._samples)
+        if count < self.min_samples:
+            return self.max_timeout
+        
+        p99 = self._p99
+        if p99 is None:
+            p99 = self._p99 = sorted(self._samples)[math.ceil(count * 0.99) - 1]
+        timeout = self.safety * p99 * (2 ** attempt)
+        return min(max(timeout, self.min_timeout), self.max_timeout)
+
 
 @dataclass
 class SegmentMetadata:
     """Metadata for probabilistic segment delivery (agnostic binary data)."""
+    __slots__ = ('segment_idx', 'entropy', 'delivery_prob', 'replication', 'attempts', 'delivered')
+    
     segment_idx: int
     entropy: float
     delivery_prob: float
@@ -49,7 +112,9 @@ class ProbabilisticStream(STTStream):
         session_id: bytes,
         stream_id: int,
         stc_wrapper: 'STCWrapper',
-        segment_size: int = 16384
+        segment_size: int = 16384,
+        max_inflight: int = MAX_INFLIGHT_SEGMENTS,
+        min_send_timeout: float = MIN_SEND_TIMEOUT
     ):
         """
         Initialize probabilistic stream.
@@ -59,10 +124,13 @@ class ProbabilisticStream(STTStream):
             stream_id: Stream ID
             stc_wrapper: STC wrapper for crypto
             segment_size: Segment size for entropy calculation (16KB default)
+            max_inflight: Segments with a send in flight at once
+            min_send_timeout: Lower bound on the adaptive attempt timeout
         """
         super().__init__(session_id, stream_id, stc_wrapper)
         
         self.segment_size = segment_size
+        self.max_inflight = max(1, max_inflight)
         self.mode = 'probabilistic'
         
         # Delivery tracking
@@ -74,12 +142,31 @@ class ProbabilisticStream(STTStream):
         self.successful_deliveries = 0
         self.probabilistic_exits = 0
         
+        # Segment digest -> entropy, LRU-bounded (retransmitted content hits)
+        self._entropy_cache: OrderedDict = OrderedDict()
+        
+        # Entropy terms for full-size segments, shared by equal-size streams
+        self._entropy_terms = (
+            _entropy_terms(segment_size)
+            if 0 < segment_size <= LOG_TABLE_MAX_SEGMENT else None
+        )
+        
+        # Send latency tracker driving per-attempt timeouts
+        self._latency = _AdaptiveTimeout(min_timeout=min_send_timeout)
+        
+        # Timed-out sends still writing; referenced until they finish
+        self._background_sends: set = set()
+        
         logger.info(
             f"ProbabilisticStream created: session={session_id.hex()[:8]}, "
             f"stream={stream_id}, segment_size={segment_size}"
         )
     
-    def calculate_delivery_probability(self, chunk: bytes) -> float:
+    def calculate_delivery_probability(
+        self,
+        chunk: bytes,
+        entropy: Optional[float] = None
+    ) -> float:
         """
         Calculate required delivery probability (0.0-1.0).
         
@@ -88,26 +175,46 @@ class ProbabilisticStream(STTStream):
         
         Args:
             chunk: Data segment to analyze
+            entropy: Entropy of chunk if already known (skips the lookup)
             
         Returns:
             Target delivery probability
         """
-        # Calculate Shannon entropy
-        entropy = shannon_entropy(chunk)
-        
-        # Base probability from entropy ONLY (no external dependencies)
-        if entropy > 0.9:  # High information density
-            base_prob = 0.99
-        elif entropy > 0.75:
-            base_prob = 0.95
-        elif entropy > 0.6:
-            base_prob = 0.90
-        elif entropy > 0.3:
-            base_prob = 0.80
-        else:  # Low entropy (redundant data)
-            base_prob = 0.70
-        
-        return min(max(base_prob, 0.0), 1.0)
+        if entropy is None:
+            entropy = self._segment_entropy(chunk)
+        return _probability_for_entropy(entropy)
+    
+    def _segment_entropy(self, segment) -> float:
+        """
+        Shannon entropy of segment, memoized on content.
+        
+        Keyed by a BLAKE2b digest rather than stc_wrapper.hash_data(),
+        whose PHE output changes on every call. Accepts bytes or a
+        memoryview; a view is only copied on a cache miss.
+        """
+        key = hashlib.blake2b(segment, digest_size=16).digest()
+        cache = self._entropy_cache
+        entropy = cache.get(key)
+        if entropy is not None:
+            cache.move_to_end(key)
+            return entropy
+        
+        # Counter iterates bytes faster than a memoryview
+        data = bytes(segment)
+        terms = self._entropy_terms
+        if _is_single_byte(data):
+            entropy = 0.0
+        elif terms is not None and len(data) == self.segment_size:
+            # Full segment: table lookups replace 256 log2 calls
+            bits = sum([terms[count] for count in Counter(data).values()])
+            entropy = min(bits / len(data) / 8.0, 1.0)
+        else:
+            # Single-byte data was ruled out above; skip shannon_entropy's check
+            entropy = min(_histogram_and_entropy(data)[1] / 8.0, 1.0)
+        cache[key] = entropy
+        if len(cache) > ENTROPY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return entropy
     
     async def send_probabilistic(self, data: bytes) -> int:
         """
@@ -122,26 +229,53 @@ class ProbabilisticStream(STTStream):
         if not self.is_active:
             raise STTStreamError("Stream is closed")
         
-        # Split into segments
-        segments = self._segment_data(data)
-        self.total_segments += len(segments)
+        # Plan every segment's delivery parameters before the first await
+        plan = self._plan_segments(data)
+        segment_count = len(plan)
+        self.total_segments += segment_count
         
-        delivered_count = 0
+        # Early-exit draws for every possible attempt, fetched in one read
+        exit_draws = _exit_draws(sum(entry[3] for entry in plan))
         
-        for segment_idx, segment in enumerate(segments):
-            # Calculate delivery parameters (entropy-based only)
-            entropy = shannon_entropy(segment)
-            delivery_prob = self.calculate_delivery_probability(segment)
-            
-            # Calculate max attempts based on probability
-            # P(delivered after N attempts) = 1 - (1-p)^N
-            # Solve for N to achieve target probability
-            # Assume per-attempt success rate of 0.5 (50% packet loss scenario)
-            max_attempts = int(math.ceil(
-                math.log(1 - delivery_prob) / math.log(0.5)
-            ))
-            max_attempts = min(max(max_attempts, 1), 10)  # Clamp to [1, 10]
-            
+        # One shared iterator feeds a fixed pool of workers, so task count
+        # stays at max_inflight however many segments the data has
+        jobs = self._segment_jobs(plan, exit_draws)
+        workers = [
+            asyncio.ensure_future(self._delivery_worker(data, jobs))
+            for _ in range(min(self.max_inflight, segment_count))
+        ]
+        try:
+            results = await asyncio.gather(*workers)
+        except BaseException:
+            # One worker failed (or we were cancelled): stop the rest
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        delivered_count = sum(results)
+        
+        # Update statistics
+        self.bytes_sent += len(data)
+        self.messages_sent += 1
+        self.sequence += 1
+        self.last_activity = time.time()
+        
+        logger.info(
+            f"Probabilistic send complete: {delivered_count}/{segment_count} chunks, "
+            f"{len(data)} bytes"
+        )
+        
+        return delivered_count
+    
+    def _segment_jobs(
+        self,
+        plan: List[Tuple[int, float, float, int]],
+        exit_draws: List[float]
+    ) -> Iterator[Tuple[int, SegmentMetadata, List[float]]]:
+        """Yield (offset, metadata, draws) per planned segment, in order."""
+        draw_idx = 0
+        
+        for segment_idx, (offset, entropy, delivery_prob, max_attempts) in enumerate(plan):
             # Initialize metadata
             metadata = SegmentMetadata(
                 segment_idx=segment_idx,
@@ -153,45 +287,142 @@ class ProbabilisticStream(STTStream):
             )
             self.segment_metadata[segment_idx] = metadata
             
-            # Attempt delivery with adaptive retry
-            for attempt in range(max_attempts):
-                metadata.attempts += 1
-                
-                success = await self._try_send_segment(segment, segment_idx)
-                
-                if success:
-                    self.delivered_segments.add(segment_idx)
-                    metadata.delivered = True
-                    delivered_count += 1
-                    self.successful_deliveries += 1
-                    break
-                
-                # Probabilistic early exit (acceptable loss)
-                # Random decision: continue retrying or accept loss
-                if (secrets.randbelow(1000000) / 1000000.0) > delivery_prob:
-                    logger.debug(
-                        f"Probabilistic exit: segment {segment_idx}, "
-                        f"entropy={entropy:.3f}, prob={delivery_prob:.3f}, "
-                        f"attempts={attempt + 1}"
-                    )
-                    self.probabilistic_exits += 1
-                    break
-                
-                # Exponential backoff (1ms, 2ms, 4ms, ...)
-                await asyncio.sleep(0.001 * (2 ** attempt))
+            yield offset, metadata, exit_draws[draw_idx:draw_idx + max_attempts]
+            draw_idx += max_attempts
+    
+    async def _delivery_worker(
+        self,
+        data: bytes,
+        jobs: Iterator[Tuple[int, SegmentMetadata, List[float]]]
+    ) -> int:
+        """
+        Deliver segments pulled from the shared job iterator until it ends.
         
-        # Update statistics
-        self.bytes_sent += len(data)
-        self.messages_sent += 1
-        self.sequence += 1
-        self.last_activity = time.time()
+        Segments are independent; each decides its own retries and exit.
+        The iterator never awaits, so workers cannot interleave inside it.
         
-        logger.info(
-            f"Probabilistic send complete: {delivered_count}/{len(segments)} chunks, "
-            f"{len(data)} bytes"
-        )
+        Returns:
+            Number of segments this worker delivered
+        """
+        delivered = 0
+        for offset, metadata, draws in jobs:
+            # Sliced when picked up, so at most max_inflight segments are
+            # copied out of data at a time
+            segment = data[offset:offset + self.segment_size]
+            if await self._deliver_segment(segment, metadata, draws):
+                delivered += 1
+        return delivered
+    
+    async def _deliver_segment(
+        self,
+        segment: bytes,
+        metadata: SegmentMetadata,
+        draws: List[float]
+    ) -> bool:
+        """
+        Attempt delivery with adaptive retry and probabilistic early exit.
         
-        return delivered_count
+        Args:
+            segment: Segment data
+            metadata: Segment metadata, updated in place
+            draws: One early-exit draw per allowed attempt
+            
+        Returns:
+            True if the segment was delivered
+        """
+        segment_idx = metadata.segment_idx
+        delivery_prob = metadata.delivery_prob
+        
+        for attempt in range(len(draws)):
+            metadata.attempts += 1
+            
+            success = await self._send_with_timeout(segment, segment_idx, attempt)
+            
+            if success:
+                self.delivered_segments.add(segment_idx)
+                metadata.delivered = True
+                self.successful_deliveries += 1
+                return True
+            
+            # Probabilistic early exit (acceptable loss)
+            # Random decision: continue retrying or accept loss
+            if draws[attempt] > delivery_prob:
+                logger.debug(
+                    f"Probabilistic exit: segment {segment_idx}, "
+                    f"entropy={metadata.entropy:.3f}, prob={delivery_prob:.3f}, "
+                    f"attempts={attempt + 1}"
+                )
+                self.probabilistic_exits += 1
+                return False
+            
+            # Exponential backoff (1ms, 2ms, 4ms, ...)
+            await asyncio.sleep(0.001 * (2 ** attempt))
+        
+        return False
+    
+    def _plan_segments(self, data: bytes) -> List[Tuple[int, float, float, int]]:
+        """
+        Compute delivery parameters for every segment of data.
+        
+        Args:
+            data: Data to send
+            
+        Returns:
+            List of (offset, entropy, delivery_prob, max_attempts) per segment
+        """
+        segment_size = self.segment_size
+        view = memoryview(data)
+        plan = []
+        
+        for offset in range(0, len(data), segment_size):
+            # The digest reads the view in place, so cached segments are
+            # never copied; the hook reuses the entropy instead of hashing
+            # the segment again
+            segment = view[offset:offset + segment_size]
+            entropy = self._segment_entropy(segment)
+            delivery_prob = self.calculate_delivery_probability(segment, entropy)
+            max_attempts = _MAX_ATTEMPTS.get(delivery_prob) or _max_attempts_for(delivery_prob)
+            plan.append((offset, entropy, delivery_prob, max_attempts))
+        
+        return plan
+    
+    async def _send_with_timeout(self, segment: bytes, segment_idx: int, attempt: int) -> bool:
+        """
+        Run one send attempt bounded by the adaptive timeout.
+        
+        A timed-out attempt counts as a failed attempt. Its latency is
+        recorded as the applied timeout (a lower bound on the real one), so
+        losses push p99 up instead of leaving only the fast sends sampled.
+        
+        The send itself is shielded: a timeout (or cancellation of the
+        caller) stops waiting for it but never interrupts a write midway,
+        which could leave a partial segment on the wire.
+        """
+        timeout = self._latency.select(attempt)
+        started = time.monotonic()
+        send = asyncio.ensure_future(self._try_send_segment(segment, segment_idx))
+        try:
+            success = await asyncio.wait_for(asyncio.shield(send), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._latency.record(timeout)
+            self._finish_in_background(send)
+            return False
+        except asyncio.CancelledError:
+            self._finish_in_background(send)
+            raise
+        
+        self._latency.record(time.monotonic() - started)
+        return success
+    
+    def _finish_in_background(self, send: asyncio.Future) -> None:
+        """Keep an abandoned send referenced until its write completes."""
+        self._background_sends.add(send)
+        send.add_done_callback(self._background_send_done)
+    
+    def _background_send_done(self, send: asyncio.Future) -> None:
+        self._background_sends.discard(send)
+        if not send.cancelled() and send.exception() is not None:
+            logger.debug(f"Abandoned segment send failed: {send.exception()}")
     
     async def _try_send_segment(self, segment: bytes, segment_idx: int) -> bool:
         """
@@ -223,15 +454,11 @@ class ProbabilisticStream(STTStream):
         Returns:
             List of segments
         """
-        segments = []
-        offset = 0
-        
-        while offset < len(data):
-            segment = data[offset:offset + self.segment_size]
-            segments.append(segment)
-            offset += self.segment_size
-        
-        return segments
+        segment_size = self.segment_size
+        return [
+            data[offset:offset + segment_size]
+            for offset in range(0, len(data), segment_size)
+        ]
     
     def get_delivery_stats(self) -> dict:
         """
@@ -272,6 +499,96 @@ class ProbabilisticStream(STTStream):
         ]
 
 
+def _exit_draws(count: int) -> List[float]:
+    """
+    Uniform [0, 1) draws for probabilistic early exit.
+    
+    All draws for a send come from a single CSPRNG read (32 bits each)
+    instead of one secrets.randbelow() call per failed attempt.
+    """
+    if count <= 0:
+        return []
+    words = struct.unpack(f"<{count}I", secrets.token_bytes(4 * count))
+    return [word / 4294967296.0 for word in words]
+
+
+def _max_attempts_for(delivery_prob: float) -> int:
+    """
+    Retry budget reaching delivery_prob at 50% per-attempt loss.
+    
+    P(delivered after N attempts) = 1 - (1-p)^N, solved for N and
+    clamped to [1, 10].
+    """
+    max_attempts = int(math.ceil(math.log(1 - delivery_prob) / math.log(0.5)))
+    return min(max(max_attempts, 1), 10)
+
+
+def _probability_for_entropy(entropy: float) -> float:
+    """Map normalized entropy to target delivery probability."""
+    # Base probability from entropy ONLY (no external dependencies)
+    if entropy > 0.9:  # High information density
+        base_prob = 0.99
+    elif entropy > 0.75:
+        base_prob = 0.95
+    elif entropy > 0.6:
+        base_prob = 0.90
+    elif entropy > 0.3:
+        base_prob = 0.80
+    else:  # Low entropy (redundant data)
+        base_prob = 0.70
+    
+    return min(max(base_prob, 0.0), 1.0)
+
+
+@lru_cache(maxsize=8)
+def _entropy_terms(length: int) -> List[float]:
+    """
+    Per-count entropy terms -c * log2(c / length) for c in [0, length].
+    
+    Summing terms over a histogram of exactly length bytes gives the
+    entropy in bits times length.
+    """
+    return [0.0] + [-count * math.log2(count / length) for count in range(1, length + 1)]
+
+
+# Retry budget per delivery probability band (the bands are fixed)
+_MAX_ATTEMPTS = {
+    prob: _max_attempts_for(prob)
+    for prob in (0.99, 0.95, 0.90, 0.80, 0.70)
+}
+
+
+def _histogram_and_entropy(data: bytes) -> Tuple[Counter, float]:
+    """
+    One pass over data: byte histogram plus entropy in bits.
+    
+    Shared by shannon_entropy() and calculate_entropy_stats() so neither
+    re-scans the input. Caller guarantees data is non-empty.
+    """
+    # Count byte frequencies (Counter tallies in C, no per-byte dict.get).
+    # A local [0]*256 list histogram was measured too: it only ties Counter
+    # at >=4 KB and loses below that, so there is no small-segment path.
+    freq = Counter(data)
+    
+    # Calculate entropy
+    length = len(data)
+    entropy = 0.0
+    
+    for count in freq.values():
+        p = count / length
+        entropy -= p * math.log2(p)
+    
+    return freq, entropy
+
+
+def _is_single_byte(data: bytes) -> bool:
+    """True when data is one byte value repeated (padding, zero-fill)."""
+    if not isinstance(data, (bytes, bytearray)):
+        # memoryview has no count(); copy once to get the C scan
+        data = bytes(data)
+    return data.count(data[:1]) == len(data)
+
+
 def shannon_entropy(data: bytes) -> float:
     """
     Calculate Shannon entropy H(X) = -Σ p(x) log₂ p(x)
@@ -286,22 +603,10 @@ def shannon_entropy(data: bytes) -> float:
     Returns:
         Normalized entropy (0.0-1.0)
     """
-    if not data:
+    if not data or _is_single_byte(data):
         return 0.0
     
-    # Count byte frequencies
-    freq: dict[int, int] = {}
-    for byte in data:
-        freq[byte] = freq.get(byte, 0) + 1
-    
-    # Calculate entropy
-    length = len(data)
-    entropy = 0.0
-    
-    for count in freq.values():
-        if count > 0:
-            p = count / length
-            entropy -= p * math.log2(p)
+    _freq, entropy = _histogram_and_entropy(data)
     
     # Normalize to 0-1 range
     # Maximum entropy for 256 symbols = log₂(256) = 8 bits
@@ -328,22 +633,10 @@ def calculate_entropy_stats(data: bytes) -> dict:
             'most_common_count': 0,
         }
     
-    # Count frequencies
-    freq: dict[int, int] = {}
-    for byte in data:
-        freq[byte] = freq.get(byte, 0) + 1
+    freq, entropy = _histogram_and_entropy(data)
     
     # Find most common
-    most_common_byte, most_common_count = max(freq.items(), key=lambda x: x[1])
-    
-    # Calculate entropy
-    length = len(data)
-    entropy = 0.0
-    
-    for count in freq.values():
-        if count > 0:
-            p = count / length
-            entropy -= p * math.log2(p)
+    most_common_byte, most_common_count = freq.most_common(1)[0]
     
     return {
         'entropy': min(entropy / 8.0, 1.0),
@@ -351,5 +644,5 @@ def calculate_entropy_stats(data: bytes) -> dict:
         'unique_bytes': len(freq),
         'most_common_byte': most_common_byte,
         'most_common_count': most_common_count,
-        'most_common_ratio': most_common_count / length,
+        'most_common_ratio': most_common_count / len(data),
     }
@@ -66,12 +66,17 @@ class STTStream:
         # Async support
         self._receive_event = asyncio.Event()
         
-        # Create StreamingContext for this stream (cached in stc_wrapper)
-        self._stc_context = stc_wrapper.create_stream_context(session_id, stream_id)
+        # StreamingContext is derived on first use (cached in stc_wrapper);
+        # streams that never touch crypto skip the key derivation
+        self._stc_context = None
     
     @property
     def stc_context(self):
-        """Get StreamingContext for this stream (for test compatibility)."""
+        """Get StreamingContext for this stream, creating it on first access."""
+        if self._stc_context is None:
+            self._stc_context = self.stc_wrapper.create_stream_context(
+                self.session_id, self.stream_id
+            )
         return self._stc_context
     
     async def send(self, data: bytes, session: Optional['STTSession'] = None) -> None:
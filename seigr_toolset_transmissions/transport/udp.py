@@ -8,7 +8,7 @@ DTLS-style encryption via STC.
 import asyncio
 import socket
 import time
-from typing import Optional, Callable, Tuple, Dict, Any, TYPE_CHECKING
+from typing import Optional, Callable, Tuple, Dict, Any, Iterable, TYPE_CHECKING
 from dataclasses import dataclass
 
 from ..frame import STTFrame
@@ -190,6 +190,59 @@ class UDPTransport:
             self.errors_send += 1
             raise STTTransportError(f"Failed to send frame: {e}")
     
+    async def send_frames(
+        self,
+        frames: Iterable[STTFrame],
+        peer_addr: Tuple[str, int]
+    ) -> int:
+        """
+        Send a batch of frames to one peer via UDP.
+        
+        All frames are serialized before the first datagram is queued,
+        then handed to the transport back to back; statistics are
+        updated once for the whole batch.
+        
+        Args:
+            frames: Frames to send, in order
+            peer_addr: Peer address (ip, port)
+            
+        Returns:
+            Number of datagrams sent
+            
+        Raises:
+            STTTransportError: If send fails
+        """
+        if not self.running:
+            raise STTTransportError("Transport not running")
+        
+        sent = 0
+        sent_bytes = 0
+        try:
+            datagrams = [frame.to_bytes() for frame in frames]
+            
+            max_packet_size = self.config.max_packet_size
+            sendto = self.transport.sendto
+            for datagram in datagrams:
+                if len(datagram) > max_packet_size:
+                    logger.warning(
+                        f"Frame size {len(datagram)} exceeds max packet size "
+                        f"{max_packet_size}, may fragment"
+                    )
+                sendto(datagram, peer_addr)
+                sent += 1
+                sent_bytes += len(datagram)
+            
+            logger.debug(f"Sent {sent} frames ({sent_bytes} bytes) to {peer_addr[0]}:{peer_addr[1]}")
+            return sent
+            
+        except Exception as e:
+            self.errors_send += 1
+            raise STTTransportError(f"Failed to send frames: {e}")
+        
+        finally:
+            self.bytes_sent += sent_bytes
+            self.packets_sent += sent
+    
     async def send_raw(
         self,
         data: bytes,
@@ -11,7 +11,7 @@ import hashlib
 import secrets
 import struct
 import time
-from typing import Optional, Callable, Dict, Any, Tuple, Union
+from typing import Optional, Callable, Dict, Any, Iterable, Tuple, Union
 from enum import IntEnum
 from dataclasses import dataclass
 
@@ -57,6 +57,19 @@ class WebSocketState(IntEnum):
 WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
 
 
+def _apply_mask(data: bytes, mask: bytes) -> bytes:
+    """
+    XOR data with a repeating 4-byte WebSocket mask (RFC 6455 5.3).
+    
+    Masking and unmasking are the same operation. The XOR runs on
+    whole integers so CPython does it in C instead of per byte.
+    """
+    length = len(data)
+    words, extra = divmod(length, 4)
+    key = int.from_bytes(mask * words + mask[:extra], "little")
+    return (int.from_bytes(data, "little") ^ key).to_bytes(length, "little")
+
+
 class WebSocketTransport:
     """
     Native WebSocket transport (RFC 6455).
@@ -312,19 +325,42 @@ class WebSocketTransport:
         Raises:
             STTTransportError: If frame too large or transport error
         """
+        frame_data = self._build_ws_frame(opcode, payload)
+        
+        # Send frame
+        self.writer.write(frame_data)
+        await self.writer.drain()
+        
+        # Update statistics
+        self.bytes_sent += len(frame_data)
+        self.frames_sent += 1
+        
+        # Track ping timing
+        if opcode == WebSocketOpcode.PING:
+            self.last_ping_sent = time.time()
+    
+    def _build_ws_frame(self, opcode: WebSocketOpcode, payload: bytes) -> bytes:
+        """
+        Encode a single WebSocket frame (header, mask and payload).
+        
+        Args:
+            opcode: Frame opcode
+            payload: Frame payload
+            
+        Returns:
+            Complete frame bytes, masked if this end is a client
+            
+        Raises:
+            STTTransportError: If frame too large
+        """
         # Validate frame size
         if len(payload) > self.config.max_frame_size:
             raise STTTransportError(
                 f"Frame size {len(payload)} exceeds max {self.config.max_frame_size}"
             )
         
-        # Build WebSocket frame header
-        header = bytearray()
-        
-        # Byte 0: FIN + opcode
-        header.append(0x80 | opcode)
-        
-        # Byte 1: MASK + payload length
+        # Byte 0: FIN + opcode, byte 1: MASK + payload length
+        first_byte = 0x80 | opcode
         payload_len = len(payload)
         
         if self.is_client:
@@ -332,39 +368,23 @@ class WebSocketTransport:
         else:
             mask_bit = 0x00
         
+        # Build WebSocket frame header in one pack
         if payload_len < 126:
-            header.append(mask_bit | payload_len)
+            header = struct.pack("!BB", first_byte, mask_bit | payload_len)
         elif payload_len < 65536:
-            header.append(mask_bit | 126)
-            header.extend(struct.pack("!H", payload_len))
+            header = struct.pack("!BBH", first_byte, mask_bit | 126, payload_len)
         else:
-            header.append(mask_bit | 127)
-            header.extend(struct.pack("!Q", payload_len))
+            header = struct.pack("!BBQ", first_byte, mask_bit | 127, payload_len)
         
         # Masking (required for client)
         if self.is_client:
             mask = secrets.token_bytes(4)
-            header.extend(mask)
+            header += mask
             
-            # Mask payload
-            masked_payload = bytearray(payload)
-            for i in range(len(masked_payload)):
-                masked_payload[i] ^= mask[i % 4]
-            
-            payload = bytes(masked_payload)
-        
-        # Send frame
-        frame_data = header + payload
-        self.writer.write(frame_data)
-        await self.writer.drain()
+            payload = _apply_mask(payload, mask)
         
-        # Update statistics
-        self.bytes_sent += len(frame_data)
-        self.frames_sent += 1
-        
-        # Track ping timing
-        if opcode == WebSocketOpcode.PING:
-            self.last_ping_sent = time.time()
+        # Header and payload joined with one copy
+        return header + payload
     
     async def receive_frames(self) -> None:
         """
@@ -472,10 +492,7 @@ class WebSocketTransport:
         
         # Unmask if needed
         if masked:
-            unmasked = bytearray(payload)
-            for i in range(len(unmasked)):
-                unmasked[i] ^= mask[i % 4]
-            payload = bytes(unmasked)
+            payload = _apply_mask(payload, mask)
         
         # Update statistics
         self.bytes_received += 2 + (2 if payload_len >= 126 else 0) + (8 if payload_len >= 65536 else 0) + (4 if masked else 0) + len(payload)
@@ -630,6 +647,42 @@ class WebSocketTransport:
             raise STTTransportError("WebSocket not connected")
         await self._send_ws_frame(WebSocketOpcode.BINARY, data)
     
+    async def send_many(self, messages: Iterable[bytes]) -> int:
+        """
+        Send several binary messages with a single write.
+        
+        Each message becomes its own WebSocket frame; the frames are
+        coalesced into one buffer so the stream is written and drained
+        once instead of once per message.
+        
+        Args:
+            messages: Raw messages to send, in order
+            
+        Returns:
+            Number of frames sent
+            
+        Raises:
+            STTTransportError: If not connected or a message is too large
+        """
+        if self.state != WebSocketState.OPEN:
+            raise STTTransportError("WebSocket not connected")
+        
+        # Encode every frame before writing so an oversized message
+        # fails the whole batch instead of leaving it half-sent
+        frames = [self._build_ws_frame(WebSocketOpcode.BINARY, data) for data in messages]
+        if not frames:
+            return 0
+        
+        batch = b"".join(frames)
+        self.writer.write(batch)
+        await self.writer.drain()
+        
+        # Update statistics
+        self.bytes_sent += len(batch)
+        self.frames_sent += len(frames)
+        
+        return len(frames)
+    
     async def ping(self, payload: bytes = b"") -> None:
         """
         Send WebSocket ping frame.
@@ -5,7 +5,7 @@ Self-sovereign binary encoding using STC's TLV (Type-Length-Value) format.
 Replaces JSON, msgpack, and other third-party serialization.
 """
 
-from typing import Any
+from typing import Any, Optional
 from enum import IntEnum
 import struct
 
@@ -15,6 +15,38 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Precompiled tag+value layouts (format parsed once at import, not per call)
+_TAG = struct.Struct("!B")
+_TAG_INT8 = struct.Struct("!Bb")
+_TAG_INT16 = struct.Struct("!Bh")
+_TAG_INT32 = struct.Struct("!Bi")
+_TAG_INT64 = struct.Struct("!Bq")
+_TAG_FLOAT64 = struct.Struct("!Bd")
+_TAG_LENGTH = struct.Struct("!BI")
+
+_INT8 = struct.Struct("!b")
+_INT16 = struct.Struct("!h")
+_INT32 = struct.Struct("!i")
+_INT64 = struct.Struct("!q")
+_FLOAT64 = struct.Struct("!d")
+_LENGTH = struct.Struct("!I")
+_WIDTH_LENGTH = struct.Struct("!BI")
+
+# With typed_arrays=True, homogeneous int/float lists at least this long
+# are packed as INT_ARRAY / FLOAT64_ARRAY
+TYPED_ARRAY_MIN_LENGTH = 16
+
+# Deserializer stack marker: dict frame is waiting for its next key
+_EXPECT_KEY = object()
+
+
+class _CloseContainer:
+    """Serializer stack marker: every child of container `key` is written."""
+    __slots__ = ('key',)
+    
+    def __init__(self, key: int):
+        self.key = key
+
 
 class STTType(IntEnum):
     """STT data type tags."""
@@ -35,6 +67,17 @@ class STTType(IntEnum):
     STRING = 0x31
     LIST = 0x40
     DICT = 0x41
+    INT_ARRAY = 0x42
+    FLOAT64_ARRAY = 0x43
+
+
+# Element layout per INT_ARRAY width tag
+_INT_ARRAY_CODES = {
+    STTType.INT8: 'b',
+    STTType.INT16: 'h',
+    STTType.INT32: 'i',
+    STTType.INT64: 'q',
+}
 
 
 class STTSerializer:
@@ -46,12 +89,22 @@ class STTSerializer:
     """
     
     @staticmethod
-    def serialize(value: Any) -> bytes:
+    def serialize(value: Any, typed_arrays: bool = False) -> bytes:
         """
         Serialize Python value to STT binary format.
         
+        Containers are walked with an explicit stack, so nesting depth is
+        not bounded by the interpreter recursion limit. Each item is
+        dispatched on its exact type through _WRITERS. A list or dict that
+        contains itself (directly or through its children) is rejected;
+        the same container shared by siblings is fine.
+        
+        Typed arrays are opt-in: peers that predate INT_ARRAY and
+        FLOAT64_ARRAY cannot decode them. deserialize() always accepts them.
+        
         Args:
             value: Value to serialize
+            typed_arrays: Pack long all-int/all-float lists as typed arrays
             
         Returns:
             Serialized bytes
@@ -59,32 +112,32 @@ class STTSerializer:
         Raises:
             STTSerializationError: If value cannot be serialized
         """
-        if value is None:
-            return bytes([STTType.NULL])
-        
-        elif isinstance(value, bool):
-            return bytes([STTType.BOOL_TRUE if value else STTType.BOOL_FALSE])
+        writers = _TYPED_WRITERS if typed_arrays else _WRITERS
+        parts = []
+        pending = [value]
+        # ids of lists/dicts whose children are still being written
+        open_containers = set()
         
-        elif isinstance(value, int):
-            return STTSerializer._serialize_int(value)
-        
-        elif isinstance(value, float):
-            return STTSerializer._serialize_float(value)
-        
-        elif isinstance(value, bytes):
-            return STTSerializer._serialize_bytes(value)
-        
-        elif isinstance(value, str):
-            return STTSerializer._serialize_string(value)
-        
-        elif isinstance(value, list):
-            return STTSerializer._serialize_list(value)
-        
-        elif isinstance(value, dict):
-            return STTSerializer._serialize_dict(value)
+        while pending:
+            item = pending.pop()
+            if type(item) is _CloseContainer:
+                open_containers.discard(item.key)
+                continue
+            
+            # Exact type hits the table; subclasses resolve through their MRO
+            writer = writers.get(type(item)) or _writer_for(type(item), writers)
+            
+            if isinstance(item, (list, dict)):
+                key = id(item)
+                if key in open_containers:
+                    raise STTSerializationError("Cannot serialize recursive container")
+                open_containers.add(key)
+                # Pushed below the children, so it pops once they are all written
+                pending.append(_CloseContainer(key))
+            
+            writer(item, parts, pending)
         
-        else:
-            raise STTSerializationError(f"Cannot serialize type {type(value)}")
+        return b''.join(parts)
     
     @staticmethod
     def deserialize(data: bytes) -> Any:
@@ -110,55 +163,61 @@ class STTSerializer:
     def _serialize_int(value: int) -> bytes:
         """Serialize integer with minimal size."""
         if -128 <= value < 128:
-            return bytes([STTType.INT8]) + struct.pack("!b", value)
+            return _TAG_INT8.pack(STTType.INT8, value)
         elif -32768 <= value < 32768:
-            return bytes([STTType.INT16]) + struct.pack("!h", value)
+            return _TAG_INT16.pack(STTType.INT16, value)
         elif -2147483648 <= value < 2147483648:
-            return bytes([STTType.INT32]) + struct.pack("!i", value)
+            return _TAG_INT32.pack(STTType.INT32, value)
         else:
-            return bytes([STTType.INT64]) + struct.pack("!q", value)
+            return _TAG_INT64.pack(STTType.INT64, value)
     
     @staticmethod
     def _serialize_float(value: float) -> bytes:
         """Serialize float as 64-bit."""
-        return bytes([STTType.FLOAT64]) + struct.pack("!d", value)
+        return _TAG_FLOAT64.pack(STTType.FLOAT64, value)
     
     @staticmethod
     def _serialize_bytes(value: bytes) -> bytes:
         """Serialize bytes with length prefix."""
-        length = len(value)
-        return bytes([STTType.BYTES]) + struct.pack("!I", length) + value
+        return _TAG_LENGTH.pack(STTType.BYTES, len(value)) + value
     
     @staticmethod
     def _serialize_string(value: str) -> bytes:
         """Serialize string as UTF-8 bytes."""
         utf8_bytes = value.encode('utf-8')
-        length = len(utf8_bytes)
-        return bytes([STTType.STRING]) + struct.pack("!I", length) + utf8_bytes
-    
-    @staticmethod
-    def _serialize_list(value: list) -> bytes:
-        """Serialize list with element count."""
-        result = bytes([STTType.LIST]) + struct.pack("!I", len(value))
-        for item in value:
-            result += STTSerializer.serialize(item)
-        return result
+        return _TAG_LENGTH.pack(STTType.STRING, len(utf8_bytes)) + utf8_bytes
     
     @staticmethod
-    def _serialize_dict(value: dict) -> bytes:
-        """Serialize dict with key-value pairs."""
-        result = bytes([STTType.DICT]) + struct.pack("!I", len(value))
+    def _serialize_typed_array(value: list) -> Optional[bytes]:
+        """
+        Pack an all-int or all-float list in one struct call.
         
-        # Sort keys for deterministic encoding
-        for key in sorted(value.keys()):
-            # Key must be string
-            if not isinstance(key, str):
-                raise STTSerializationError("Dict keys must be strings")
-            
-            result += STTSerializer._serialize_string(key)
-            result += STTSerializer.serialize(value[key])
+        Ints use the narrowest width holding both min and max. Returns None
+        when the list is mixed (bool counts as mixed) or out of int64 range.
+        """
+        element_types = set(map(type, value))
+        count = len(value)
         
-        return result
+        if element_types == {int}:
+            low, high = min(value), max(value)
+            if -128 <= low and high < 128:
+                width = STTType.INT8
+            elif -32768 <= low and high < 32768:
+                width = STTType.INT16
+            elif -2147483648 <= low and high < 2147483648:
+                width = STTType.INT32
+            elif -(1 << 63) <= low and high < (1 << 63):
+                width = STTType.INT64
+            else:
+                return None
+            header = _TAG.pack(STTType.INT_ARRAY) + _WIDTH_LENGTH.pack(width, count)
+            return header + struct.pack(f"!{count}{_INT_ARRAY_CODES[width]}", *value)
+        
+        if element_types == {float}:
+            header = _TAG_LENGTH.pack(STTType.FLOAT64_ARRAY, count)
+            return header + struct.pack(f"!{count}d", *value)
+        
+        return None
     
     @staticmethod
     def _deserialize_value(data: bytes, offset: int) -> tuple[Any, int]:
@@ -172,83 +231,226 @@ class STTSerializer:
         Returns:
             Tuple of (value, new_offset)
         """
-        if offset >= len(data):
-            raise STTSerializationError("Unexpected end of data")
-        
-        type_tag = data[offset]
-        offset += 1
-        
-        if type_tag == STTType.NULL:
-            return None, offset
-        
-        elif type_tag == STTType.BOOL_FALSE:
-            return False, offset
-        
-        elif type_tag == STTType.BOOL_TRUE:
-            return True, offset
-        
-        elif type_tag == STTType.INT8:
-            value = struct.unpack("!b", data[offset:offset+1])[0]
-            return value, offset + 1
-        
-        elif type_tag == STTType.INT16:
-            value = struct.unpack("!h", data[offset:offset+2])[0]
-            return value, offset + 2
-        
-        elif type_tag == STTType.INT32:
-            value = struct.unpack("!i", data[offset:offset+4])[0]
-            return value, offset + 4
-        
-        elif type_tag == STTType.INT64:
-            value = struct.unpack("!q", data[offset:offset+8])[0]
-            return value, offset + 8
-        
-        elif type_tag == STTType.FLOAT64:
-            value = struct.unpack("!d", data[offset:offset+8])[0]
-            return value, offset + 8
-        
-        elif type_tag == STTType.BYTES:
-            length = struct.unpack("!I", data[offset:offset+4])[0]
-            offset += 4
-            value = data[offset:offset+length]
-            return bytes(value), offset + length
-        
-        elif type_tag == STTType.STRING:
-            length = struct.unpack("!I", data[offset:offset+4])[0]
-            offset += 4
-            value = data[offset:offset+length].decode('utf-8')
-            return value, offset + length
+        try:
+            return STTSerializer._deserialize_iterative(data, offset)
+        except struct.error as e:
+            raise STTSerializationError(f"Truncated data: {e}") from e
+    
+    @staticmethod
+    def _deserialize_iterative(data: bytes, offset: int) -> tuple[Any, int]:
+        """
+        Decode one value without recursion.
         
-        elif type_tag == STTType.LIST:
-            count = struct.unpack("!I", data[offset:offset+4])[0]
-            offset += 4
-            result = []
-            for _ in range(count):
-                item, offset = STTSerializer._deserialize_value(data, offset)
-                result.append(item)
-            return result, offset
+        Open containers live on an explicit stack of [container, remaining,
+        key] frames; key is None for lists and _EXPECT_KEY while a dict
+        frame waits for its next key.
+        """
+        stack = []
+        data_len = len(data)
+        # Payloads are cut from a view: one copy for bytes, none before decode
+        view = memoryview(data)
         
-        elif type_tag == STTType.DICT:
-            count = struct.unpack("!I", data[offset:offset+4])[0]
-            offset += 4
-            result = {}
-            for _ in range(count):
-                # Read key (must be string)
-                key, offset = STTSerializer._deserialize_value(data, offset)
-                if not isinstance(key, str):
-                    raise STTSerializationError("Dict key must be string")
-                
-                # Read value
-                value, offset = STTSerializer._deserialize_value(data, offset)
-                result[key] = value
+        while True:
+            if offset >= data_len:
+                raise STTSerializationError("Unexpected end of data")
             
-            return result, offset
-        
-        else:
-            raise STTSerializationError(f"Unknown type tag: {type_tag}")
+            type_tag = data[offset]
+            offset += 1
+            
+            if type_tag == STTType.NULL:
+                value = None
+            
+            elif type_tag == STTType.BOOL_FALSE:
+                value = False
+            
+            elif type_tag == STTType.BOOL_TRUE:
+                value = True
+            
+            elif type_tag == STTType.INT8:
+                value = _INT8.unpack_from(data, offset)[0]
+                offset += 1
+            
+            elif type_tag == STTType.INT16:
+                value = _INT16.unpack_from(data, offset)[0]
+                offset += 2
+            
+            elif type_tag == STTType.INT32:
+                value = _INT32.unpack_from(data, offset)[0]
+                offset += 4
+            
+            elif type_tag == STTType.INT64:
+                value = _INT64.unpack_from(data, offset)[0]
+                offset += 8
+            
+            elif type_tag == STTType.FLOAT64:
+                value = _FLOAT64.unpack_from(data, offset)[0]
+                offset += 8
+            
+            elif type_tag == STTType.BYTES:
+                length = _LENGTH.unpack_from(data, offset)[0]
+                offset += 4
+                value = bytes(view[offset:offset+length])
+                offset += length
+            
+            elif type_tag == STTType.STRING:
+                length = _LENGTH.unpack_from(data, offset)[0]
+                offset += 4
+                value = str(view[offset:offset+length], 'utf-8')
+                offset += length
+            
+            elif type_tag == STTType.LIST:
+                count = _LENGTH.unpack_from(data, offset)[0]
+                offset += 4
+                if count:
+                    stack.append([[], count, None])
+                    continue
+                value = []
+            
+            elif type_tag == STTType.DICT:
+                count = _LENGTH.unpack_from(data, offset)[0]
+                offset += 4
+                if count:
+                    stack.append([{}, count, _EXPECT_KEY])
+                    continue
+                value = {}
+            
+            elif type_tag == STTType.INT_ARRAY:
+                width, count = _WIDTH_LENGTH.unpack_from(data, offset)
+                offset += 5
+                code = _INT_ARRAY_CODES.get(width)
+                if code is None:
+                    raise STTSerializationError(f"Invalid int array width: {width}")
+                layout = struct.Struct(f"!{count}{code}")
+                value = list(layout.unpack_from(data, offset))
+                offset += layout.size
+            
+            elif type_tag == STTType.FLOAT64_ARRAY:
+                count = _LENGTH.unpack_from(data, offset)[0]
+                offset += 4
+                layout = struct.Struct(f"!{count}d")
+                value = list(layout.unpack_from(data, offset))
+                offset += layout.size
+            
+            else:
+                raise STTSerializationError(f"Unknown type tag: {type_tag}")
+            
+            # Attach the finished value, closing every container it completes
+            while stack:
+                frame = stack[-1]
+                container = frame[0]
+                
+                if frame[2] is None:
+                    container.append(value)
+                elif frame[2] is _EXPECT_KEY:
+                    if not isinstance(value, str):
+                        raise STTSerializationError("Dict key must be string")
+                    frame[2] = value
+                    break
+                else:
+                    container[frame[2]] = value
+                    frame[2] = _EXPECT_KEY
+                
+                frame[1] -= 1
+                if frame[1]:
+                    break
+                
+                stack.pop()
+                value = container
+            else:
+                return value, offset
+
+
+def _write_none(item: None, parts: list, pending: list) -> None:
+    parts.append(_TAG.pack(STTType.NULL))
+
+
+def _write_bool(item: bool, parts: list, pending: list) -> None:
+    parts.append(_TAG.pack(STTType.BOOL_TRUE if item else STTType.BOOL_FALSE))
+
+
+def _write_int(item: int, parts: list, pending: list) -> None:
+    parts.append(STTSerializer._serialize_int(item))
+
+
+def _write_float(item: float, parts: list, pending: list) -> None:
+    parts.append(STTSerializer._serialize_float(item))
+
+
+def _write_bytes(item: bytes, parts: list, pending: list) -> None:
+    # Header and payload stay separate parts: the final join is the only
+    # copy of the payload
+    parts.append(_TAG_LENGTH.pack(STTType.BYTES, len(item)))
+    parts.append(item)
+
+
+def _write_string(item: str, parts: list, pending: list) -> None:
+    utf8_bytes = item.encode('utf-8')
+    parts.append(_TAG_LENGTH.pack(STTType.STRING, len(utf8_bytes)))
+    parts.append(utf8_bytes)
+
+
+def _write_list(item: list, parts: list, pending: list) -> None:
+    parts.append(_TAG_LENGTH.pack(STTType.LIST, len(item)))
+    # LIFO: push reversed so elements pop in order
+    pending.extend(reversed(item))
+
+
+def _write_list_typed(item: list, parts: list, pending: list) -> None:
+    if len(item) >= TYPED_ARRAY_MIN_LENGTH:
+        packed = STTSerializer._serialize_typed_array(item)
+        if packed is not None:
+            parts.append(packed)
+            return
+    _write_list(item, parts, pending)
+
+
+def _write_dict(item: dict, parts: list, pending: list) -> None:
+    # Sort keys for deterministic encoding
+    keys = sorted(item.keys())
+    for key in keys:
+        # Key must be string
+        if not isinstance(key, str):
+            raise STTSerializationError("Dict keys must be strings")
+    
+    parts.append(_TAG_LENGTH.pack(STTType.DICT, len(item)))
+    # LIFO: push (value, key) pairs reversed so key0, value0, ... pop in order
+    for key in reversed(keys):
+        pending.append(item[key])
+        pending.append(key)
+
+
+# Writer per exact type; bool gets its own entry so True never encodes as int
+_WRITERS = {
+    type(None): _write_none,
+    bool: _write_bool,
+    int: _write_int,
+    float: _write_float,
+    bytes: _write_bytes,
+    str: _write_string,
+    list: _write_list,
+    dict: _write_dict,
+}
+
+# Writer table for serialize(typed_arrays=True)
+_TYPED_WRITERS = {**_WRITERS, list: _write_list_typed}
+
+
+def _writer_for(cls: type, writers: dict):
+    """
+    Resolve the writer for a subclass (IntEnum, OrderedDict, ...).
+    
+    Walks the MRO so the nearest supported base wins, then caches the
+    result so later values of the same type hit the writer table directly.
+    """
+    for base in cls.__mro__:
+        writer = writers.get(base)
+        if writer is not None:
+            writers[cls] = writer
+            return writer
+    raise STTSerializationError(f"Cannot serialize type {cls}")
 
 
-def serialize_stt(value: Any) -> bytes:
+def serialize_stt(value: Any, typed_arrays: bool = False) -> bytes:
     """
     Serialize value to STT binary format.
     
@@ -256,11 +458,12 @@ def serialize_stt(value: Any) -> bytes:
     
     Args:
         value: Value to serialize
+        typed_arrays: Pack long all-int/all-float lists as typed arrays
         
     Returns:
         Serialized bytes
     """
-    return STTSerializer.serialize(value)
+    return STTSerializer.serialize(value, typed_arrays=typed_arrays)
 
 
 def deserialize_stt(data: bytes) -> Any:
@@ -4,6 +4,9 @@ Variable-length integer encoding/decoding for STT frames.
 
 from typing import Tuple
 
+# Encodings of 0-127, which are a single byte equal to the value
+_SINGLE_BYTE = tuple(bytes((i,)) for i in range(0x80))
+
 
 def encode_varint(value: int) -> bytes:
     """
@@ -21,6 +24,12 @@ def encode_varint(value: int) -> bytes:
     if value < 0:
         raise ValueError("Cannot encode negative integers as varint")
     
+    # Frame lengths and metadata sizes almost always fit in 1-2 bytes
+    if value < 0x80:
+        return _SINGLE_BYTE[value]
+    if value < 0x4000:
+        return bytes(((value & 0x7F) | 0x80, value >> 7))
+    
     result = bytearray()
     while value >= 0x80:
         result.append((value & 0x7F) | 0x80)
@@ -43,23 +52,28 @@ def decode_varint(data: bytes, offset: int = 0) -> Tuple[int, int]:
     Raises:
         ValueError: If data is malformed or incomplete
     """
-    if not data or offset >= len(data):
+    data_len = len(data)
+    if not data or offset >= data_len:
         raise ValueError("Insufficient data for varint decoding")
     
-    result = 0
-    shift = 0
-    bytes_read = 0
+    byte = data[offset]
+    if byte < 0x80:
+        return byte, 1
+    
+    result = byte & 0x7F
+    shift = 7
+    pos = offset + 1
     
     while True:
-        if offset + bytes_read >= len(data):
+        if pos >= data_len:
             raise ValueError("Incomplete varint in data")
             
-        byte = data[offset + bytes_read]
-        bytes_read += 1
+        byte = data[pos]
+        pos += 1
         
         result |= (byte & 0x7F) << shift
         
-        if not (byte & 0x80):
+        if byte < 0x80:
             break
             
         shift += 7
@@ -67,7 +81,7 @@ def decode_varint(data: bytes, offset: int = 0) -> Tuple[int, int]:
         if shift >= 64:
             raise ValueError("Varint too large (exceeds 64 bits)")
     
-    return result, bytes_read
+    return result, pos - offset
 
 
 def varint_size(value: int) -> int:
@@ -83,12 +97,5 @@ def varint_size(value: int) -> int:
     if value < 0:
         raise ValueError("Cannot calculate size for negative integers")
     
-    if value == 0:
-        return 1
-    
-    size = 0
-    while value > 0:
-        size += 1
-        value >>= 7
-    
-    return size
+    # 7 payload bits per byte; zero still takes one byte
+    return max(1, (value.bit_length() + 6) // 7)
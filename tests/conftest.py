@@ -3,24 +3,24 @@ Test configuration for pytest.
 """
 
 import pytest
-import asyncio
+import sys
 import tempfile
 from pathlib import Path
 from seigr_toolset_transmissions.crypto import STCWrapper
 
+try:
+    import uvloop
+except ImportError:  # Optional: stdlib loop is used otherwise
+    uvloop = None
 
-@pytest.fixture(scope="function")
-def event_loop():
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    yield loop
-    # Clean up all pending tasks
-    pending = asyncio.all_tasks(loop)
-    for task in pending:
-        task.cancel()
-    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-    loop.close()
+
+# pytest-asyncio >= 1.4 builds each test loop from this hook; older versions
+# skip the optional hook and keep the stdlib loop
+if uvloop is not None and sys.platform != "win32":
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
 
 
 @pytest.fixture
@@ -35,6 +35,27 @@ def stc_wrapper(test_seed):
     return STCWrapper(test_seed)
 
 
+@pytest.fixture(scope="session")
+def shared_stc_wrapper():
+    """
+    Factory returning one session-wide STC wrapper per seed.
+    
+    STC context setup dominates the streaming and transport tests, so each
+    seed is initialized once; stream contexts are cleared on every call so
+    each test still starts from an empty cache.
+    """
+    wrappers = {}
+    
+    def get(seed: bytes = b"integration_seed_32_bytes_min!") -> STCWrapper:
+        wrapper = wrappers.get(seed)
+        if wrapper is None:
+            wrapper = wrappers[seed] = STCWrapper(seed)
+        wrapper.clear_stream_contexts()
+        return wrapper
+    
+    return get
+
+
 @pytest.fixture
 def temp_dir():
     """Temporary directory for tests."""
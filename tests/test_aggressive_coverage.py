@@ -16,14 +16,12 @@ class TestAggressiveCoverage:
     def stc_wrapper(self):
         return STCWrapper(b"aggressive_32_bytes_minimum_se!")
     
-    @pytest.mark.asyncio
     async def test_session_rotate_key(self, stc_wrapper):
         """Test session key rotation."""
         session = STTSession(b"rotkeyyy", b"peer_rot", stc_wrapper)
         await session.rotate_key(stc_wrapper)
         assert session.key_version == 1
     
-    @pytest.mark.asyncio
     async def test_session_rotate_key_existing(self, stc_wrapper):
         """Test rotating existing session key."""
         session = STTSession(b"rotkey22", b"peer_rot2", stc_wrapper)
@@ -44,7 +42,6 @@ class TestAggressiveCoverage:
         session.close()
         assert session.is_active_method() is False
     
-    @pytest.mark.asyncio
     async def test_stream_sequence_tracking(self, stc_wrapper):
         """Test stream sequence tracking."""
         stream = STTStream(b"seqtrack", 5, stc_wrapper)
@@ -53,7 +50,6 @@ class TestAggressiveCoverage:
         await stream.send(b"data2")
         assert stream.sequence == 2
     
-    @pytest.mark.asyncio
     async def test_udp_send_frame(self, stc_wrapper):
         """Test UDP send frame."""
         from seigr_toolset_transmissions.frame import STTFrame
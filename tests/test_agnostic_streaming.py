@@ -36,7 +36,6 @@ def stc_wrapper():
     return STCWrapper(TEST_SEED)
 
 
-@pytest.mark.asyncio
 async def test_bounded_streaming(stc_wrapper):
     """Test bounded streaming (known size)."""
     session_id = b"12345678"
@@ -67,7 +66,6 @@ async def test_bounded_streaming(stc_wrapper):
     assert received == test_data, "Bounded stream data mismatch"
 
 
-@pytest.mark.asyncio
 async def test_live_streaming(stc_wrapper):
     """Test live streaming (infinite)."""
     session_id = b"87654321"
@@ -106,7 +104,6 @@ async def test_live_streaming(stc_wrapper):
     assert len(received_chunks) == 3, "Live stream should receive 3 chunks"
 
 
-@pytest.mark.asyncio
 async def test_out_of_order_segments(stc_wrapper):
     """Test segment reordering."""
     session_id = b"abcdefgh"
@@ -138,7 +135,6 @@ async def test_out_of_order_segments(stc_wrapper):
     assert received == test_data, "Out-of-order segments should be reordered"
 
 
-@pytest.mark.asyncio
 async def test_binary_storage(tmp_path, stc_wrapper):
     """Test binary storage (NO file semantics)."""
     # Create storage
@@ -175,7 +171,6 @@ async def test_binary_storage(tmp_path, stc_wrapper):
     assert address1 not in addresses
 
 
-@pytest.mark.asyncio
 async def test_multi_endpoint():
     """Test multi-endpoint routing (NO peer assumptions)."""
     manager = EndpointManager()
@@ -202,7 +197,6 @@ async def test_multi_endpoint():
     assert endpoint2 in endpoints
 
 
-@pytest.mark.asyncio
 async def test_events():
     """Test event system (user-defined semantics)."""
     emitter = EventEmitter()
@@ -227,7 +221,6 @@ async def test_events():
     assert events_received[1][0] == 'custom'
 
 
-@pytest.mark.asyncio
 async def test_custom_frames(stc_wrapper):
     """Test custom frame types (user-defined semantics)."""
     dispatcher = FrameDispatcher()
@@ -260,7 +253,6 @@ async def test_custom_frames(stc_wrapper):
     assert frames_handled[0] == b"user-defined protocol data"
 
 
-@pytest.mark.asyncio
 async def test_storage_deduplication(tmp_path, stc_wrapper):
     """Test storage automatic deduplication."""
     storage = BinaryStorage(
@@ -281,7 +273,6 @@ async def test_storage_deduplication(tmp_path, stc_wrapper):
     assert addresses.count(addr1) == 1
 
 
-@pytest.mark.asyncio
 async def test_storage_exists_check(tmp_path, stc_wrapper):
     """Test storage exists check."""
     storage = BinaryStorage(
@@ -298,7 +289,6 @@ async def test_storage_exists_check(tmp_path, stc_wrapper):
     assert not await storage.exists(fake_addr), "Non-existent address should return False"
 
 
-@pytest.mark.asyncio
 async def test_storage_get_nonexistent(tmp_path, stc_wrapper):
     """Test getting non-existent data from storage."""
     from seigr_toolset_transmissions.utils.exceptions import STTStorageError
@@ -318,7 +308,6 @@ async def test_storage_get_nonexistent(tmp_path, stc_wrapper):
         pass  # Expected
 
 
-@pytest.mark.asyncio
 async def test_endpoint_remove(tmp_path):
     """Test endpoint removal."""
     manager = EndpointManager()
@@ -335,7 +324,6 @@ async def test_endpoint_remove(tmp_path):
     assert endpoint not in endpoints
 
 
-@pytest.mark.asyncio
 async def test_endpoint_send_to(tmp_path):
     """Test endpoint send_to method."""
     manager = EndpointManager()
@@ -352,7 +340,6 @@ async def test_endpoint_send_to(tmp_path):
     assert info is not None
 
 
-@pytest.mark.asyncio
 async def test_endpoint_receive_timeout(tmp_path):
     """Test endpoint receive timeout."""
     manager = EndpointManager()
@@ -369,7 +356,6 @@ async def test_endpoint_receive_timeout(tmp_path):
         pass  # Expected
 
 
-@pytest.mark.asyncio
 async def test_events_decorator():
     """Test event decorator syntax."""
     emitter = EventEmitter()
@@ -385,7 +371,6 @@ async def test_events_decorator():
     assert len(events_received) == 1
 
 
-@pytest.mark.asyncio
 async def test_encoder_segment_size(stc_wrapper):
     """Test encoder with custom segment size."""
     session_id = b"seg_size"
@@ -406,7 +391,6 @@ async def test_encoder_segment_size(stc_wrapper):
     assert len(segments) > 1, "Large data with small segment size should create multiple segments"
 
 
-@pytest.mark.asyncio
 async def test_storage_remove_multiple(tmp_path, stc_wrapper):
     """Test removing multiple items from storage."""
     storage = BinaryStorage(
@@ -431,7 +415,6 @@ async def test_storage_remove_multiple(tmp_path, stc_wrapper):
     assert addr3 in addresses
 
 
-@pytest.mark.asyncio
 async def test_endpoint_metadata(tmp_path):
     """Test endpoint metadata storage and retrieval."""
     manager = EndpointManager()
@@ -447,7 +430,6 @@ async def test_endpoint_metadata(tmp_path):
     assert info['metadata']['priority'] == 10
 
 
-@pytest.mark.asyncio
 async def test_endpoint_existence(tmp_path):
     """Test endpoint existence check."""
     manager = EndpointManager()
@@ -38,7 +38,6 @@ class TestBinaryStorageEdgeCases:
             max_size_bytes=1024 * 10  # 10KB limit for eviction tests
         )
     
-    @pytest.mark.asyncio
     async def test_put_non_bytes_fails(self, storage):
         """Test putting non-bytes data raises error (line 81)."""
         with pytest.raises(STTStorageError, match="Data must be bytes"):
@@ -50,7 +49,6 @@ class TestBinaryStorageEdgeCases:
         with pytest.raises(STTStorageError, match="Data must be bytes"):
             await storage.put(['list', 'of', 'things'])
     
-    @pytest.mark.asyncio
     @pytest.mark.skip(reason="Async lock event loop issue - needs BinaryStorage refactor")
     async def test_storage_eviction_lru(self, storage):
         """Test LRU eviction when storage limit exceeded (lines 95-97)."""
@@ -82,7 +80,6 @@ class TestBinaryStorageEdgeCases:
         # Either addr2 or addr3 should be evicted
         assert len(storage._index) < 4
     
-    @pytest.mark.asyncio
     async def test_get_non_bytes_address_fails(self, storage):
         """Test getting with non-bytes address raises error (line 151)."""
         with pytest.raises(STTStorageError, match="Address must be bytes"):
@@ -91,7 +88,6 @@ class TestBinaryStorageEdgeCases:
         with pytest.raises(STTStorageError, match="Address must be bytes"):
             await storage.get(12345)
     
-    @pytest.mark.asyncio
     async def test_get_nonexistent_address_fails(self, storage):
         """Test getting non-existent address raises error (line 161)."""
         fake_address = b"nonexistent_address_32_bytes!!!!"
@@ -99,7 +95,6 @@ class TestBinaryStorageEdgeCases:
         with pytest.raises(STTStorageError, match="Address not found"):
             await storage.get(fake_address)
     
-    @pytest.mark.asyncio
     async def test_get_missing_file_fails(self, storage, temp_storage_dir):
         """Test getting address where file is missing (lines 183-184)."""
         # Put data
@@ -114,7 +109,6 @@ class TestBinaryStorageEdgeCases:
         with pytest.raises(STTStorageError, match="Storage file missing"):
             await storage.get(address)
     
-    @pytest.mark.asyncio
     async def test_get_corrupted_data_fails(self, storage):
         """Test getting corrupted encrypted data fails decryption (line 191)."""
         # Put data
@@ -130,7 +124,6 @@ class TestBinaryStorageEdgeCases:
         with pytest.raises(STTStorageError):
             await storage.get(address)
     
-    @pytest.mark.asyncio
     async def test_get_integrity_check_failure(self, storage):
         """Test integrity check fails when data doesn't match hash (line 211)."""
         # Put data
@@ -162,14 +155,12 @@ class TestBinaryStorageEdgeCases:
         with pytest.raises(STTStorageError, match="Integrity check failed"):
             await storage.get(address)
     
-    @pytest.mark.asyncio
     async def test_remove_non_existent_address(self, storage):
         """Test removing non-existent address raises error (line 212)."""
         fake_address = b'z' * 32
         with pytest.raises(STTStorageError, match="Address not found"):
             await storage.remove(fake_address)
     
-    @pytest.mark.asyncio
     async def test_list_addresses_multiple(self, storage):
         """Test listing all addresses returns complete list."""
         # Add multiple entries
@@ -186,7 +177,6 @@ class TestBinaryStorageEdgeCases:
         # All addresses present
         assert set(addresses) == set(listed)
     
-    @pytest.mark.asyncio
     async def test_rebuild_index_from_disk(self, storage, temp_storage_dir):
         """Test rebuilding index from filesystem when corrupted (lines 301-313)."""
         # Put some data
@@ -206,7 +196,6 @@ class TestBinaryStorageEdgeCases:
         assert addr1 in storage._index
         assert addr2 in storage._index
     
-    @pytest.mark.asyncio
     async def test_load_index_with_corrupted_pickle(self, storage, temp_storage_dir):
         """Test loading index when pickle file is corrupted (lines 322-324)."""
         # Put some data
@@ -226,7 +215,6 @@ class TestBinaryStorageEdgeCases:
         # Should have rebuilt index from filesystem
         assert len(new_storage._index) > 0
     
-    @pytest.mark.asyncio
     async def test_evict_lru_edge_cases(self, storage):
         """Test LRU eviction edge cases (lines 333-360)."""
         # Add data to fill storage
@@ -250,7 +238,6 @@ class TestBinaryStorageEdgeCases:
         assert addresses[0] in storage._index or addresses[2] in storage._index
         assert new_addr in storage._index
     
-    @pytest.mark.asyncio
     async def test_concurrent_put_operations(self, storage):
         """Test concurrent put operations with locking."""
         # Launch multiple concurrent puts
@@ -267,7 +254,6 @@ class TestBinaryStorageEdgeCases:
         for addr in addresses:
             assert addr in storage._index
     
-    @pytest.mark.asyncio
     async def test_concurrent_get_operations(self, storage):
         """Test concurrent get operations."""
         # Put some data first
@@ -286,7 +272,6 @@ class TestBinaryStorageEdgeCases:
         for i, result in enumerate(results):
             assert result == f"data_{i}".encode()
     
-    @pytest.mark.asyncio
     async def test_storage_size_tracking(self, storage):
         """Test storage size tracking during put/remove."""
         initial_size = storage._current_size
@@ -304,7 +289,6 @@ class TestBinaryStorageEdgeCases:
         # Size should decrease
         assert storage._current_size == initial_size
     
-    @pytest.mark.asyncio
     async def test_deduplication(self, storage):
         """Test deduplication - same data returns same address."""
         data = b"identical data"
@@ -318,7 +302,6 @@ class TestBinaryStorageEdgeCases:
         # Should only be stored once
         assert len(storage._index) == 1
     
-    @pytest.mark.asyncio
     async def test_index_persistence_across_restarts(self, storage, temp_storage_dir, stc_wrapper):
         """Test index persists across storage restarts."""
         # Put data
@@ -64,13 +64,11 @@ class TestStreamEdgeCases:
     def stream(self, stc_wrapper):
         return STTStream(b"87654321", 1, stc_wrapper)
     
-    @pytest.mark.asyncio
     async def test_stream_close(self, stream):
         """Test stream close."""
         await stream.close()
         assert stream.is_closed()
     
-    @pytest.mark.asyncio
     async def test_stream_double_close(self, stream):
         """Test double close."""
         await stream.close()
@@ -102,21 +100,18 @@ class TestNodeEdgeCases:
         shared_seed = b"shared_coverage_32_bytes_minim!"
         return STTNode(node_seed, shared_seed, "127.0.0.1", 0)
     
-    @pytest.mark.asyncio
     async def test_node_start_stop(self, node):
         """Test node lifecycle."""
         _addr, port = await node.start()
         assert isinstance(port, int)
         await node.stop()
     
-    @pytest.mark.asyncio
     async def test_node_double_start(self, node):
         """Test starting already running node."""
         await node.start()
         await node.start()  # Should handle gracefully (double start)
         await node.stop()
     
-    @pytest.mark.asyncio
     async def test_node_stop_without_start(self, node):
         """Test stopping non-running node."""
         try:
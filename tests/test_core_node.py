@@ -24,7 +24,6 @@ class TestSTTNode:
         """Shared seed for authentication."""
         return b"test_shared_seed_1234567"
     
-    @pytest.mark.asyncio
     async def test_create_node(self, node_seed, shared_seed):
         """Test creating STT node."""
         node = STTNode(
@@ -44,7 +43,6 @@ class TestSTTNode:
         assert node.handshake_manager is not None
         assert not node._running
     
-    @pytest.mark.asyncio
     async def test_node_start_stop(self, node_seed, shared_seed):
         """Test starting and stopping node."""
         node = STTNode(
@@ -67,7 +65,6 @@ class TestSTTNode:
         await node.stop()
         assert node._running == False
     
-    @pytest.mark.asyncio
     async def test_node_double_start(self, node_seed, shared_seed):
         """Test starting node twice returns same address."""
         node = STTNode(
@@ -85,7 +82,6 @@ class TestSTTNode:
         
         await node.stop()
     
-    @pytest.mark.asyncio
     async def test_node_stop_when_not_running(self, node_seed, shared_seed):
         """Test stopping node when not running."""
         node = STTNode(
@@ -98,7 +94,6 @@ class TestSTTNode:
         await node.stop()
         assert node._running == False
     
-    @pytest.mark.asyncio
     async def test_connect_udp_without_start(self, node_seed, shared_seed):
         """Test connecting before starting node raises error."""
         node = STTNode(
@@ -110,7 +105,6 @@ class TestSTTNode:
         with pytest.raises(STTException, match="not started"):
             await node.connect_udp("127.0.0.1", 12345)
     
-    @pytest.mark.asyncio
     async def test_node_without_storage(self, node_seed, shared_seed):
         """Test node works without storage (pure transmission mode)."""
         node = STTNode(
@@ -129,7 +123,6 @@ class TestSTTNode:
         assert addr is not None
         await node.stop()
     
-    @pytest.mark.asyncio
     async def test_node_with_storage(self, node_seed, shared_seed):
         """Test node with pluggable storage."""
         from seigr_toolset_transmissions.storage import InMemoryStorage
@@ -151,7 +144,6 @@ class TestSTTNode:
         assert addr is not None
         await node.stop()
     
-    @pytest.mark.asyncio
     async def test_node_id_generation(self, node_seed, shared_seed):
         """Test node ID is generated from seed."""
         node1 = STTNode(node_seed, shared_seed, storage=None)
@@ -164,7 +156,6 @@ class TestSTTNode:
         node3 = STTNode(b"different_seed_12345", shared_seed, storage=None)
         assert node1.node_id != node3.node_id
     
-    @pytest.mark.asyncio
     async def test_received_packet_dataclass(self):
         """Test ReceivedPacket dataclass."""
         packet = ReceivedPacket(
@@ -191,7 +182,6 @@ class TestSTTNodeIntegration:
         """Shared seed for authentication."""
         return b"test_shared_seed_1234567"
     
-    @pytest.mark.asyncio
     async def test_two_nodes_communication(self):
         """Test two nodes can communicate."""
         node_seed1 = b"node1_seed_1234567890"
@@ -217,7 +207,6 @@ class TestSTTNodeIntegration:
         await node1.stop()
         await node2.stop()
     
-    @pytest.mark.asyncio
     async def test_node_lifecycle(self):
         """Test complete node lifecycle."""
         node = STTNode(
@@ -243,7 +232,6 @@ class TestSTTNodeIntegration:
         assert not node._running
         assert len(node.ws_connections) == 0
     
-    @pytest.mark.asyncio
     async def test_connect_udp_not_started(self, node_seed, shared_seed):
         """Test connecting UDP before node is started raises error."""
         node = STTNode(
@@ -255,7 +243,6 @@ class TestSTTNodeIntegration:
         with pytest.raises(STTException, match="Node not started"):
             await node.connect_udp("127.0.0.1", 9999)
     
-    @pytest.mark.asyncio
     async def test_node_stop_when_not_running(self, node_seed, shared_seed):
         """Test stopping node when not running."""
         node = STTNode(
@@ -268,7 +255,6 @@ class TestSTTNodeIntegration:
         await node.stop()
         assert not node._running
     
-    @pytest.mark.asyncio
     async def test_node_session_manager_initialization(self, node_seed, shared_seed):
         """Test node initializes session manager."""
         node = STTNode(
@@ -280,7 +266,6 @@ class TestSTTNodeIntegration:
         assert node.session_manager is not None
         assert node.session_manager.local_node_id == node.node_id
     
-    @pytest.mark.asyncio
     async def test_node_handshake_manager_initialization(self, node_seed, shared_seed):
         """Test node initializes handshake manager."""
         node = STTNode(
@@ -292,7 +277,6 @@ class TestSTTNodeIntegration:
         assert node.handshake_manager is not None
         assert node.handshake_manager.node_id == node.node_id
     
-    @pytest.mark.asyncio
     async def test_node_receive_queue_initialization(self, node_seed, shared_seed):
         """Test node initializes receive queue."""
         node = STTNode(
@@ -304,7 +288,6 @@ class TestSTTNodeIntegration:
         assert node._recv_queue is not None
         assert isinstance(node._recv_queue, asyncio.Queue)
     
-    @pytest.mark.asyncio
     async def test_node_host_port_configuration(self, node_seed, shared_seed):
         """Test node host and port configuration."""
         node = STTNode(
@@ -318,7 +301,6 @@ class TestSTTNodeIntegration:
         assert node.host == "192.168.1.1"
         assert node.port == 5000
     
-    @pytest.mark.asyncio
     async def test_node_ws_connections_empty(self, node_seed, shared_seed):
         """Test WebSocket connections dict is empty initially."""
         node = STTNode(
@@ -329,7 +311,6 @@ class TestSTTNodeIntegration:
         
         assert len(node.ws_connections) == 0
     
-    @pytest.mark.asyncio
     async def test_node_tasks_empty_initially(self, node_seed, shared_seed):
         """Test tasks list is empty initially."""
         node = STTNode(
@@ -340,7 +321,6 @@ class TestSTTNodeIntegration:
         
         assert len(node._tasks) == 0
     
-    @pytest.mark.asyncio
     async def test_node_get_stats(self, node_seed, shared_seed):
         """Test node statistics retrieval."""
         node = STTNode(
@@ -355,7 +335,6 @@ class TestSTTNodeIntegration:
         assert 'node_id' in stats
         assert stats['node_id'] == node.node_id.hex()
     
-    @pytest.mark.asyncio
     async def test_node_receive_queue(self, node_seed, shared_seed):
         """Test node receive queue."""
         node = STTNode(
@@ -377,7 +356,6 @@ class TestSTTNodeIntegration:
         
         assert not node._recv_queue.empty()
     
-    @pytest.mark.asyncio
     async def test_handle_handshake_frame(self, node_seed, shared_seed):
         """Test handling handshake frames."""
         node = STTNode(
@@ -411,7 +389,6 @@ class TestSTTNodeIntegration:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_handle_data_frame_no_session(self, node_seed, shared_seed):
         """Test handling data frame with no session."""
         node = STTNode(
@@ -444,7 +421,6 @@ class TestSTTNodeIntegration:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_handle_data_frame_with_session(self, node_seed, shared_seed):
         """Test handling data frame with valid session."""
         node = STTNode(
@@ -487,7 +463,6 @@ class TestSTTNodeIntegration:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_receive_generator(self, node_seed, shared_seed):
         """Test receive generator."""
         node = STTNode(
@@ -520,7 +495,6 @@ class TestSTTNodeIntegration:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_handle_unknown_frame_type(self, node_seed, shared_seed):
         """Test handling unknown frame type."""
         node = STTNode(
@@ -552,7 +526,6 @@ class TestSTTNodeIntegration:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_node_with_background_tasks(self, node_seed, shared_seed):
         """Test node with background tasks gets cancelled on stop."""
         node = STTNode(
@@ -575,7 +548,6 @@ class TestSTTNodeIntegration:
         
         assert task.cancelled() or task.done()
     
-    @pytest.mark.asyncio
     async def test_node_stop_with_websockets(self, node_seed, shared_seed):
         """Test stopping node with active WebSocket connections."""
         from unittest.mock import AsyncMock, MagicMock
@@ -21,7 +21,6 @@ class TestNodeAdditional:
         """Node ID."""
         return b'\xab' * 32
     
-    @pytest.mark.asyncio
     async def test_node_connect_websocket_client(self, node_id, stc_wrapper):
         """Test connecting as WebSocket client."""
         node = STTNode(node_id, stc_wrapper)
@@ -32,7 +31,6 @@ class TestNodeAdditional:
         except Exception:
             pass  # Expected to fail
     
-    @pytest.mark.asyncio
     async def test_node_send_data_no_connection(self, node_id, stc_wrapper):
         """Test sending data without connection."""
         node = STTNode(node_id, stc_wrapper)
@@ -43,7 +41,6 @@ class TestNodeAdditional:
         except Exception:
             pass  # Expected to fail
     
-    @pytest.mark.asyncio
     async def test_node_receive_data_timeout(self, node_id, stc_wrapper):
         """Test receiving data with timeout."""
         node = STTNode(node_id, stc_wrapper)
@@ -54,7 +51,6 @@ class TestNodeAdditional:
         except (asyncio.TimeoutError, Exception):
             pass  # Expected
     
-    @pytest.mark.asyncio
     async def test_node_cleanup_sessions(self, node_id, stc_wrapper):
         """Test session cleanup."""
         node = STTNode(node_id, stc_wrapper)
@@ -62,7 +58,6 @@ class TestNodeAdditional:
         if hasattr(node, 'cleanup_sessions'):
             await node.cleanup_sessions()
     
-    @pytest.mark.asyncio
     async def test_node_get_active_sessions(self, node_id, stc_wrapper):
         """Test getting active sessions."""
         node = STTNode(node_id, stc_wrapper)
@@ -71,7 +66,6 @@ class TestNodeAdditional:
             sessions = node.get_active_sessions()
             assert isinstance(sessions, (list, dict)) or sessions is None
     
-    @pytest.mark.asyncio
     async def test_node_stats(self, node_id, stc_wrapper):
         """Test node statistics."""
         node = STTNode(node_id, stc_wrapper)
@@ -35,7 +35,6 @@ def temp_chamber_path(tmp_path):
 class TestBroadcastMulticast:
     """Test broadcast and multicast functionality."""
     
-    @pytest.mark.asyncio
     async def test_broadcast_no_sessions(self, node_seed, shared_seed, temp_chamber_path):
         """Test broadcast with no active sessions (lines 382-383)."""
         node = STTNode(node_seed, shared_seed, "127.0.0.1", 0, temp_chamber_path)
@@ -47,7 +46,6 @@ class TestBroadcastMulticast:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_broadcast_with_sessions(self, node_seed, shared_seed, temp_chamber_path):
         """Test broadcast to active sessions (lines 385-392)."""
         node = STTNode(node_seed, shared_seed, "127.0.0.1", 0, temp_chamber_path)
@@ -77,7 +75,6 @@ class TestBroadcastMulticast:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_send_to_sessions_empty_list(self, node_seed, shared_seed, temp_chamber_path):
         """Test multicast with empty session list (lines 405-406)."""
         node = STTNode(node_seed, shared_seed, "127.0.0.1", 0, temp_chamber_path)
@@ -89,7 +86,6 @@ class TestBroadcastMulticast:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_send_to_sessions_nonexistent(self, node_seed, shared_seed, temp_chamber_path):
         """Test multicast with nonexistent session (line 416)."""
         node = STTNode(node_seed, shared_seed, "127.0.0.1", 0, temp_chamber_path)
@@ -101,7 +97,6 @@ class TestBroadcastMulticast:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_send_to_sessions_valid(self, node_seed, shared_seed, temp_chamber_path):
         """Test multicast to valid sessions (lines 408-417)."""
         node = STTNode(node_seed, shared_seed, "127.0.0.1", 0, temp_chamber_path)
@@ -135,7 +130,6 @@ class TestBroadcastMulticast:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_send_to_session_with_encryption(self, node_seed, shared_seed, temp_chamber_path):
         """Test _send_to_session with session key (lines 429-435)."""
         node = STTNode(node_seed, shared_seed, "127.0.0.1", 0, temp_chamber_path)
@@ -158,7 +152,6 @@ class TestBroadcastMulticast:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_send_to_session_no_transport_address(self, node_seed, shared_seed, temp_chamber_path):
         """Test _send_to_session without peer_addr (lines 441-442)."""
         node = STTNode(node_seed, shared_seed, "127.0.0.1", 0, temp_chamber_path)
@@ -180,7 +173,6 @@ class TestBroadcastMulticast:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_send_to_session_exception(self, node_seed, shared_seed, temp_chamber_path):
         """Test _send_to_session exception handling (line 445)."""
         node = STTNode(node_seed, shared_seed, "127.0.0.1", 0, temp_chamber_path)
@@ -207,7 +199,6 @@ class TestBroadcastMulticast:
 class TestReceivePath:
     """Test receive functionality."""
     
-    @pytest.mark.asyncio
     async def test_receive_timeout_loop(self, node_seed, shared_seed, temp_chamber_path):
         """Test receive() timeout handling (lines 362-363)."""
         node = STTNode(node_seed, shared_seed, "127.0.0.1", 0, temp_chamber_path)
@@ -235,7 +226,6 @@ class TestReceivePath:
             if count > 5:
                 break
     
-    @pytest.mark.asyncio
     async def test_receive_yields_packet(self, node_seed, shared_seed, temp_chamber_path):
         """Test receive() yields packets (lines 367-368)."""
         node = STTNode(node_seed, shared_seed, "127.0.0.1", 0, temp_chamber_path)
@@ -269,7 +259,6 @@ class TestReceivePath:
 class TestDataFrameHandling:
     """Test data frame handling."""
     
-    @pytest.mark.asyncio
     async def test_data_frame_decryption(self, node_seed, shared_seed, temp_chamber_path):
         """Test data frame decryption (line 342)."""
         node = STTNode(node_seed, shared_seed, "127.0.0.1", 0, temp_chamber_path)
@@ -32,7 +32,6 @@ class TestTransportAddress:
 class TestTCPTransport:
     """Test TCP transport implementation."""
     
-    @pytest.mark.asyncio
     async def test_create_tcp_transport(self):
         """Test creating TCP transport."""
         transport = TCPTransport(host="127.0.0.1", port=0)
@@ -42,7 +41,6 @@ class TestTCPTransport:
         assert transport.server is None
         assert len(transport.connections) == 0
     
-    @pytest.mark.asyncio
     async def test_tcp_start_stop(self):
         """Test starting and stopping TCP server."""
         transport = TCPTransport(host="127.0.0.1", port=0)
@@ -60,7 +58,6 @@ class TestTCPTransport:
         await transport.stop()
         assert len(transport.connections) == 0
     
-    @pytest.mark.asyncio
     async def test_tcp_client_connection(self):
         """Test TCP client connecting to server."""
         server_transport = TCPTransport(host="127.0.0.1", port=0)
@@ -104,7 +101,6 @@ class TestTCPTransport:
         await server_transport.stop()
         await client_transport.stop()
     
-    @pytest.mark.asyncio
     async def test_tcp_multiple_connections(self):
         """Test handling multiple simultaneous connections."""
         transport = TCPTransport(host="127.0.0.1", port=0)
@@ -140,7 +136,6 @@ class TestTCPTransport:
         
         await transport.stop()
     
-    @pytest.mark.asyncio
     async def test_tcp_connection_error_handling(self):
         """Test error handling during connection."""
         transport = TCPTransport()
@@ -149,7 +144,6 @@ class TestTCPTransport:
         with pytest.raises(STTTransportError, match="Failed to connect"):
             await transport.connect("127.0.0.1", 9999)
     
-    @pytest.mark.asyncio
     async def test_tcp_server_closes_connections_on_stop(self):
         """Test that stopping server closes all connections."""
         transport = TCPTransport(host="127.0.0.1", port=0)
@@ -182,7 +176,6 @@ class TestTCPTransport:
         w.close()
         await w.wait_closed()
     
-    @pytest.mark.asyncio
     async def test_tcp_callback_exception_handling(self):
         """Test that exceptions in callback don't crash server."""
         transport = TCPTransport(host="127.0.0.1", port=0)
@@ -209,7 +202,6 @@ class TestTCPTransport:
         await w.wait_closed()
         await transport.stop()
     
-    @pytest.mark.asyncio
     async def test_tcp_default_port(self):
         """Test TCP transport uses default port."""
         from seigr_toolset_transmissions.utils.constants import STT_DEFAULT_TCP_PORT
@@ -218,7 +210,6 @@ class TestTCPTransport:
         
         assert transport.port == STT_DEFAULT_TCP_PORT
     
-    @pytest.mark.asyncio
     async def test_tcp_connection_tracking(self):
         """Test that connections are tracked correctly."""
         transport = TCPTransport(host="127.0.0.1", port=0)
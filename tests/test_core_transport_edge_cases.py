@@ -20,7 +20,6 @@ def test_transport_address_str():
     assert str(addr) == "192.168.1.100:8080"
 
 
-@pytest.mark.asyncio
 async def test_tcp_connect_success():
     """Test TCPTransport connect method (lines 126-137)."""
     # Start a server to connect to
@@ -46,7 +45,6 @@ async def test_tcp_connect_success():
         await transport.stop()
 
 
-@pytest.mark.asyncio
 async def test_tcp_connect_failure():
     """Test TCPTransport connect failure (lines 143-147)."""
     transport = TCPTransport(host="127.0.0.1", port=0)
@@ -56,7 +54,6 @@ async def test_tcp_connect_failure():
         await transport.connect("127.0.0.1", 1)  # Port 1 should be unavailable
 
 
-@pytest.mark.asyncio
 async def test_tcp_connection_callback_exception():
     """Test exception handling in _handle_connection callback (lines 77-78)."""
     transport = TCPTransport(host="127.0.0.1", port=0)
@@ -81,7 +78,6 @@ async def test_tcp_connection_callback_exception():
         await transport.stop()
 
 
-@pytest.mark.asyncio
 async def test_tcp_stop_connection_close_exception():
     """Test exception handling when closing connections during stop (lines 107-108, 146-147)."""
     transport = TCPTransport(host="127.0.0.1", port=0)
@@ -103,7 +99,6 @@ async def test_tcp_stop_connection_close_exception():
     await transport.stop()
 
 
-@pytest.mark.asyncio
 async def test_tcp_is_running():
     """Test is_running method (line 159)."""
     transport = TCPTransport(host="127.0.0.1", port=0)
@@ -125,7 +120,6 @@ async def test_tcp_is_running():
     assert not transport.is_running()
 
 
-@pytest.mark.asyncio
 async def test_udp_transport_not_implemented():
     """Test UDP transport raises NotImplementedError (lines 173-175)."""
     udp = UDPTransport(host="127.0.0.1", port=9001)
@@ -134,7 +128,6 @@ async def test_udp_transport_not_implemented():
         await udp.start()
 
 
-@pytest.mark.asyncio
 async def test_udp_transport_stop():
     """Test UDP transport stop does nothing (line 183)."""
     udp = UDPTransport(host="127.0.0.1", port=9001)
@@ -143,7 +136,6 @@ async def test_udp_transport_stop():
     await udp.stop()
 
 
-@pytest.mark.asyncio
 async def test_transport_manager_initialization():
     """Test TransportManager initialization (lines 191-192)."""
     manager = TransportManager()
@@ -152,7 +144,6 @@ async def test_transport_manager_initialization():
     assert manager.udp is None
 
 
-@pytest.mark.asyncio
 async def test_transport_manager_start_tcp():
     """Test TransportManager start_tcp method."""
     manager = TransportManager()
@@ -168,7 +159,6 @@ async def test_transport_manager_start_tcp():
     await manager.stop_all()
 
 
-@pytest.mark.asyncio
 async def test_transport_manager_stop_all_with_no_transports():
     """Test stop_all when no transports are running (lines 208-209)."""
     manager = TransportManager()
@@ -177,7 +167,6 @@ async def test_transport_manager_stop_all_with_no_transports():
     await manager.stop_all()
 
 
-@pytest.mark.asyncio
 async def test_transport_manager_stop_all_with_tcp():
     """Test stop_all with TCP transport (lines 208-209, 213-218)."""
     manager = TransportManager()
@@ -194,7 +183,6 @@ async def test_transport_manager_stop_all_with_tcp():
     assert not manager.tcp.is_running()
 
 
-@pytest.mark.asyncio
 async def test_transport_manager_stop_all_with_udp():
     """Test stop_all with UDP transport (lines 210-211, 213-218)."""
     manager = TransportManager()
@@ -70,7 +70,6 @@ class TestCoverageBoost:
         exists = manager.has_stream(999)
         assert exists is False
     
-    @pytest.mark.asyncio
     async def test_stream_manager_close_all(self, test_node_id, stc_wrapper):
         """Test close_all_streams method (line 189)."""
         manager = StreamManager(test_node_id, stc_wrapper)
@@ -191,7 +190,6 @@ class TestCoverageBoost:
         assert manager.has_stream(42) is True
         assert manager.has_stream(999) is False
     
-    @pytest.mark.asyncio
     async def test_udp_send_large_frame_warning(self, test_session_id):
         """Test UDP warning for large frames (line 173)."""
         from seigr_toolset_transmissions.transport.udp import UDPTransport
@@ -218,7 +216,6 @@ class TestCoverageBoost:
         finally:
             await transport.stop()
     
-    @pytest.mark.asyncio  
     async def test_udp_double_stop(self):
         """Test UDP stop when not running (lines 130-131)."""
         from seigr_toolset_transmissions.transport.udp import UDPTransport, UDPConfig
@@ -229,7 +226,6 @@ class TestCoverageBoost:
         await transport.stop()
         assert not transport.running
     
-    @pytest.mark.asyncio
     async def test_udp_send_frame_not_running(self, test_session_id):
         """Test UDP send_frame when transport not running (lines 187-189)."""
         from seigr_toolset_transmissions.transport.udp import UDPTransport
@@ -250,7 +246,6 @@ class TestCoverageBoost:
         with pytest.raises(STTTransportError, match="Transport not running"):
             await transport.send_frame(frame, ("127.0.0.1", 12345))
     
-    @pytest.mark.asyncio
     async def test_node_handle_handshake_frame_server_side(self, node_seed, shared_seed):
         """Test node handling handshake as server (lines 248-269)."""
         from seigr_toolset_transmissions.core.node import STTNode
@@ -291,7 +286,6 @@ class TestCoverageBoost:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_node_frame_handling_error(self, node_seed, shared_seed):
         """Test node frame handling error path (lines 227-230)."""
         from seigr_toolset_transmissions.core.node import STTNode
@@ -319,7 +313,6 @@ class TestCoverageBoost:
         finally:
             await node.stop()
     
-    @pytest.mark.asyncio
     async def test_node_stop_with_tasks_and_websockets(self, node_seed, shared_seed):
         """Test node stop with active tasks and WebSocket connections (lines 125, 128)."""
         from seigr_toolset_transmissions.core.node import STTNode
@@ -43,14 +43,12 @@ def decoder(session_id, stream_id, stc_wrapper):
 class TestDecoderValidation:
     """Test decoder input validation paths."""
     
-    @pytest.mark.asyncio
     async def test_decrypt_segment_not_bytes(self, decoder):
         """Test decryption with non-bytes input (line 155-156)."""
         # Pass a string instead of bytes
         with pytest.raises(STTStreamingError, match="must be bytes"):
             await decoder._decrypt_segment("not bytes")
     
-    @pytest.mark.asyncio
     async def test_decrypt_segment_too_short(self, decoder):
         """Test decryption with segment shorter than minimum (line 158-159)."""
         # Minimum valid segment is 17 bytes: 1 flag + 16 header
@@ -60,7 +58,6 @@ class TestDecoderValidation:
         with pytest.raises(STTStreamingError, match="too short"):
             await decoder._decrypt_segment(short_segment)
     
-    @pytest.mark.asyncio
     async def test_decrypt_segment_minimum_length(self, decoder):
         """Test edge case: exactly 17 bytes (minimum valid)."""
         # This should NOT raise the "too short" error
@@ -92,7 +89,6 @@ class TestDecoderReset:
         assert decoder._ended is False
         assert decoder._total_bytes_received == 0
     
-    @pytest.mark.asyncio
     async def test_reset_with_items_in_queue(self, decoder):
         """Test reset() with items in queue."""
         # Add some items to the queue
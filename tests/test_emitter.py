@@ -18,7 +18,6 @@ def emitter():
 class TestEventRegistration:
     """Test event handler registration."""
     
-    @pytest.mark.asyncio
     async def test_on_decorator_registers_handler(self, emitter):
         """Test @emitter.on() decorator registers async handler."""
         @emitter.on('test_event')
@@ -29,7 +28,6 @@ class TestEventRegistration:
         assert len(handlers) == 1
         assert handlers[0] == handler
     
-    @pytest.mark.asyncio
     async def test_on_decorator_rejects_sync_handler(self, emitter):
         """Test @emitter.on() rejects non-async handler."""
         with pytest.raises(STTEventError, match="Event handler must be async"):
@@ -37,7 +35,6 @@ class TestEventRegistration:
             def sync_handler(data):  # Not async!
                 return data
     
-    @pytest.mark.asyncio
     async def test_register_method_adds_handler(self, emitter):
         """Test programmatic handler registration."""
         async def handler(data):
@@ -49,7 +46,6 @@ class TestEventRegistration:
         assert len(handlers) == 1
         assert handlers[0] == handler
     
-    @pytest.mark.asyncio
     async def test_register_rejects_sync_handler(self, emitter):
         """Test register() rejects non-async handler."""
         def sync_handler(data):
@@ -58,7 +54,6 @@ class TestEventRegistration:
         with pytest.raises(STTEventError, match="Event handler must be async"):
             emitter.register('test_event', sync_handler)
     
-    @pytest.mark.asyncio
     async def test_multiple_handlers_same_event(self, emitter):
         """Test multiple handlers can be registered for same event."""
         @emitter.on('test_event')
@@ -78,7 +73,6 @@ class TestEventRegistration:
 class TestEventEmission:
     """Test event emission and handler execution."""
     
-    @pytest.mark.asyncio
     async def test_emit_calls_registered_handler(self, emitter):
         """Test emit() calls registered handler."""
         called = []
@@ -93,13 +87,11 @@ class TestEventEmission:
         assert called == ['test_data']
         assert results == ['test_data']
     
-    @pytest.mark.asyncio
     async def test_emit_with_no_handlers(self, emitter):
         """Test emit() with no registered handlers returns empty list."""
         results = await emitter.emit('nonexistent_event', 'data')
         assert results == []
     
-    @pytest.mark.asyncio
     async def test_emit_calls_all_handlers(self, emitter):
         """Test emit() calls all registered handlers."""
         results_collected = []
@@ -129,7 +121,6 @@ class TestEventEmission:
         assert len(results) == 3
         assert set(results) == {1, 2, 3}
     
-    @pytest.mark.asyncio
     async def test_emit_with_args_and_kwargs(self, emitter):
         """Test emit() passes args and kwargs to handlers."""
         received = []
@@ -143,7 +134,6 @@ class TestEventEmission:
         
         assert received == [('a', 'b', 'k1', 'k2')]
     
-    @pytest.mark.asyncio
     async def test_emit_handler_exception_returns_exception(self, emitter):
         """Test emit() returns exceptions from handlers."""
         @emitter.on('test_event')
@@ -161,7 +151,6 @@ class TestEventEmission:
         assert 'success' in results
         assert any(isinstance(r, ValueError) for r in results)
     
-    @pytest.mark.asyncio
     async def test_emit_concurrent_execution(self, emitter):
         """Test emit() executes handlers concurrently."""
         execution_order = []
@@ -192,7 +181,6 @@ class TestEventEmission:
 class TestHandlerManagement:
     """Test handler management operations."""
     
-    @pytest.mark.asyncio
     async def test_unregister_removes_handler(self, emitter):
         """Test unregister() removes specific handler."""
         @emitter.on('test_event')
@@ -213,7 +201,6 @@ class TestHandlerManagement:
         assert len(handlers) == 1
         assert handlers[0] == handler2
     
-    @pytest.mark.asyncio
     async def test_unregister_nonexistent_event(self, emitter):
         """Test unregister() with nonexistent event does nothing."""
         async def handler(data):
@@ -222,7 +209,6 @@ class TestHandlerManagement:
         # Should not raise exception
         emitter.unregister('nonexistent_event', handler)
     
-    @pytest.mark.asyncio
     async def test_unregister_nonexistent_handler(self, emitter):
         """Test unregister() with handler not in list does nothing."""
         @emitter.on('test_event')
@@ -238,7 +224,6 @@ class TestHandlerManagement:
         # Registered handler still there
         assert len(emitter.get_handlers('test_event')) == 1
     
-    @pytest.mark.asyncio
     async def test_get_handlers_returns_copy(self, emitter):
         """Test get_handlers() returns handlers for event."""
         @emitter.on('test_event')
@@ -249,13 +234,11 @@ class TestHandlerManagement:
         assert len(handlers) == 1
         assert handlers[0] == handler
     
-    @pytest.mark.asyncio
     async def test_get_handlers_nonexistent_event(self, emitter):
         """Test get_handlers() for nonexistent event returns empty list."""
         handlers = emitter.get_handlers('nonexistent_event')
         assert handlers == []
     
-    @pytest.mark.asyncio
     async def test_get_events_returns_event_names(self, emitter):
         """Test get_events() returns all registered event names."""
         @emitter.on('event1')
@@ -274,13 +257,11 @@ class TestHandlerManagement:
         assert len(events) == 3
         assert set(events) == {'event1', 'event2', 'event3'}
     
-    @pytest.mark.asyncio
     async def test_get_events_empty_emitter(self, emitter):
         """Test get_events() on empty emitter returns empty list."""
         events = emitter.get_events()
         assert events == []
     
-    @pytest.mark.asyncio
     async def test_clear_handlers_specific_event(self, emitter):
         """Test clear_handlers() clears specific event."""
         @emitter.on('event1')
@@ -297,7 +278,6 @@ class TestHandlerManagement:
         assert len(emitter.get_handlers('event1')) == 0
         assert len(emitter.get_handlers('event2')) == 1
     
-    @pytest.mark.asyncio
     async def test_clear_handlers_nonexistent_event(self, emitter):
         """Test clear_handlers() on nonexistent event does nothing."""
         @emitter.on('event1')
@@ -310,7 +290,6 @@ class TestHandlerManagement:
         # event1 still has handler
         assert len(emitter.get_handlers('event1')) == 1
     
-    @pytest.mark.asyncio
     async def test_clear_handlers_all_events(self, emitter):
         """Test clear_handlers(None) clears all events."""
         @emitter.on('event1')
@@ -354,7 +333,6 @@ class TestSTTEvents:
 class TestRealWorldUsage:
     """Test real-world usage patterns."""
     
-    @pytest.mark.asyncio
     async def test_bytes_received_workflow(self, emitter):
         """Test realistic bytes_received event workflow."""
         received_data = []
@@ -370,7 +348,6 @@ class TestRealWorldUsage:
         assert received_data == [(b'test_data', b'endpoint_123')]
         assert results == [9]  # Length of 'test_data'
     
-    @pytest.mark.asyncio
     async def test_multiple_event_types(self, emitter):
         """Test multiple different event types."""
         events_fired = []
@@ -71,7 +71,6 @@ class TestEncoderValidation:
 class TestEncoderEndMarker:
     """Test end() method edge cases."""
     
-    @pytest.mark.asyncio
     async def test_end_on_live_stream(self, stc_wrapper, session_id, stream_id):
         """Test calling end() on live stream (line 143)."""
         encoder = BinaryStreamEncoder(
@@ -84,7 +83,6 @@ class TestEncoderEndMarker:
         with pytest.raises(STTStreamingError, match="Cannot end live stream"):
             await encoder.end()
     
-    @pytest.mark.asyncio
     async def test_end_called_twice(self, stc_wrapper, session_id, stream_id):
         """Test calling end() twice on bounded stream (line 146)."""
         encoder = BinaryStreamEncoder(
@@ -107,7 +105,6 @@ class TestEncoderEndMarker:
 class TestEncoderFlowControl:
     """Test flow control credit system."""
     
-    @pytest.mark.asyncio
     async def test_credit_exhaustion_and_replenish(self, stc_wrapper, session_id, stream_id):
         """Test flow control when credits exhausted (lines 108-109, 190-192)."""
         encoder = BinaryStreamEncoder(
@@ -146,7 +143,6 @@ class TestEncoderFlowControl:
             segments.append(segment)
         return segments
     
-    @pytest.mark.asyncio
     async def test_add_credits_when_already_positive(self, stc_wrapper, session_id, stream_id):
         """Test add_credits() when credits already > 0 (line 191 branch)."""
         encoder = BinaryStreamEncoder(
@@ -17,7 +17,6 @@ class TestEndpointManagerEdgeCases:
         """Create endpoint manager instance."""
         return EndpointManager()
     
-    @pytest.mark.asyncio
     async def test_add_duplicate_endpoint_fails(self, manager):
         """Test adding duplicate endpoint raises error (line 76)."""
         endpoint_id = b'test_endpoint_id_123_456_789'
@@ -30,7 +29,6 @@ class TestEndpointManagerEdgeCases:
         with pytest.raises(STTEndpointError, match="Endpoint already exists"):
             await manager.add_endpoint(endpoint_id, address)
     
-    @pytest.mark.asyncio
     async def test_remove_nonexistent_endpoint_fails(self, manager):
         """Test removing non-existent endpoint raises error (line 99)."""
         fake_endpoint_id = b'nonexistent_endpoint_xyz_123'
@@ -38,7 +36,6 @@ class TestEndpointManagerEdgeCases:
         with pytest.raises(STTEndpointError, match="Endpoint not found"):
             await manager.remove_endpoint(fake_endpoint_id)
     
-    @pytest.mark.asyncio
     async def test_send_to_nonexistent_endpoint_fails(self, manager):
         """Test sending to non-existent endpoint raises error (line 123)."""
         fake_endpoint_id = b'nonexistent_endpoint_xyz_123'
@@ -47,7 +44,6 @@ class TestEndpointManagerEdgeCases:
         with pytest.raises(STTEndpointError, match="Endpoint not found"):
             await manager.send_to(fake_endpoint_id, data)
     
-    @pytest.mark.asyncio
     async def test_send_with_empty_data(self, manager):
         """Test sending empty data (line 127)."""
         endpoint_id = b'test_endpoint_id_123_456_789'
@@ -61,7 +57,6 @@ class TestEndpointManagerEdgeCases:
         info = manager.get_endpoint_info(endpoint_id)
         assert info['bytes_sent'] == 0
     
-    @pytest.mark.asyncio
     async def test_receive_from_nonexistent_endpoint_fails(self, manager):
         """Test receiving from non-existent endpoint raises error (line 154-163)."""
         fake_endpoint_id = b'nonexistent_endpoint_xyz_123'
@@ -69,7 +64,6 @@ class TestEndpointManagerEdgeCases:
         with pytest.raises(STTEndpointError, match="Endpoint not found"):
             await manager.receive_from(fake_endpoint_id)
     
-    @pytest.mark.asyncio
     async def test_receive_timeout(self, manager):
         """Test receive timeout when no data available (line 154-163)."""
         endpoint_id = b'test_endpoint_id_123_456_789'
@@ -81,7 +75,6 @@ class TestEndpointManagerEdgeCases:
         with pytest.raises(STTEndpointError, match="timeout"):
             await manager.receive_from(endpoint_id, timeout=0.1)
     
-    @pytest.mark.asyncio
     async def test_get_info_nonexistent_endpoint_returns_none(self, manager):
         """Test getting info for non-existent endpoint returns None (line 286-289)."""
         fake_endpoint_id = b'nonexistent_endpoint_xyz_123'
@@ -90,7 +83,6 @@ class TestEndpointManagerEdgeCases:
         assert info is None
     
     
-    @pytest.mark.asyncio
     async def test_send_to_many_with_no_endpoints(self, manager):
         """Test send_to_many with empty list (line 154-163)."""
         data = b"broadcast_message"
@@ -101,7 +93,6 @@ class TestEndpointManagerEdgeCases:
         # No error expected, empty results
         assert len(results) == 0
     
-    @pytest.mark.asyncio
     async def test_send_to_many_partial_failure(self, manager):
         """Test send_to_many with some non-existent endpoints (line 154-163)."""
         endpoint1 = b'endpoint_1_test_123456789012'
@@ -119,7 +110,6 @@ class TestEndpointManagerEdgeCases:
         assert results[fake_endpoint] == False
     
     
-    @pytest.mark.asyncio
     async def test_endpoint_lifecycle(self, manager):
         """Test complete endpoint lifecycle - add, use, remove."""
         endpoint_id = b'test_endpoint_id_123_456_789'
@@ -152,7 +142,6 @@ class TestEndpointManagerEdgeCases:
         endpoints = manager.get_endpoints()
         assert endpoint_id not in endpoints
     
-    @pytest.mark.asyncio
     async def test_concurrent_endpoint_operations(self, manager):
         """Test concurrent operations on different endpoints."""
         endpoints = [
@@ -192,7 +181,6 @@ class TestEndpointManagerEdgeCases:
 class TestEndpointManagerAdvanced:
     """Additional tests for 100% coverage of endpoints/manager.py."""
     
-    @pytest.mark.asyncio
     async def test_send_to_with_transport_callback(self):
         """Test send_to() with transport layer callback (line 127)."""
         sent_data = []
@@ -210,7 +198,6 @@ class TestEndpointManagerAdvanced:
         assert len(sent_data) == 1
         assert sent_data[0] == (endpoint_id, b'test_data')
     
-    @pytest.mark.asyncio
     async def test_receive_from_timeout(self):
         """Test receive_from() timeout raises STTEndpointError (lines 196-204)."""
         manager = EndpointManager()
@@ -222,7 +209,6 @@ class TestEndpointManagerAdvanced:
         with pytest.raises(STTEndpointError, match="Receive timeout"):
             await manager.receive_from(endpoint_id, timeout=0.01)
     
-    @pytest.mark.asyncio
     async def test_receive_from_updates_stats(self):
         """Test receive_from() updates endpoint stats (lines 199-202)."""
         manager = EndpointManager()
@@ -242,7 +228,6 @@ class TestEndpointManagerAdvanced:
         assert info['bytes_received'] == len(test_data)
         assert received == test_data
     
-    @pytest.mark.asyncio
     async def test_receive_any_timeout(self):
         """Test receive_any() timeout raises STTEndpointError (lines 226-243)."""
         manager = EndpointManager()
@@ -251,7 +236,6 @@ class TestEndpointManagerAdvanced:
         with pytest.raises(STTEndpointError, match="Receive timeout"):
             await manager.receive_any(timeout=0.01)
     
-    @pytest.mark.asyncio
     async def test_receive_any_with_data(self):
         """Test receive_any() receives and updates stats (lines 230-241)."""
         manager = EndpointManager()
@@ -273,7 +257,6 @@ class TestEndpointManagerAdvanced:
         info = manager.get_endpoint_info(endpoint_id)
         assert info['bytes_received'] == len(test_data)
     
-    @pytest.mark.asyncio
     async def test_enqueue_received_both_queues(self):
         """Test _enqueue_received() adds to both queues (lines 252-256)."""
         manager = EndpointManager()
@@ -296,7 +279,6 @@ class TestEndpointManagerAdvanced:
         assert data_global == test_data
         assert source == endpoint_id
     
-    @pytest.mark.asyncio
     async def test_get_stats(self):
         """Test get_stats() calculates totals (lines 286-289)."""
         manager = EndpointManager()
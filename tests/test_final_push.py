@@ -16,7 +16,6 @@ class TestWebSocketFinalPush:
     def stc_wrapper(self):
         return STCWrapper(b"ws_final_32_bytes_minimum_seed!")
     
-    @pytest.mark.asyncio
     async def test_ws_connect_class_method(self, stc_wrapper):
         """Test WebSocket.connect_to class method."""
         try:
@@ -27,7 +26,6 @@ class TestWebSocketFinalPush:
         except Exception:
             pass  # Expected - no server listening
     
-    @pytest.mark.asyncio
     async def test_ws_message_handler(self, stc_wrapper):
         """Test WebSocket message handler."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=True)
@@ -35,7 +33,6 @@ class TestWebSocketFinalPush:
         await ws.start()
         await ws.stop()
     
-    @pytest.mark.asyncio
     async def test_ws_client_without_host_port(self, stc_wrapper):
         """Test client connect without host/port."""
         ws = WebSocketTransport(is_client=True, stc_wrapper=stc_wrapper)
@@ -44,7 +41,6 @@ class TestWebSocketFinalPush:
         except Exception as e:
             assert "required" in str(e).lower()
     
-    @pytest.mark.asyncio
     async def test_ws_stats_tracking(self, stc_wrapper):
         """Test WebSocket stats tracking."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=True)
@@ -68,7 +64,6 @@ class TestNodeFinalPush:
         shared_seed = b"shared_final_32_bytes_minimum_!"
         return STTNode(node_seed, shared_seed, "127.0.0.1", 0)
     
-    @pytest.mark.asyncio
     async def test_node_received_packet_dataclass(self, node):
         """Test ReceivedPacket dataclass."""
         packet = ReceivedPacket(
@@ -80,7 +75,6 @@ class TestNodeFinalPush:
         assert packet.stream_id == 1
         assert packet.data == b"test_data"
     
-    @pytest.mark.asyncio
     async def test_node_multiple_start_stop(self, node):
         """Test multiple start/stop cycles."""
         await node.start()
@@ -88,14 +82,12 @@ class TestNodeFinalPush:
         await node.start()
         await node.stop()
     
-    @pytest.mark.asyncio
     async def test_node_ws_connections(self, node):
         """Test node WebSocket connections dict."""
         await node.start()
         assert isinstance(node.ws_connections, dict)
         await node.stop()
     
-    @pytest.mark.asyncio
     async def test_node_tasks_list(self, node):
         """Test node tasks list."""
         await node.start()
@@ -255,18 +255,16 @@ class TestHandshakeManager:
         stc_wrapper = STCWrapper(shared_seed)
         return HandshakeManager(node_id=node_id, stc_wrapper=stc_wrapper)
     
-    @pytest.mark.asyncio
-    async def test_initiate_handshake(self, manager):
+    def test_initiate_handshake(self, manager):
         """Test initiating a handshake."""
         peer_address = ("127.0.0.1", 8000)
         
-        handshake = await manager.initiate_handshake(peer_address)
+        handshake = manager.begin_handshake(peer_address)
         
         assert handshake is not None
         assert handshake.is_initiator is True
         assert peer_address in manager.active_handshakes
     
-    @pytest.mark.asyncio
     async def test_handle_incoming_handshake(self, manager):
         """Test handling incoming handshake."""
         peer_address = ("127.0.0.1", 8001)
@@ -287,7 +285,6 @@ class TestHandshakeManager:
         assert isinstance(response, bytes)
         assert peer_address in manager.active_handshakes
     
-    @pytest.mark.asyncio
     async def test_complete_handshake(self, manager, node_id, shared_seed):
         """Test completing a handshake through manager."""
         peer_address = ("127.0.0.1", 8002)
@@ -318,13 +315,12 @@ class TestHandshakeManager:
         # Both should have completed handshakes
         assert manager.is_handshake_complete(peer_address)
     
-    @pytest.mark.asyncio
-    async def test_timeout_handshake(self, manager):
+    def test_timeout_handshake(self, manager):
         """Test handshake timeout cleanup."""
         peer_address = ("127.0.0.1", 8003)
         
         # Start handshake
-        await manager.initiate_handshake(peer_address)
+        manager.begin_handshake(peer_address)
         
         assert peer_address in manager.active_handshakes
         
@@ -334,7 +330,6 @@ class TestHandshakeManager:
         # Should be removed
         assert peer_address not in manager.active_handshakes
     
-    @pytest.mark.asyncio
     async def test_get_session_id(self, manager, shared_seed):
         """Test getting session ID from completed handshake."""
         peer_address = ("127.0.0.1", 8004)
@@ -448,6 +443,14 @@ class TestHandshakeManager:
         assert initiator.session_id is not None
         assert len(initiator.session_id) == 8
     
+    def test_handshake_uses_slots(self, initiator_node_id, stc_wrapper):
+        """Test handshake state is slot-backed (no per-instance __dict__)."""
+        handshake = STTHandshake(initiator_node_id, stc_wrapper, is_initiator=True)
+        
+        assert not hasattr(handshake, '__dict__')
+        with pytest.raises(AttributeError):
+            handshake.unexpected_field = 1
+    
     def test_handshake_roles_initiator(self, initiator_node_id, stc_wrapper):
         """Test initiator role is set correctly."""
         handshake = STTHandshake(initiator_node_id, stc_wrapper, is_initiator=True)
@@ -518,7 +521,6 @@ class TestHandshakeManager:
         # Challenges should be different (different nonces)
         assert challenge1 != challenge2
     
-    @pytest.mark.asyncio
     async def test_manager_concurrent_handshakes(self, node_id, shared_seed):
         """Test manager handles multiple concurrent handshakes."""
         stc_wrapper = STCWrapper(shared_seed)
@@ -537,6 +539,17 @@ class TestHandshakeManager:
         
         assert len(manager.active_handshakes) == 4
     
+    def test_manager_derive_commitments(self, node_id, shared_seed):
+        """Test batch commitment derivation preserves order and count."""
+        manager = HandshakeManager(node_id=node_id, stc_wrapper=STCWrapper(shared_seed))
+        messages = [node_id + bytes([i]) * 32 for i in range(4)]
+        
+        commitments = manager.derive_commitments(messages)
+        
+        assert len(commitments) == 4
+        assert all(isinstance(c, bytes) and len(c) > 0 for c in commitments)
+        assert manager.derive_commitments([]) == []
+    
     def test_handshake_session_key_derivation(self, initiator_node_id, shared_seed):
         """Test session key is derived correctly."""
         responder_stc = STCWrapper(shared_seed)
@@ -578,7 +591,6 @@ class TestHandshakeManager:
         
         assert initiator.completed is True
     
-    @pytest.mark.asyncio
     async def test_handshake_manager_complete_no_active(self, initiator_node_id, shared_seed):
         """Test complete_handshake with no active handshake."""
         stc = STCWrapper(shared_seed)
@@ -644,7 +656,6 @@ class TestHandshakeManager:
         with pytest.raises(Exception):
             initiator.process_final(b"invalid_final")
     
-    @pytest.mark.asyncio
     async def test_handshake_manager_handle_incoming_invalid(self, initiator_node_id, shared_seed):
         """Test handle_incoming with invalid data."""
         stc = STCWrapper(shared_seed)
@@ -657,7 +668,6 @@ class TestHandshakeManager:
         except Exception:
             pass  # Expected to fail
     
-    @pytest.mark.asyncio
     async def test_handshake_manager_complete_handshake_async(self, initiator_node_id, shared_seed):
         """Test async complete_handshake method."""
         stc = STCWrapper(shared_seed)
@@ -671,7 +681,6 @@ class TestHandshakeManager:
         await manager.complete_handshake(peer_addr)  # Test completion path
         # Result might be None if not fully completed
     
-    @pytest.mark.asyncio
     async def test_handshake_manager_is_complete(self, initiator_node_id, shared_seed):
         """Test is_handshake_complete method."""
         stc = STCWrapper(shared_seed)
@@ -688,7 +697,6 @@ class TestHandshakeManager:
         # Still not complete
         assert not manager.is_handshake_complete(peer_addr)
     
-    @pytest.mark.asyncio
     async def test_handshake_manager_get_session_id_async(self, initiator_node_id, shared_seed):
         """Test async get_session_id_async method."""
         stc = STCWrapper(shared_seed)
@@ -703,7 +711,6 @@ class TestHandshakeManager:
         await manager.get_session_id_async(peer_addr)  # Test async method
         # Could be None if handshake not completed - this is expected
     
-    @pytest.mark.asyncio
     async def test_handshake_cleanup_expired(self, initiator_node_id, shared_seed):
         """Test cleanup of expired handshakes."""
         stc = STCWrapper(shared_seed)
@@ -717,7 +724,6 @@ class TestHandshakeManager:
         if hasattr(manager, 'cleanup_expired'):
             await manager.cleanup_expired()
     
-    @pytest.mark.asyncio
     async def test_handshake_timeout_handling(self, initiator_node_id, shared_seed):
         """Test handshake timeout handling."""
         stc = STCWrapper(shared_seed)
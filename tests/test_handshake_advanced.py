@@ -185,7 +185,6 @@ class TestHandshakeGetters:
 class TestHandshakeManagerOperations:
     """Test HandshakeManager operations."""
     
-    @pytest.mark.asyncio
     async def test_initiate_handshake_async_version(self):
         """Test async initiate_handshake method."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -212,7 +211,6 @@ class TestHandshakeManagerOperations:
         assert response is not None
         assert b'\xBB' * 8 in mgr.active_handshakes
     
-    @pytest.mark.asyncio
     async def test_complete_handshake_no_active(self):
         """Test complete_handshake fails when no active handshake."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -224,7 +222,6 @@ class TestHandshakeManagerOperations:
         session_id = await mgr.complete_handshake(peer_addr)
         assert session_id is None
     
-    @pytest.mark.asyncio
     async def test_complete_handshake_success(self):
         """Test complete_handshake with async manager."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -295,7 +292,6 @@ class TestHandshakeManagerOperations:
 class TestHandshakeManagerAsync:
     """Test HandshakeManager async methods."""
     
-    @pytest.mark.asyncio
     async def test_initiate_handshake_async(self):
         """Test async initiate_handshake method."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -308,7 +304,6 @@ class TestHandshakeManagerAsync:
         assert handshake is not None
         assert peer_addr in mgr.active_handshakes
     
-    @pytest.mark.asyncio
     async def test_handle_incoming_hello(self):
         """Test async handle_incoming with HELLO message."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -326,7 +321,6 @@ class TestHandshakeManagerAsync:
         assert response is not None
         assert peer_addr in mgr.active_handshakes
     
-    @pytest.mark.asyncio
     async def test_handle_incoming_response(self):
         """Test async handle_incoming with RESPONSE message."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -348,7 +342,6 @@ class TestHandshakeManagerAsync:
         # Should return AUTH_PROOF or session ID
         assert result is not None
     
-    @pytest.mark.asyncio
     async def test_handle_incoming_auth_proof(self):
         """Test async handle_incoming with AUTH_PROOF message."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -163,7 +163,6 @@ class TestChamberErrorPaths:
 class TestWebSocketErrorPaths:
     """Test WebSocket error paths."""
     
-    @pytest.mark.asyncio
     async def test_websocket_connect_failure(self):
         """Test WebSocket client connection failure."""
         from seigr_toolset_transmissions.transport.websocket import WebSocketTransport
@@ -188,7 +187,6 @@ class TestWebSocketErrorPaths:
 class TestStreamErrorPaths:
     """Test Stream error paths."""
     
-    @pytest.mark.asyncio
     async def test_stream_send_after_close(self):
         """Test sending data on closed stream."""
         from seigr_toolset_transmissions.stream import STTStream
@@ -290,7 +288,6 @@ class TestHandshakeErrorPaths:
 class TestStreamManagerErrorPaths:
     """Test StreamManager error paths."""
     
-    @pytest.mark.asyncio
     async def test_stream_manager_auto_increment(self):
         """Test stream manager auto-incrementing stream IDs."""
         from seigr_toolset_transmissions.stream.stream_manager import StreamManager
@@ -309,7 +306,6 @@ class TestStreamManagerErrorPaths:
         # Verify they have different IDs
         assert stream1.stream_id != stream2.stream_id
     
-    @pytest.mark.asyncio
     async def test_stream_receive_after_close(self):
         """Test receiving data on closed stream."""
         from seigr_toolset_transmissions.stream import STTStream
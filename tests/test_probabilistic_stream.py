@@ -47,6 +47,20 @@ def test_shannon_entropy_zero():
     assert entropy == 0.0
 
 
+def test_shannon_entropy_single_byte_skips_histogram():
+    """Single repeated byte short-circuits before the histogram pass."""
+    target = 'seigr_toolset_transmissions.stream.probabilistic_stream._histogram_and_entropy'
+    with patch(target) as histogram:
+        assert shannon_entropy(b'\xff' * 4096) == 0.0
+        histogram.assert_not_called()
+
+
+def test_shannon_entropy_memoryview():
+    """memoryview input gives the same entropy as bytes."""
+    assert shannon_entropy(memoryview(b'abcabc')) == shannon_entropy(b'abcabc')
+    assert shannon_entropy(memoryview(b'\x00' * 64)) == 0.0
+
+
 def test_shannon_entropy_maximum():
     """Test entropy of random data (maximum entropy)."""
     # Uniform distribution across all 256 bytes
@@ -106,11 +120,23 @@ def test_delivery_probability_low_entropy(prob_stream):
     assert prob <= 0.80  # Low entropy = can lose
 
 
+def test_entropy_cached_per_segment_content(prob_stream):
+    """Test entropy is computed once per distinct segment content."""
+    segment = bytes(range(256)) * 2  # short tail segment: generic entropy path
+    target = 'seigr_toolset_transmissions.stream.probabilistic_stream._histogram_and_entropy'
+    
+    with patch(target, return_value=(None, 8.0)) as entropy_fn:
+        first = prob_stream.calculate_delivery_probability(segment)
+        second = prob_stream.calculate_delivery_probability(bytes(segment))
+    
+    assert first == second
+    assert entropy_fn.call_count == 1
+
+
 # DHT replication test REMOVED - STT is transmission only (no external dependencies)
 # Replication tracking belongs in STSyndicate application layer
 
 
-@pytest.mark.asyncio
 async def test_send_probabilistic_basic(prob_stream):
     """Test basic probabilistic send."""
     data = b'test data' * 100
@@ -125,7 +151,6 @@ async def test_send_probabilistic_basic(prob_stream):
     assert prob_stream.bytes_sent == len(data)
 
 
-@pytest.mark.asyncio
 async def test_send_probabilistic_chunks_data(prob_stream):
     """Test data is properly segmented."""
     data = b'x' * 10000  # 10KB
@@ -137,7 +162,6 @@ async def test_send_probabilistic_chunks_data(prob_stream):
     assert all(len(s) == segment_size for s in segments[:-1])
 
 
-@pytest.mark.asyncio
 async def test_send_probabilistic_retry_logic(prob_stream):
     """Test adaptive retry with backoff."""
     data = b'test' * 256
@@ -154,15 +178,14 @@ async def test_send_probabilistic_retry_logic(prob_stream):
     
     prob_stream._try_send_segment = mock_try_send
     
-    # Patch secrets to prevent early exit (always retry)
-    with patch('seigr_toolset_transmissions.stream.probabilistic_stream.secrets.randbelow', return_value=0):
+    # Patch exit draws to prevent early exit (always retry)
+    with patch('seigr_toolset_transmissions.stream.probabilistic_stream._exit_draws', side_effect=lambda n: [0.0] * n):
         await prob_stream.send_probabilistic(data)  # Tests retry logic
     
     # At least one segment should have made multiple attempts (2 or more)
     assert max(segment_attempts.values()) >= 2, f"Max attempts: {max(segment_attempts.values())}"
 
 
-@pytest.mark.asyncio
 async def test_send_probabilistic_early_exit(prob_stream):
     """Test probabilistic early exit on low-priority segments."""
     # Low entropy data (allows early exit)
@@ -171,15 +194,14 @@ async def test_send_probabilistic_early_exit(prob_stream):
     # Always fail send attempts
     prob_stream._try_send_segment = AsyncMock(return_value=False)
     
-    # Patch secrets to force early exits (return high value to make ratio > 0.5)
-    with patch('seigr_toolset_transmissions.stream.probabilistic_stream.secrets.randbelow', return_value=999999):
+    # Patch exit draws to force early exits (draws above any delivery probability)
+    with patch('seigr_toolset_transmissions.stream.probabilistic_stream._exit_draws', side_effect=lambda n: [0.999999] * n):
         await prob_stream.send_probabilistic(data)  # Tests early exit logic
     
     # Should have early exits (not all segments delivered)
     assert prob_stream.probabilistic_exits > 0
 
 
-@pytest.mark.asyncio
 async def test_send_probabilistic_metadata_tracking(prob_stream):
     """Test segment metadata is properly tracked."""
     data = b'test' * 1024
@@ -199,6 +221,265 @@ async def test_send_probabilistic_metadata_tracking(prob_stream):
         assert metadata.attempts > 0
 
 
+async def test_send_probabilistic_attempt_timeout(prob_stream):
+    """Test a hung send attempt times out instead of stalling the stream."""
+    import asyncio
+    
+    release = asyncio.Event()
+    
+    async def hung_send(segment, idx):
+        await release.wait()
+        return True
+    
+    prob_stream._try_send_segment = hung_send
+    prob_stream._latency.max_timeout = 0.01
+    
+    with patch('seigr_toolset_transmissions.stream.probabilistic_stream._exit_draws', side_effect=lambda n: [0.999999] * n):
+        delivered = await prob_stream.send_probabilistic(b'\x00' * 100)
+    
+    assert delivered == 0
+    assert prob_stream.segment_metadata[0].delivered is False
+    
+    release.set()
+    await asyncio.gather(*prob_stream._background_sends)
+
+
+async def test_send_timeout_recorded_as_latency(prob_stream):
+    """Test a timed-out attempt feeds its timeout into the latency samples."""
+    import asyncio
+    
+    release = asyncio.Event()
+    
+    async def hung_send(segment, idx):
+        await release.wait()
+        return True
+    
+    prob_stream._try_send_segment = hung_send
+    prob_stream._latency.max_timeout = 0.01
+    
+    assert await prob_stream._send_with_timeout(b'\x00', 0, 0) is False
+    assert list(prob_stream._latency._samples) == [0.01]
+    
+    release.set()
+    await asyncio.gather(*prob_stream._background_sends)
+
+
+async def test_timed_out_send_is_not_cancelled(prob_stream):
+    """Test a timeout abandons the wait but lets the write run to completion."""
+    import asyncio
+    
+    release = asyncio.Event()
+    written = []
+    
+    async def slow_send(segment, idx):
+        await release.wait()
+        written.append(segment)
+        return True
+    
+    prob_stream._try_send_segment = slow_send
+    prob_stream._latency.max_timeout = 0.01
+    
+    assert await prob_stream._send_with_timeout(b'\x01\x02', 0, 0) is False
+    assert len(prob_stream._background_sends) == 1
+    
+    release.set()
+    await asyncio.gather(*prob_stream._background_sends)
+    await asyncio.sleep(0)
+    
+    assert written == [b'\x01\x02']
+    assert not prob_stream._background_sends
+
+
+async def test_send_probabilistic_bounded_concurrency(prob_stream):
+    """Test segments are sent concurrently, never more than max_inflight."""
+    import asyncio
+    
+    inflight = 0
+    peak = 0
+    
+    async def tracking_send(segment, idx):
+        nonlocal inflight, peak
+        inflight += 1
+        peak = max(peak, inflight)
+        await asyncio.sleep(0.005)
+        inflight -= 1
+        return True
+    
+    prob_stream.max_inflight = 3
+    prob_stream._try_send_segment = tracking_send
+    
+    delivered = await prob_stream.send_probabilistic(b'\x00' * 1024 * 10)
+    
+    assert delivered == 10
+    assert peak == 3
+    assert sorted(prob_stream.delivered_segments) == list(range(10))
+
+
+async def test_send_probabilistic_fixed_worker_pool(prob_stream):
+    """Test task count stays at max_inflight rather than one per segment."""
+    import asyncio
+    
+    peak_tasks = 0
+    
+    async def counting_send(segment, idx):
+        nonlocal peak_tasks
+        peak_tasks = max(peak_tasks, len(asyncio.all_tasks()))
+        await asyncio.sleep(0)
+        return True
+    
+    prob_stream.max_inflight = 2
+    prob_stream._try_send_segment = counting_send
+    
+    delivered = await prob_stream.send_probabilistic(b'\x00' * 1024 * 50)
+    
+    assert delivered == 50
+    # Test task + 2 workers + one in-flight send per worker
+    assert peak_tasks <= 5
+
+
+async def test_send_probabilistic_failure_cancels_workers(prob_stream):
+    """Test one failing segment cancels the segments still being sent."""
+    import asyncio
+    
+    async def failing_send(segment, idx):
+        if idx == 0:
+            raise RuntimeError("transport down")
+        await asyncio.sleep(10)
+        return True
+    
+    prob_stream.max_inflight = 3
+    prob_stream._try_send_segment = failing_send
+    
+    with pytest.raises(RuntimeError, match="transport down"):
+        await prob_stream.send_probabilistic(b'\x00' * 1024 * 10)
+    
+    # Workers stopped before picking up any further segment; the shielded
+    # writes they abandoned are cleaned up here
+    assert prob_stream.segment_metadata.keys() == {0, 1, 2}
+    assert len(prob_stream._background_sends) == 2
+    for send in list(prob_stream._background_sends):
+        send.cancel()
+    await asyncio.gather(*prob_stream._background_sends, return_exceptions=True)
+    assert not any(m.delivered for m in prob_stream.segment_metadata.values())
+
+
+def test_adaptive_timeout_selection():
+    """Test timeout falls back to max, then tracks observed latency."""
+    from seigr_toolset_transmissions.stream.probabilistic_stream import _AdaptiveTimeout
+    
+    timeout = _AdaptiveTimeout(safety=2.0, min_timeout=0.05, max_timeout=5.0, min_samples=20)
+    assert timeout.select(0) == 5.0
+    
+    for _ in range(20):
+        timeout.record(0.1)
+    
+    assert timeout.select(0) == pytest.approx(0.2)
+    assert timeout.select(1) == pytest.approx(0.4)
+    assert timeout.select(10) == 5.0
+
+
+def test_adaptive_timeout_floor_and_cached_p99():
+    """Test the default floor holds and p99 is only re-sorted after record()."""
+    from seigr_toolset_transmissions.stream.probabilistic_stream import (
+        MIN_SEND_TIMEOUT,
+        _AdaptiveTimeout,
+    )
+    
+    timeout = _AdaptiveTimeout(min_samples=20)
+    for _ in range(20):
+        timeout.record(0.001)
+    
+    with patch('seigr_toolset_transmissions.stream.probabilistic_stream.sorted',
+               side_effect=sorted, create=True) as sorter:
+        assert timeout.select(0) == MIN_SEND_TIMEOUT
+        assert timeout.select(1) == MIN_SEND_TIMEOUT
+        assert sorter.call_count == 1
+        
+        timeout.record(0.002)
+        timeout.select(0)
+        assert sorter.call_count == 2
+
+
+def test_plan_segments(prob_stream):
+    """Test per-segment delivery plan is computed before sending."""
+    data = bytes(range(256)) * 4 + b'\x00' * 1024 + b'\x00' * 10
+    
+    plan = prob_stream._plan_segments(data)
+    
+    assert [offset for offset, *_ in plan] == [0, 1024, 2048]
+    high, low, tail = plan
+    assert high[2] == 0.99 and high[3] == 7
+    assert low[1] == 0.0 and low[2] == 0.70 and low[3] == 2
+    assert tail[2] == 0.70
+
+
+def test_plan_segments_uses_delivery_probability_hook(prob_stream):
+    """Test overriding calculate_delivery_probability drives the plan."""
+    data = bytes(range(256)) * 4 + b'\x00' * 1024
+    
+    with patch.object(prob_stream, 'calculate_delivery_probability', return_value=0.5) as hook:
+        plan = prob_stream._plan_segments(data)
+    
+    assert hook.call_count == 2
+    assert [prob for _, _, prob, _ in plan] == [0.5, 0.5]
+    assert [attempts for *_, attempts in plan] == [1, 1]
+    assert plan[1][1] == 0.0
+
+
+def test_plan_segments_hashes_each_segment_once(prob_stream):
+    """Test planning digests and scans every segment exactly once."""
+    import hashlib
+    
+    data = bytes(range(256)) * 4 + b'hello world ' * 85 + b'abcd' + b'\x07' * 10
+    module = 'seigr_toolset_transmissions.stream.probabilistic_stream'
+    
+    with patch(f'{module}.hashlib.blake2b', side_effect=hashlib.blake2b) as digest, \
+            patch(f'{module}._is_single_byte', side_effect=lambda d: len(set(d)) == 1) as scan:
+        plan = prob_stream._plan_segments(data)
+    
+    assert len(plan) == 3
+    assert digest.call_count == 3
+    assert scan.call_count == 3
+    assert [entry[1] for entry in plan] == [
+        pytest.approx(shannon_entropy(data[offset:offset + 1024]), abs=1e-12)
+        for offset in (0, 1024, 2048)
+    ]
+
+
+def test_table_entropy_matches_shannon(prob_stream):
+    """Test full-segment table entropy equals shannon_entropy."""
+    import os
+    
+    assert prob_stream._entropy_terms is not None
+    for segment in (os.urandom(1024), b'hello world ' * 85 + b'abcd', b'\x00' * 1024):
+        assert len(segment) == prob_stream.segment_size
+        expected = shannon_entropy(segment)
+        assert prob_stream._segment_entropy(segment) == pytest.approx(expected, abs=1e-12)
+
+
+def test_default_segment_size_uses_table(mock_stc):
+    """Test the default 16KB segment size gets a precomputed table."""
+    import os
+    
+    stream = ProbabilisticStream(session_id=b'\x01' * 8, stream_id=1, stc_wrapper=mock_stc)
+    
+    assert stream._entropy_terms is not None
+    segment = os.urandom(stream.segment_size)
+    expected = shannon_entropy(segment)
+    assert stream._segment_entropy(segment) == pytest.approx(expected, abs=1e-12)
+
+
+def test_exit_draws_range():
+    """Test batched early-exit draws are uniform floats in [0, 1)."""
+    from seigr_toolset_transmissions.stream.probabilistic_stream import _exit_draws
+    
+    draws = _exit_draws(64)
+    
+    assert len(draws) == 64
+    assert all(0.0 <= d < 1.0 for d in draws)
+    assert _exit_draws(0) == []
+
+
 def test_get_delivery_stats(prob_stream):
     """Test delivery statistics reporting."""
     # Setup some metadata
@@ -245,7 +526,6 @@ def test_get_segment_report(prob_stream):
     assert report[1]['delivered'] == False
 
 
-@pytest.mark.asyncio
 async def test_high_entropy_gets_more_attempts(prob_stream):
     """Test high entropy segments get more retry attempts."""
     # High entropy segment
@@ -258,7 +538,7 @@ async def test_high_entropy_gets_more_attempts(prob_stream):
     prob_stream._try_send_segment = AsyncMock(return_value=False)
     
     # Force no early exits
-    with patch('seigr_toolset_transmissions.stream.probabilistic_stream.secrets.randbelow', return_value=0):
+    with patch('seigr_toolset_transmissions.stream.probabilistic_stream._exit_draws', side_effect=lambda n: [0.0] * n):
         await prob_stream.send_probabilistic(high_entropy)
         high_entropy_attempts = sum(m.attempts for m in prob_stream.segment_metadata.values())
         
@@ -271,6 +551,18 @@ async def test_high_entropy_gets_more_attempts(prob_stream):
     assert high_entropy_attempts >= low_entropy_attempts
 
 
+def test_segment_metadata_is_slotted():
+    """Test SegmentMetadata carries no per-instance __dict__."""
+    metadata = SegmentMetadata(
+        segment_idx=0, entropy=0.5, delivery_prob=0.8,
+        replication=0, attempts=1, delivered=False
+    )
+    
+    assert not hasattr(metadata, '__dict__')
+    metadata.attempts += 1
+    assert metadata.attempts == 2
+
+
 def test_stream_mode_is_probabilistic(prob_stream):
     """Test stream mode is set correctly."""
     assert prob_stream.mode == 'probabilistic'
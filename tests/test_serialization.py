@@ -255,6 +255,52 @@ class TestSTTSerializer:
         
         assert deserialized == data
     
+    def test_serialize_homogeneous_int_list_packed(self):
+        """Test long all-int lists use the narrowest typed array."""
+        from seigr_toolset_transmissions.utils.serialization import STTType
+        
+        data = list(range(-100, 100))
+        serialized = STTSerializer.serialize(data, typed_arrays=True)
+        
+        assert serialized[0] == STTType.INT_ARRAY
+        assert serialized[1] == STTType.INT8
+        assert len(serialized) == 1 + 1 + 4 + len(data)
+        assert STTSerializer.deserialize(serialized) == data
+    
+    def test_serialize_homogeneous_float_list_packed(self):
+        """Test long all-float lists roundtrip as a typed array."""
+        from seigr_toolset_transmissions.utils.serialization import STTType
+        
+        data = [i / 3 for i in range(32)]
+        serialized = STTSerializer.serialize(data, typed_arrays=True)
+        
+        assert serialized[0] == STTType.FLOAT64_ARRAY
+        assert STTSerializer.deserialize(serialized) == data
+    
+    def test_serialize_mixed_list_not_packed(self):
+        """Test bools and mixed lists keep per-element encoding."""
+        from seigr_toolset_transmissions.utils.serialization import STTType
+        
+        for data in ([True] * 20, [1] * 19 + [1.0], [1, 2, 3]):
+            serialized = STTSerializer.serialize(data, typed_arrays=True)
+            assert serialized[0] == STTType.LIST
+            result = STTSerializer.deserialize(serialized)
+            assert result == data
+            assert [type(x) for x in result] == [type(x) for x in data]
+    
+    def test_typed_arrays_off_by_default(self):
+        """Test default encoding stays decodable by peers without typed arrays."""
+        from seigr_toolset_transmissions.utils.serialization import STTType
+        
+        for data in (list(range(32)), [i / 3 for i in range(32)]):
+            serialized = STTSerializer.serialize(data)
+            assert serialized[0] == STTType.LIST
+            assert STTSerializer.deserialize(serialized) == data
+            
+            packed = STTSerializer.serialize(data, typed_arrays=True)
+            assert serialized[0] != packed[0]
+            assert STTSerializer.deserialize(packed) == data
+    
     def test_serialize_deeply_nested(self):
         """Test serializing deeply nested structure."""
         data = {"level": 1}
@@ -270,6 +316,25 @@ class TestSTTSerializer:
         
         assert deserialized == data
     
+    def test_serialize_recursive_container_rejected(self):
+        """Test self-referencing lists and dicts raise instead of looping."""
+        looped_list = [1, 2]
+        looped_list.append(looped_list)
+        
+        looped_dict = {"a": 1}
+        looped_dict["self"] = {"inner": looped_dict}
+        
+        for data in (looped_list, looped_dict):
+            with pytest.raises(STTSerializationError, match="recursive"):
+                STTSerializer.serialize(data)
+        
+    def test_serialize_shared_container(self):
+        """Test a container reused by siblings is not mistaken for a cycle."""
+        shared = {"x": [1, 2]}
+        data = {"a": shared, "b": shared, "c": [shared, shared]}
+        
+        assert STTSerializer.deserialize(STTSerializer.serialize(data)) == data
+    
     def test_binary_format_efficiency(self):
         """Test that binary format is reasonably efficient."""
         data = {"key": "value"}
@@ -413,6 +478,51 @@ class TestSTTSerializer:
         deserialized = STTSerializer.deserialize(serialized)
         assert deserialized == data
     
+    def test_serialize_nesting_beyond_recursion_limit(self):
+        """Test nesting deeper than the interpreter recursion limit."""
+        import sys
+        
+        depth = sys.getrecursionlimit() + 500
+        data = []
+        current = data
+        for _ in range(depth):
+            inner = []
+            current.append(inner)
+            current = inner
+        
+        serialized = STTSerializer.serialize(data)
+        deserialized = STTSerializer.deserialize(serialized)
+        
+        levels = 0
+        while deserialized:
+            deserialized = deserialized[0]
+            levels += 1
+        assert levels == depth
+    
+    def test_deserialize_truncated_fixed_width(self):
+        """Test truncated fixed-width fields raise STTSerializationError."""
+        serialized = STTSerializer.serialize({"key": 2**40})
+        
+        with pytest.raises(STTSerializationError):
+            STTSerializer.deserialize(serialized[:-3])
+    
+    def test_serialize_subclasses_use_base_encoding(self):
+        """Test subclasses of supported types encode like their base type."""
+        from collections import OrderedDict
+        from enum import IntEnum
+        
+        class Color(IntEnum):
+            RED = 1
+        
+        assert STTSerializer.serialize(Color.RED) == STTSerializer.serialize(1)
+        assert STTSerializer.serialize(OrderedDict(b=1, a=2)) == STTSerializer.serialize({"a": 2, "b": 1})
+        assert STTSerializer.serialize(True) != STTSerializer.serialize(1)
+    
+    def test_serialize_tuple_unsupported(self):
+        """Test tuples raise STTSerializationError."""
+        with pytest.raises(STTSerializationError, match="Cannot serialize type"):
+            STTSerializer.serialize((1, 2))
+    
     def test_serialize_large_integers(self):
         """Test serializing very large integers."""
         large_int = 2**50
@@ -160,7 +160,6 @@ class TestSessionManager:
         """Create session manager."""
         return SessionManager(node_id=node_id, stc_wrapper=stc_wrapper)
     
-    @pytest.mark.asyncio
     async def test_create_session(self, manager):
         """Test creating a session through manager."""
         session_id = b'\x01' * 8
@@ -175,7 +174,6 @@ class TestSessionManager:
         assert session.session_id == session_id
         assert manager.has_session(session_id)
     
-    @pytest.mark.asyncio
     async def test_get_session(self, manager):
         """Test getting a session."""
         session_id = b'\x02' * 8
@@ -192,7 +190,6 @@ class TestSessionManager:
         
         assert retrieved is created
     
-    @pytest.mark.asyncio
     async def test_close_session(self, manager):
         """Test closing a session through manager."""
         session_id = b'\x03' * 8
@@ -219,7 +216,6 @@ class TestSessionManager:
         assert removed == 1
         assert not manager.has_session(session_id)
     
-    @pytest.mark.asyncio
     async def test_rotate_all_keys(self, manager, stc_wrapper):
         """Test rotating keys for all sessions."""
         # Create multiple sessions
@@ -237,7 +233,27 @@ class TestSessionManager:
             session = manager.get_session(sid)
             assert session.key_version >= 1
     
-    @pytest.mark.asyncio
+    async def test_rotate_all_keys_distinct_nonces(self, manager):
+        """Test each session gets its own rotation nonce from the batch."""
+        from unittest.mock import Mock
+        
+        for idx in range(3):
+            session = await manager.create_session(
+                session_id=bytes([0x20 + idx]) * 8,
+                peer_node_id=bytes([0x30 + idx]) * 32,
+            )
+            session.session_key = b'\x00' * 32
+        
+        wrapper = Mock()
+        wrapper.rotate_session_key = Mock(return_value=b'\x11' * 32)
+        
+        await manager.rotate_all_keys(wrapper)
+        
+        nonces = [call.args[1] for call in wrapper.rotate_session_key.call_args_list]
+        assert len(nonces) == 3
+        assert all(len(nonce) == 32 for nonce in nonces)
+        assert len(set(nonces)) == 3
+    
     async def test_list_sessions(self, manager):
         """Test listing all sessions."""
         # Create sessions
@@ -252,7 +268,6 @@ class TestSessionManager:
         assert len(sessions) == 2
         assert all(s.is_active for s in sessions)
     
-    @pytest.mark.asyncio
     async def test_cleanup_inactive_sessions(self, manager):
         """Test cleaning up inactive sessions."""
         # Create and close session
@@ -273,7 +288,6 @@ class TestSessionManager:
         assert removed == 1
         assert not manager.has_session(session_id)
     
-    @pytest.mark.asyncio
     async def test_session_timeout(self, manager):
         """Test session timeout handling."""
         session_id = b'\x0a' * 8
@@ -294,7 +308,6 @@ class TestSessionManager:
         
         assert removed >= 1
     
-    @pytest.mark.asyncio
     async def test_concurrent_session_creation(self, manager):
         """Test creating sessions concurrently."""
         async def create(idx):
@@ -381,6 +394,42 @@ class TestSessionManager:
                 stc_wrapper=stc_wrapper,
             )
     
+    def test_session_throughput_window(self, session_id, peer_node_id, stc_wrapper):
+        """Test throughput counts only frames inside the window."""
+        from unittest.mock import patch
+        
+        session = Session(
+            session_id=session_id,
+            peer_node_id=peer_node_id,
+            stc_wrapper=stc_wrapper,
+        )
+        
+        with patch('time.time', return_value=100.0):
+            session.record_frame_sent(1000)
+        with patch('time.time', return_value=105.0):
+            session.record_frame_sent(500)
+        
+        # At t=110 the t=100 frame has aged out of the 10s window
+        with patch('time.time', return_value=110.0):
+            assert session.get_current_throughput() == 100.0
+        
+        with patch('time.time', return_value=120.0):
+            assert session.get_current_throughput() == 0.0
+        assert len(session.throughput_window) == 0
+    
+    def test_session_id_normalized_to_bytes(self, peer_node_id, stc_wrapper):
+        """Test bytearray/memoryview session IDs are stored as bytes."""
+        raw = bytearray(b'\x01' * 8)
+        session = Session(
+            session_id=memoryview(raw),
+            peer_node_id=peer_node_id,
+            stc_wrapper=stc_wrapper,
+        )
+        
+        raw[0] = 0xff
+        assert type(session.session_id) is bytes
+        assert session.session_id == b'\x01' * 8
+    
     def test_session_key_version_increment(self, session_id, peer_node_id, stc_wrapper):
         """Test key version increments on rotation."""
         session = Session(
@@ -410,7 +459,6 @@ class TestSessionManager:
         session.close()
         assert session.is_closed()
     
-    @pytest.mark.asyncio
     async def test_manager_duplicate_session_id(self, manager):
         """Test creating session with duplicate ID raises error."""
         session_id = b'\xAA' * 8
@@ -422,7 +470,6 @@ class TestSessionManager:
         with pytest.raises(STTSessionError, match="already exists"):
             await manager.create_session(session_id, peer_id)
     
-    @pytest.mark.asyncio
     async def test_manager_get_nonexistent_session(self, manager):
         """Test getting nonexistent session returns None."""
         session_id = b'\xCC' * 8
@@ -430,7 +477,6 @@ class TestSessionManager:
         session = manager.get_session(session_id)
         assert session is None
     
-    @pytest.mark.asyncio
     async def test_manager_close_nonexistent_session(self, manager):
         """Test closing nonexistent session handles gracefully."""
         session_id = b'\xDD' * 8
@@ -453,6 +499,8 @@ class TestSessionManager:
         # Just check that string representation exists
         assert str_repr is not None
         assert len(str_repr) > 0
+        assert session_id.hex() in repr(session)
+        assert session.get_stats()['session_id'] == session_id.hex()
     
     def test_session_capabilities(self, session_id, peer_node_id, stc_wrapper):
         """Test session capabilities field if supported."""
@@ -531,6 +579,22 @@ class TestSessionManager:
         if hasattr(session, 'last_activity'):
             assert session.last_activity is not None
     
+    def test_session_uses_slots(self, session_id, peer_node_id, stc_wrapper):
+        """Test sessions carry no per-instance __dict__."""
+        session = Session(
+            session_id=session_id,
+            peer_node_id=peer_node_id,
+            stc_wrapper=stc_wrapper,
+        )
+        
+        assert not hasattr(session, '__dict__')
+        with pytest.raises(AttributeError):
+            session.unknown_attribute = 1
+        
+        # Legacy _last_activity name writes through to last_activity
+        session._last_activity = 0
+        assert session.last_activity == 0
+    
     def test_session_is_expired(self, session_id, peer_node_id, stc_wrapper):
         """Test session expiration check."""
         session = Session(
@@ -563,13 +627,11 @@ class TestSessionManager:
         if hasattr(session, 'record_sent_bytes'):
             session.record_sent_bytes(1000000)
     
-    @pytest.mark.asyncio
     async def test_session_manager_invalid_node_id(self, stc_wrapper):
         """Test session manager with invalid node ID."""
         with pytest.raises(STTSessionError, match="32 bytes"):
             SessionManager(b"short", stc_wrapper)
     
-    @pytest.mark.asyncio
     async def test_session_manager_get_session_by_peer(self, stc_wrapper):
         """Test getting session by peer node ID."""
         manager = SessionManager(b'\xbb' * 32, stc_wrapper)
@@ -588,7 +650,23 @@ class TestSessionManager:
         not_found = await manager.find_session_by_peer(peer2)
         assert not_found is None
     
-    @pytest.mark.asyncio
+    async def test_find_session_by_peer_after_cleanup(self, stc_wrapper):
+        """Test peer index skips closed sessions and drops cleaned ones."""
+        manager = SessionManager(b'\xbb' * 32, stc_wrapper)
+        peer = b'\xcc' * 32
+        
+        first = await manager.create_session(b'\x01' * 8, peer)
+        second = await manager.create_session(b'\x02' * 8, peer)
+        assert await manager.find_session_by_peer(peer) is first
+        
+        await manager.close_session(first.session_id)
+        assert await manager.find_session_by_peer(peer) is second
+        
+        await manager.close_session(second.session_id)
+        assert await manager.cleanup_closed_sessions() == 2
+        assert await manager.find_session_by_peer(peer) is None
+        assert manager._by_peer == {}
+    
     async def test_session_manager_stats(self, stc_wrapper):
         """Test session manager statistics."""
         manager = SessionManager(b'\xee' * 32, stc_wrapper)
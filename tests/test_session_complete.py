@@ -56,7 +56,6 @@ class TestSessionMethods:
 class TestSessionKeyRotation:
     """Test async key rotation."""
     
-    @pytest.mark.asyncio
     async def test_rotate_key_with_existing_key(self):
         """Test rotating existing session key."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -74,7 +73,6 @@ class TestSessionKeyRotation:
         assert session.key_version == initial_version + 1
         assert stc.rotate_session_key.called
     
-    @pytest.mark.asyncio
     async def test_rotate_key_without_existing_key(self):
         """Test rotating when no session key exists yet."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -140,7 +138,6 @@ class TestSessionRecordingMethods:
 class TestSessionManagerOperations:
     """Test SessionManager operations."""
     
-    @pytest.mark.asyncio
     async def test_create_session(self):
         """Test creating a session."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -218,7 +215,6 @@ class TestSessionManagerOperations:
 class TestSessionManagerCleanup:
     """Test SessionManager cleanup operations."""
     
-    @pytest.mark.asyncio
     async def test_cleanup_inactive_sessions(self):
         """Test cleanup removes inactive sessions."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -241,7 +237,6 @@ class TestSessionManagerCleanup:
         assert mgr.has_session(active_id)
         assert not mgr.has_session(inactive_id)
     
-    @pytest.mark.asyncio
     async def test_cleanup_inactive_by_timeout(self):
         """Test cleanup removes sessions by timeout."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -259,7 +254,6 @@ class TestSessionManagerCleanup:
         assert removed == 1
         assert not mgr.has_session(old_id)
     
-    @pytest.mark.asyncio
     async def test_cleanup_expired_alias(self):
         """Test cleanup_expired is alias for cleanup_inactive."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -281,7 +275,6 @@ class TestSessionManagerCleanup:
 class TestSessionManagerKeyRotation:
     """Test SessionManager key rotation."""
     
-    @pytest.mark.asyncio
     async def test_rotate_all_keys_for_active_sessions(self):
         """Test rotating keys for all active sessions."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
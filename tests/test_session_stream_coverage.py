@@ -29,7 +29,6 @@ class TestSessionStreamCoverage:
         session.update_activity()
         assert session.last_activity >= initial
     
-    @pytest.mark.asyncio
     async def test_stream_send(self, stc_wrapper):
         """Test stream send."""
         stream = STTStream(b"stremsnd", 1, stc_wrapper)
@@ -38,7 +37,6 @@ class TestSessionStreamCoverage:
         except Exception:
             pass  # Expected - stream not connected
     
-    @pytest.mark.asyncio
     async def test_stream_receive_closed(self, stc_wrapper):
         """Test receiving on closed stream."""
         stream = STTStream(b"stremrcv", 2, stc_wrapper)
@@ -53,7 +51,6 @@ class TestSessionStreamCoverage:
         stream = STTStream(b"stremwin", 3, stc_wrapper)
         assert stream.receive_window_size > 0
     
-    @pytest.mark.asyncio
     async def test_session_manager_operations(self, stc_wrapper):
         """Test session manager operations."""
         from seigr_toolset_transmissions.session.session_manager import SessionManager
@@ -76,7 +73,6 @@ class TestSessionStreamCoverage:
         assert retrieved is not None
         assert retrieved.session_id == session_id
     
-    @pytest.mark.asyncio
     async def test_stream_manager_operations(self, stc_wrapper):
         """Test stream manager operations."""
         from seigr_toolset_transmissions.stream.stream_manager import StreamManager
@@ -92,7 +88,6 @@ class TestSessionStreamCoverage:
         await manager.close_stream(10)
         assert not stream.is_active
     
-    @pytest.mark.asyncio
     async def test_stream_receive_timeout(self, stc_wrapper):
         """Test stream receive with timeout."""
         from seigr_toolset_transmissions.utils.exceptions import STTStreamError
@@ -102,7 +97,6 @@ class TestSessionStreamCoverage:
         with pytest.raises(STTStreamError):
             await stream.receive(timeout=0.001)
     
-    @pytest.mark.asyncio
     async def test_stream_deliver_data(self, stc_wrapper):
         """Test stream internal data delivery."""
         stream = STTStream(b'\x04' * 8, 2, stc_wrapper)
@@ -227,7 +221,6 @@ class TestSerializationEdgeCases:
 class TestNodeOperations:
     """Test node operations."""
     
-    @pytest.mark.asyncio
     async def test_node_get_stats(self):
         """Test getting node statistics."""
         from seigr_toolset_transmissions.core.node import STTNode
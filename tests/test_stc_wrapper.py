@@ -446,3 +446,13 @@ class TestSTCWrapper:
         ctx2 = stc_wrapper.create_stream_context(session_id, stream_id)
         # Can't guarantee different object, but operation should succeed
         assert ctx2 is not None
+    
+    def test_clear_stream_contexts(self, stc_wrapper):
+        """Test clearing every cached stream context at once."""
+        ctx1 = stc_wrapper.create_stream_context(b'\x0f' * 8, 1)
+        ctx2 = stc_wrapper.create_stream_context(b'\x0f' * 8, 2)
+        
+        stc_wrapper.clear_stream_contexts()
+        
+        assert stc_wrapper.create_stream_context(b'\x0f' * 8, 1) is not ctx1
+        assert stc_wrapper.create_stream_context(b'\x0f' * 8, 2) is not ctx2
@@ -49,7 +49,6 @@ class TestStream:
         assert stream.stream_id == stream_id
         assert stream.is_active is True
     
-    @pytest.mark.asyncio
     async def test_send_data(self, stream):
         """Test sending data on stream."""
         data = b"test message"
@@ -58,7 +57,6 @@ class TestStream:
         
         assert stream.bytes_sent > 0
     
-    @pytest.mark.asyncio
     async def test_receive_data(self, stream):
         """Test receiving data on stream."""
         data = b"incoming data"
@@ -71,7 +69,6 @@ class TestStream:
         
         assert received == data
     
-    @pytest.mark.asyncio
     async def test_ordered_delivery(self, stream):
         """Test that data is delivered in order."""
         messages = [b"first", b"second", b"third"]
@@ -90,7 +87,6 @@ class TestStream:
             received = await stream.receive()
             assert received == expected
     
-    @pytest.mark.asyncio
     async def test_flow_control(self, stream):
         """Test stream flow control."""
         # Fill up receive window
@@ -103,7 +99,6 @@ class TestStream:
         # Should handle backpressure
         assert stream.receive_window_size > 0
     
-    @pytest.mark.asyncio
     async def test_close_stream(self, stream):
         """Test closing a stream."""
         assert stream.is_active is True
@@ -112,7 +107,6 @@ class TestStream:
         
         assert stream.is_active is False
     
-    @pytest.mark.asyncio
     async def test_send_after_close(self, stream):
         """Test sending after stream is closed."""
         await stream.close()
@@ -120,7 +114,6 @@ class TestStream:
         with pytest.raises(STTStreamError):
             await stream.send(b"data")
     
-    @pytest.mark.asyncio
     async def test_stream_statistics(self, stream):
         """Test stream statistics."""
         data = b"test" * 100
@@ -135,7 +128,6 @@ class TestStream:
         assert stats['messages_sent'] >= 1
         assert stats['messages_received'] >= 1
     
-    @pytest.mark.asyncio
     async def test_stream_timeout(self, stream):
         """Test stream timeout handling."""
         # Simulate timeout
@@ -145,7 +137,6 @@ class TestStream:
         
         assert is_expired is True
     
-    @pytest.mark.asyncio
     async def test_duplicate_sequence(self, stream):
         """Test handling duplicate sequence numbers."""
         data = b"message"
@@ -180,7 +171,6 @@ class TestStreamManager:
         """Create stream manager."""
         return StreamManager(session_id=session_id, stc_wrapper=stc_wrapper)
     
-    @pytest.mark.asyncio
     async def test_create_stream(self, manager):
         """Test creating a stream through manager."""
         stream_id = 1
@@ -191,7 +181,6 @@ class TestStreamManager:
         assert stream.stream_id == stream_id
         assert manager.has_stream(stream_id)
     
-    @pytest.mark.asyncio
     async def test_get_stream(self, manager):
         """Test getting a stream."""
         stream_id = 2
@@ -204,7 +193,6 @@ class TestStreamManager:
         
         assert retrieved is created
     
-    @pytest.mark.asyncio
     async def test_close_stream(self, manager):
         """Test closing a stream through manager."""
         stream_id = 3
@@ -227,7 +215,6 @@ class TestStreamManager:
         assert removed == 1
         assert not manager.has_stream(stream_id)
     
-    @pytest.mark.asyncio
     async def test_multiple_streams(self, manager):
         """Test managing multiple streams."""
         stream_ids = [1, 2, 3, 4, 5]
@@ -243,7 +230,6 @@ class TestStreamManager:
         streams = manager.list_streams()
         assert len(streams) == len(stream_ids)
     
-    @pytest.mark.asyncio
     async def test_close_all_streams(self, manager):
         """Test closing all streams."""
         # Create multiple streams
@@ -255,7 +241,6 @@ class TestStreamManager:
         
         assert len(manager.list_streams()) == 0
     
-    @pytest.mark.asyncio
     async def test_cleanup_inactive_streams(self, manager):
         """Test cleaning up inactive streams."""
         # Create and close stream
@@ -269,7 +254,6 @@ class TestStreamManager:
         assert removed == 1
         assert not manager.has_stream(stream_id)
     
-    @pytest.mark.asyncio
     async def test_get_next_stream_id(self, manager):
         """Test getting next available stream ID."""
         # Get current next ID
@@ -283,7 +267,6 @@ class TestStreamManager:
         new_next_id = manager.get_next_stream_id()
         assert new_next_id > next_id  # Should be 3 (increments by 2)
     
-    @pytest.mark.asyncio
     async def test_stream_isolation(self, manager):
         """Test that streams are isolated from each other."""
         stream_1 = await manager.create_stream(1)
@@ -295,7 +278,6 @@ class TestStreamManager:
         # Stream 2 should be empty
         assert stream_2.receive_buffer_empty()
     
-    @pytest.mark.asyncio
     async def test_concurrent_stream_operations(self, manager):
         """Test concurrent operations on different streams."""
         async def send_on_stream(stream_id):
@@ -309,7 +291,6 @@ class TestStreamManager:
         assert all(r > 0 for r in results)
         assert len(manager.list_streams()) == 10
     
-    @pytest.mark.asyncio
     async def test_stream_context_isolation(self, session_id):
         """Test that each stream has isolated STC context."""
         # Create two managers with same session
@@ -325,7 +306,18 @@ class TestStreamManager:
         # They should have different contexts
         assert stream1.stc_context != stream2.stc_context
     
-    @pytest.mark.asyncio
+    def test_stream_context_created_on_first_use(self, session_id):
+        """Test the StreamingContext is derived lazily and only once."""
+        from unittest.mock import Mock
+        
+        wrapper = Mock(spec=STCWrapper)
+        stream = STTStream(session_id, 3, wrapper)
+        wrapper.create_stream_context.assert_not_called()
+        
+        context = stream.stc_context
+        assert stream.stc_context is context
+        wrapper.create_stream_context.assert_called_once_with(session_id, 3)
+    
     async def test_stream_flow_control_windows(self):
         """Test stream flow control window initialization."""
         wrapper = STCWrapper(b"flow_control_32_bytes_minimum!")
@@ -334,7 +326,6 @@ class TestStreamManager:
         assert stream.send_window == 65536
         assert stream.receive_window == 65536
     
-    @pytest.mark.asyncio
     async def test_stream_sequence_tracking(self):
         """Test stream sequence number tracking."""
         wrapper = STCWrapper(b"sequence_track_32_bytes_minimum")
@@ -346,7 +337,6 @@ class TestStreamManager:
         await stream.send(b"test data")
         assert stream.sequence == 1
     
-    @pytest.mark.asyncio
     async def test_stream_buffer_management(self):
         """Test stream buffering."""
         wrapper = STCWrapper(b"buffer_manage_32_bytes_minimum!")
@@ -358,7 +348,6 @@ class TestStreamManager:
         stream.receive_buffer.append(b"data1")
         assert not stream.receive_buffer_empty()
     
-    @pytest.mark.asyncio
     async def test_stream_statistics_increment(self):
         """Test stream statistics increment properly."""
         wrapper = STCWrapper(b"stats_increment_32_bytes_minimum")
@@ -372,7 +361,6 @@ class TestStreamManager:
         assert stream.bytes_sent > initial_sent
         assert stream.messages_sent == initial_msgs + 1
     
-    @pytest.mark.asyncio
     async def test_stream_closed_send_raises(self):
         """Test sending on closed stream raises error."""
         wrapper = STCWrapper(b"closed_stream_32_bytes_minimum!!")
@@ -383,7 +371,6 @@ class TestStreamManager:
         with pytest.raises(STTStreamError, match="Stream is closed"):
             await stream.send(b"data")
     
-    @pytest.mark.asyncio
     async def test_stream_closed_receive_raises(self):
         """Test receiving on closed stream raises error."""
         wrapper = STCWrapper(b"closed_receive_32_bytes_minimum")
@@ -394,7 +381,6 @@ class TestStreamManager:
         with pytest.raises(STTStreamError, match="Stream is closed"):
             await stream.receive()
     
-    @pytest.mark.asyncio
     async def test_stream_out_of_order_buffer(self):
         """Test out-of-order packet buffering."""
         wrapper = STCWrapper(b"out_of_order_32_bytes_minimum!!")
@@ -402,7 +388,6 @@ class TestStreamManager:
         
         assert len(stream.out_of_order_buffer) == 0
     
-    @pytest.mark.asyncio
     async def test_stream_send_without_session(self):
         """Test sending on stream without session."""
         wrapper = STCWrapper(b"no_session_32_bytes_minimum!!!!")
@@ -415,7 +400,6 @@ class TestStreamManager:
         except Exception:
             pass  # Expected if session not configured
     
-    @pytest.mark.asyncio
     async def test_stream_receive_timeout(self):
         """Test receive timeout handling."""
         wrapper = STCWrapper(b"receive_timeout_32_bytes_min!!")
@@ -429,7 +413,6 @@ class TestStreamManager:
         except Exception:
             pass  # Other errors also acceptable
     
-    @pytest.mark.asyncio
     async def test_stream_queue_overflow(self):
         """Test stream queue overflow handling."""
         wrapper = STCWrapper(b"queue_overflow_32_bytes_min!!!")
@@ -443,7 +426,6 @@ class TestStreamManager:
                 except asyncio.QueueFull:
                     break
     
-    @pytest.mark.asyncio
     async def test_stream_invalid_sequence(self):
         """Test handling invalid sequence numbers."""
         wrapper = STCWrapper(b"invalid_seq_32_bytes_minimum!!")
@@ -454,7 +436,6 @@ class TestStreamManager:
             initial_seq = stream.next_recv_seq
             assert initial_seq == 0
     
-    @pytest.mark.asyncio
     async def test_stream_double_close(self):
         """Test closing stream twice."""
         wrapper = STCWrapper(b"double_close_32_bytes_minimum!")
@@ -468,7 +449,6 @@ class TestStreamManager:
         if hasattr(stream, 'state'):
             assert stream.state == STT_STREAM_STATE_CLOSED
     
-    @pytest.mark.asyncio
     async def test_stream_error_state(self):
         """Test stream error state handling."""
         wrapper = STCWrapper(b"error_state_32_bytes_minimum!!")
@@ -479,7 +459,6 @@ class TestStreamManager:
             # State exists, try operations in different states
             await stream.close()
     
-    @pytest.mark.asyncio
     async def test_stream_statistics_edge_cases(self):
         """Test stream statistics with edge cases."""
         wrapper = STCWrapper(b"stats_edge_32_bytes_minimum!!!")
@@ -495,7 +474,6 @@ class TestStreamManager:
         assert stats['bytes_sent'] == 0
         assert stats['bytes_received'] == 0
     
-    @pytest.mark.asyncio
     async def test_stream_manager_get_or_create_existing(self):
         """Test getting existing stream from manager."""
         wrapper = STCWrapper(b"manager_existing_32_bytes_min!")
@@ -509,7 +487,6 @@ class TestStreamManager:
         # Should be same instance
         assert stream1 is stream2
     
-    @pytest.mark.asyncio
     async def test_stream_manager_multiple_streams(self):
         """Test managing multiple concurrent streams."""
         wrapper = STCWrapper(b"manager_multi_32_bytes_minimum")
@@ -525,7 +502,6 @@ class TestStreamManager:
         assert stream2 is not stream3
         assert stream1.stream_id != stream2.stream_id
     
-    @pytest.mark.asyncio
     async def test_stream_manager_close_and_cleanup(self):
         """Test closing streams and cleanup."""
         wrapper = STCWrapper(b"manager_cleanup_32_bytes_min!!")
@@ -16,7 +16,6 @@ class TestStreamAdditional:
         """STC wrapper."""
         return STCWrapper(b"stream_additional_32_bytes!!!!")
     
-    @pytest.mark.asyncio
     async def test_stream_send_data(self, stc_wrapper):
         """Test sending data on stream."""
         stream = STTStream(
@@ -31,7 +30,6 @@ class TestStreamAdditional:
         except Exception:
             pass  # Expected
     
-    @pytest.mark.asyncio
     async def test_stream_receive_data(self, stc_wrapper):
         """Test receiving data on stream."""
         stream = STTStream(
@@ -46,7 +44,6 @@ class TestStreamAdditional:
         except (asyncio.TimeoutError, Exception):
             pass  # Expected
     
-    @pytest.mark.asyncio
     async def test_stream_close(self, stc_wrapper):
         """Test closing stream."""
         stream = STTStream(
@@ -58,7 +55,6 @@ class TestStreamAdditional:
         await stream.close()
         assert stream.is_active is False
     
-    @pytest.mark.asyncio
     async def test_stream_reset(self, stc_wrapper):
         """Test resetting stream."""
         stream = STTStream(
@@ -83,7 +79,6 @@ class TestStreamAdditional:
         assert 'bytes_sent' in stats
         assert 'bytes_received' in stats
     
-    @pytest.mark.asyncio
     async def test_stream_write_eof(self, stc_wrapper):
         """Test writing EOF to stream."""
         stream = STTStream(
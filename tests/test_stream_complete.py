@@ -15,7 +15,6 @@ from seigr_toolset_transmissions.utils.exceptions import STTStreamError
 class TestStreamOutOfOrderHandling:
     """Test stream out-of-order message handling."""
     
-    @pytest.mark.asyncio
     async def test_handle_incoming_in_order(self):
         """Test handling in-order incoming data."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -32,7 +31,6 @@ class TestStreamOutOfOrderHandling:
         data2 = await stream.receive(timeout=0.1)
         assert data2 == b"data2"
     
-    @pytest.mark.asyncio
     async def test_handle_incoming_out_of_order(self):
         """Test handling out-of-order data (future sequence buffered)."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -65,7 +63,6 @@ class TestStreamOutOfOrderHandling:
         # Out-of-order buffer should be empty now
         assert len(stream.out_of_order_buffer) == 0
     
-    @pytest.mark.asyncio
     async def test_handle_incoming_old_sequence_ignored(self):
         """Test old/duplicate sequences are ignored."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -89,7 +86,6 @@ class TestStreamOutOfOrderHandling:
         with pytest.raises(STTStreamError, match="Receive timeout"):
             await stream.receive(timeout=0.05)
     
-    @pytest.mark.asyncio
     async def test_handle_incoming_when_closed(self):
         """Test handling incoming data when stream is closed."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -104,7 +100,6 @@ class TestStreamOutOfOrderHandling:
 class TestStreamReceiveBuffer:
     """Test stream receive buffer operations."""
     
-    @pytest.mark.asyncio
     async def test_receive_clears_event_when_empty(self):
         """Test receive clears event when buffer becomes empty."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -123,7 +118,6 @@ class TestStreamReceiveBuffer:
         # Buffer is now empty, event should be cleared
         assert not stream._receive_event.is_set()
     
-    @pytest.mark.asyncio
     async def test_deliver_data_sets_event(self):
         """Test _deliver_data sets the receive event."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -139,7 +133,6 @@ class TestStreamReceiveBuffer:
         assert stream._receive_event.is_set()
         assert len(stream.receive_buffer) == 1
     
-    @pytest.mark.asyncio
     async def test_receive_returns_empty_when_no_data(self):
         """Test receive returns empty bytes when no data and event not set."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -164,7 +157,6 @@ class TestStreamReceiveBuffer:
 class TestStreamSendOperations:
     """Test stream send operations."""
     
-    @pytest.mark.asyncio
     async def test_send_when_closed(self):
         """Test sending raises error when stream is closed."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -175,7 +167,6 @@ class TestStreamSendOperations:
         with pytest.raises(STTStreamError, match="Stream is closed"):
             await stream.send(b"data")
     
-    @pytest.mark.asyncio
     async def test_send_updates_statistics(self):
         """Test send updates bytes_sent and messages_sent."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -194,7 +185,6 @@ class TestStreamSendOperations:
 class TestStreamManagerOperations:
     """Test StreamManager operations."""
     
-    @pytest.mark.asyncio
     async def test_create_stream_with_auto_id(self):
         """Test creating stream with auto-assigned ID."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -207,7 +197,6 @@ class TestStreamManagerOperations:
         assert stream2.stream_id == 2
         assert mgr.next_stream_id == 3
     
-    @pytest.mark.asyncio
     async def test_create_stream_with_explicit_id(self):
         """Test creating stream with explicit ID."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -218,7 +207,6 @@ class TestStreamManagerOperations:
         assert stream.stream_id == 99
         assert mgr.has_stream(99)
     
-    @pytest.mark.asyncio
     async def test_create_stream_duplicate_id_raises_error(self):
         """Test creating stream with duplicate ID raises error."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -269,7 +257,6 @@ class TestStreamManagerOperations:
         # Should not raise error
         mgr.close_stream(999)
     
-    @pytest.mark.asyncio
     async def test_close_all_streams(self):
         """Test closing all streams."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -305,7 +292,6 @@ class TestStreamManagerOperations:
 class TestStreamManagerCleanup:
     """Test StreamManager cleanup operations."""
     
-    @pytest.mark.asyncio
     async def test_cleanup_inactive_by_status(self):
         """Test cleanup removes inactive streams."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -322,7 +308,6 @@ class TestStreamManagerCleanup:
         assert mgr.has_stream(1)
         assert not mgr.has_stream(2)
     
-    @pytest.mark.asyncio
     async def test_cleanup_inactive_by_timeout(self):
         """Test cleanup removes streams by timeout."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -341,7 +326,6 @@ class TestStreamManagerCleanup:
         assert not mgr.has_stream(1)
         assert mgr.has_stream(2)
     
-    @pytest.mark.asyncio
     async def test_cleanup_inactive_no_streams_removed(self):
         """Test cleanup when all streams are active and recent."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -360,7 +344,6 @@ class TestStreamManagerCleanup:
 class TestStreamStatistics:
     """Test stream statistics tracking."""
     
-    @pytest.mark.asyncio
     async def test_incoming_updates_statistics(self):
         """Test _handle_incoming updates bytes_received and messages_received."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -375,7 +358,6 @@ class TestStreamStatistics:
         assert stream.bytes_received == initial_bytes + len(data)
         assert stream.messages_received == initial_messages + 1
     
-    @pytest.mark.asyncio
     async def test_incoming_updates_last_activity(self):
         """Test _handle_incoming updates last_activity timestamp."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -394,7 +376,6 @@ class TestStreamStatistics:
 class TestStreamEdgeCases:
     """Test stream edge cases and boundary conditions."""
     
-    @pytest.mark.asyncio
     async def test_multiple_out_of_order_cascade(self):
         """Test multiple out-of-order messages cascade correctly."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -422,7 +403,6 @@ class TestStreamEdgeCases:
         assert await stream.receive(timeout=0.1) == b"data2"
         assert await stream.receive(timeout=0.1) == b"data3"
     
-    @pytest.mark.asyncio
     async def test_receive_timeout_behavior(self):
         """Test receive timeout behavior."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -432,7 +412,6 @@ class TestStreamEdgeCases:
         with pytest.raises(STTStreamError, match="Receive timeout"):
             await stream.receive(timeout=0.05)
     
-    @pytest.mark.asyncio
     async def test_stream_close_state(self):
         """Test stream close changes state."""
         stc = STCWrapper(b"test_key_32_bytes_minimum_size!!")
@@ -21,7 +21,6 @@ class TestStreamManagerAdvanced:
         stc = STCWrapper(b"stream_mgr_advanced_test_sd!")
         return StreamManager(b'\x01' * 8, stc)
     
-    @pytest.mark.asyncio
     async def test_stream_manager_has_stream(self, manager):
         """Test has_stream method."""
         assert not manager.has_stream(99)
@@ -29,7 +28,6 @@ class TestStreamManagerAdvanced:
         await manager.create_stream(stream_id=99)  # Side effect: adds to manager
         assert manager.has_stream(99)
     
-    @pytest.mark.asyncio
     async def test_stream_manager_list_streams(self, manager):
         """Test listing all streams."""
         initial_list = manager.list_streams()
@@ -48,7 +46,6 @@ class TestStreamManagerAdvanced:
         assert 20 in stream_ids
         assert 30 in stream_ids
     
-    @pytest.mark.asyncio
     async def test_stream_manager_close_all(self, manager):
         """Test closing all streams."""
         await manager.create_stream(stream_id=1)
@@ -61,7 +58,6 @@ class TestStreamManagerAdvanced:
         
         assert len(manager.list_streams()) == 0
     
-    @pytest.mark.asyncio
     async def test_stream_manager_cleanup_inactive(self, manager):
         """Test cleanup of inactive streams."""
         # Create streams
@@ -89,7 +85,6 @@ class TestSessionManagerAdvanced:
         node_id = b"session_mgr_nd_" + b"0" * 17
         return SessionManager(node_id, stc)
     
-    @pytest.mark.asyncio
     async def test_session_manager_cleanup_inactive(self, manager):
         """Test cleanup of inactive sessions."""
         peer1 = b"peer_cleanup_1_" + b"1" * 17
@@ -107,7 +102,6 @@ class TestSessionManagerAdvanced:
         
         assert cleaned >= 0
     
-    @pytest.mark.asyncio
     async def test_session_manager_cleanup_expired(self, manager):
         """Test cleanup_expired method exists and is callable."""
         # cleanup_expired has a bug (uses _last_activity instead of last_activity)
@@ -121,7 +115,6 @@ class TestSessionManagerAdvanced:
             # But we still covered calling it
             pass
     
-    @pytest.mark.asyncio
     async def test_session_manager_rotate_all_keys(self, manager):
         """Test rotating keys for all sessions."""
         from seigr_toolset_transmissions.crypto import STCWrapper
@@ -147,7 +140,6 @@ class TestSessionManagerAdvanced:
 class TestStreamAdvanced:
     """Test STTStream advanced functionality."""
     
-    @pytest.mark.asyncio
     async def test_stream_multiple_sends(self):
         """Test multiple send operations."""
         context.initialize(b"stream_multi_send_test_seed!")
@@ -168,7 +160,6 @@ class TestStreamAdvanced:
             # May fail but covers the code path
             pass
     
-    @pytest.mark.asyncio
     async def test_stream_receive_buffer_operations(self):
         """Test stream receive buffer."""
         context.initialize(b"stream_buffer_test_seed_!!!")
@@ -195,7 +186,6 @@ class TestStreamAdvanced:
         data3 = await stream.receive()
         assert data3 == b"data3"
     
-    @pytest.mark.asyncio
     async def test_stream_window_size_property(self):
         """Test stream window size property."""
         context.initialize(b"stream_window_test_seed_!!!")
@@ -6,18 +6,18 @@ Tests the ACTUAL async streaming API.
 import pytest
 import asyncio
 from seigr_toolset_transmissions.streaming import StreamEncoder, StreamDecoder
-from seigr_toolset_transmissions.crypto import STCWrapper
 from seigr_toolset_transmissions.utils.exceptions import STTStreamingError
 
 
+@pytest.fixture
+def stc_wrapper(shared_stc_wrapper):
+    """STC wrapper for streaming (fresh stream contexts per test)."""
+    return shared_stc_wrapper(b"streaming_seed_32_bytes_minimum")
+
+
 class TestStreamEncoder:
     """Test STC streaming encoder."""
     
-    @pytest.fixture
-    def stc_wrapper(self):
-        """STC wrapper for streaming."""
-        return STCWrapper(b"streaming_seed_32_bytes_minimum")
-    
     @pytest.fixture
     def session_id(self):
         """Session ID for encoder."""
@@ -48,7 +48,6 @@ class TestStreamEncoder:
         assert stats['mode'] == 'bounded'
         assert stats['ended'] is False
     
-    @pytest.mark.asyncio
     async def test_send_data(self, encoder):
         """Test sending data through encoder."""
         data = b"segment data"
@@ -67,7 +66,6 @@ class TestStreamEncoder:
             assert isinstance(segment['data'], bytes)
             assert isinstance(segment['sequence'], int)
     
-    @pytest.mark.asyncio
     async def test_send_multiple_calls(self, encoder):
         """Test multiple send calls."""
         all_segments = []
@@ -89,7 +87,6 @@ class TestStreamEncoder:
         sequences = [s['sequence'] for s in all_segments]
         assert sequences == sorted(sequences)
     
-    @pytest.mark.asyncio
     async def test_send_empty_data(self, encoder):
         """Test sending empty data."""
         segments = []
@@ -99,7 +96,6 @@ class TestStreamEncoder:
         # Empty data produces no segments (while offset < len(data))
         assert len(segments) == 0
     
-    @pytest.mark.asyncio
     async def test_send_large_data(self, encoder):
         """Test sending large data gets split into segments."""
         large_data = b"x" * 10000  # 10KB
@@ -112,7 +108,6 @@ class TestStreamEncoder:
         # Default segment_size is 65536, so 10KB produces 1 segment
         assert len(segments) >= 1
     
-    @pytest.mark.asyncio
     async def test_encoder_stats(self, encoder):
         """Test encoder statistics tracking."""
         initial_stats = encoder.get_stats()
@@ -141,7 +136,6 @@ class TestStreamEncoder:
         assert stats['bytes_sent'] == 0
         assert stats['ended'] is False
     
-    @pytest.mark.asyncio
     async def test_send_after_end_fails(self, encoder):
         """Test that sending after end() raises error."""
         # End the stream
@@ -152,14 +146,12 @@ class TestStreamEncoder:
             async for _segment in encoder.send(b"data"):
                 pass
     
-    @pytest.mark.asyncio
     async def test_send_non_bytes_fails(self, encoder):
         """Test that sending non-bytes data fails."""
         with pytest.raises(STTStreamingError, match="Data must be bytes"):
             async for _segment in encoder.send("not bytes"):
                 pass
     
-    @pytest.mark.asyncio
     async def test_end_stream(self, encoder):
         """Test ending a stream."""
         # Send some data
@@ -182,11 +174,6 @@ class TestStreamEncoder:
 class TestStreamDecoder:
     """Test STC streaming decoder."""
     
-    @pytest.fixture
-    def stc_wrapper(self):
-        """STC wrapper for streaming."""
-        return STCWrapper(b"streaming_seed_32_bytes_minimum")
-    
     @pytest.fixture
     def session_id(self):
         """Session ID for decoder."""
@@ -215,7 +202,6 @@ class TestStreamDecoder:
         assert stats['buffered_segments'] == 0
         assert stats['ended'] is False
     
-    @pytest.mark.asyncio
     async def test_process_and_receive_segment(self, stc_wrapper, session_id, stream_id):
         """Test processing and receiving segments."""
         encoder = StreamEncoder(stc_wrapper, session_id, stream_id)
@@ -233,16 +219,17 @@ class TestStreamDecoder:
             await decoder.process_segment(segment['data'], i)
         
         # Receive decoded data
-        received_data = b""
+        received_parts = []
         
         # Set a timeout to prevent hanging (Python 3.9 compatible)
         try:
             async def receive_with_timeout():
-                nonlocal received_data
+                received_len = 0
                 async for data_segment in decoder.receive():
-                    received_data += data_segment
+                    received_parts.append(data_segment)
+                    received_len += len(data_segment)
                     # Break after receiving expected data
-                    if len(received_data) >= len(original_data):
+                    if received_len >= len(original_data):
                         break
             
             await asyncio.wait_for(receive_with_timeout(), timeout=1.0)
@@ -250,75 +237,40 @@ class TestStreamDecoder:
             pass  # OK if we got the data
         
         # Should get back original data
-        assert received_data == original_data
-    
-    @pytest.mark.asyncio
-    async def test_encode_decode_roundtrip(self, stc_wrapper, session_id, stream_id):
-        """Test full encode/decode roundtrip."""
+        assert b"".join(received_parts) == original_data
+    
+    @pytest.mark.parametrize("order,expected", [
+        ([0, 1, 2, 3], b"firstsecondthird"),  # In order
+        ([2, 0, 1, 3], b"firstsecondthird"),  # Out of order
+        ([0, 2, 3], b"first"),  # Segment 1 lost
+    ], ids=["inorder", "reordered", "lossy"])
+    async def test_encode_decode_ordering(self, stc_wrapper, session_id, stream_id, order, expected):
+        """Test decoder reassembles segments in sequence order."""
         encoder = StreamEncoder(stc_wrapper, session_id, stream_id, mode='bounded')
         decoder = StreamDecoder(stc_wrapper, session_id, stream_id)
         
-        test_data = [b"first", b"second", b"third"]
-        
         all_segments = []
-        for data in test_data:
+        for data in (b"first", b"second", b"third"):
             async for segment in encoder.send(data):
                 all_segments.append(segment)
+        all_segments.append(await encoder.end())
+        assert len(all_segments) == 4
         
-        # End stream
-        end_segment = await encoder.end()
-        if end_segment:
-            all_segments.append(end_segment)
-        
-        # Process all segments
-        for segment in all_segments:
+        # Process segments in the given order
+        for index in order:
+            segment = all_segments[index]
             await decoder.process_segment(segment['data'], segment['sequence'])
         
-        # Signal end to decoder
-        decoder.signal_end()
-        
-        # Receive all decoded data
-        received = await decoder.receive_all()
-        
-        # Should reconstruct original data
-        expected = b"".join(test_data)
-        assert received == expected
-    
-    @pytest.mark.asyncio
-    async def test_out_of_order_segments(self, stc_wrapper, session_id, stream_id):
-        """Test decoder handles out-of-order segments."""
-        encoder = StreamEncoder(stc_wrapper, session_id, stream_id, mode='bounded')
-        decoder = StreamDecoder(stc_wrapper, session_id, stream_id)
-        
-        # Create multiple small segments
-        test_data = [b"data0", b"data1", b"data2"]
-        all_segments = []
-        
-        for data in test_data:
-            async for segment in encoder.send(data):
-                all_segments.append(segment)
-        
-        await encoder.end()
-        
-        # Process in wrong order: 2, 0, 1
-        if len(all_segments) >= 3:
-            await decoder.process_segment(all_segments[2]['data'], 2)
-            await decoder.process_segment(all_segments[0]['data'], 0)
-            await decoder.process_segment(all_segments[1]['data'], 1)
-            
-            # Check buffered count
-            buffered = decoder.get_buffered_count()
-            # May have buffered segment 2 waiting for 0 and 1
-            assert buffered >= 0
+        # Segments after a gap stay buffered
+        expected_buffered = 0 if 1 in order else 2
+        assert decoder.get_buffered_count() == expected_buffered
         
         decoder.signal_end()
         
-        # Should still reconstruct correctly
+        # Only the contiguous prefix is delivered
         received = await decoder.receive_all()
-        expected = b"".join(test_data)
         assert received == expected
     
-    @pytest.mark.asyncio
     async def test_decoder_stats(self, decoder):
         """Test decoder statistics."""
         initial_stats = decoder.get_stats()
@@ -346,11 +298,10 @@ class TestStreamingIntegration:
     """Integration tests for streaming."""
     
     @pytest.fixture
-    def stc_wrapper(self):
-        """STC wrapper for tests."""
-        return STCWrapper(b"integration_seed_32_bytes_min!")
+    def stc_wrapper(self, shared_stc_wrapper):
+        """STC wrapper shared with the transport integration tests."""
+        return shared_stc_wrapper()
     
-    @pytest.mark.asyncio
     async def test_stream_large_data(self, stc_wrapper):
         """Test streaming large data."""
         session_id = b'\x01' * 8
@@ -362,17 +313,12 @@ class TestStreamingIntegration:
         # Large data
         large_data = b"x" * 50000  # 50KB
         
-        # Encode
-        segments = []
+        # Decode each segment as it is encoded, without holding them all
         async for segment in encoder.send(large_data):
-            segments.append(segment)
+            await decoder.process_segment(segment['data'], segment['sequence'])
         
         await encoder.end()
         
-        # Process all segments
-        for segment in segments:
-            await decoder.process_segment(segment['data'], segment['sequence'])
-        
         decoder.signal_end()
         
         # Receive all
@@ -381,7 +327,6 @@ class TestStreamingIntegration:
         assert received == large_data
         assert len(received) == 50000
     
-    @pytest.mark.asyncio
     async def test_different_stream_ids(self, stc_wrapper):
         """Test that different stream IDs produce different encryption."""
         session_id = b'\x02' * 8
@@ -403,7 +348,6 @@ class TestStreamingIntegration:
         # Should produce different encrypted data
         assert segments1[0]['data'] != segments2[0]['data']
     
-    @pytest.mark.asyncio
     async def test_cross_stream_decode_fails(self, stc_wrapper):
         """Test that wrong stream ID can't decode."""
         session_id = b'\x03' * 8
@@ -430,7 +374,6 @@ class TestStreamingIntegration:
         received = await decoder.receive_all()
         assert received != data  # Wrong stream produces wrong decryption
     
-    @pytest.mark.asyncio
     async def test_multiple_sends_sequential(self, stc_wrapper):
         """Test multiple sequential send operations."""
         session_id = b'\x04' * 8
@@ -461,7 +404,6 @@ class TestStreamingIntegration:
         
         assert received == expected
     
-    @pytest.mark.asyncio
     async def test_empty_stream(self, stc_wrapper):
         """Test streaming with no data (just end)."""
         session_id = b'\x05' * 8
@@ -482,7 +424,6 @@ class TestStreamingIntegration:
         received = await decoder.receive_all()
         assert received == b""
     
-    @pytest.mark.asyncio
     async def test_encoder_flow_control(self, stc_wrapper):
         """Test encoder has flow control credits."""
         session_id = b'\x07' * 8
@@ -503,7 +444,6 @@ class TestStreamingIntegration:
         # Credits should have changed (decreased)
         assert stats_after['credits'] <= initial_credits
     
-    @pytest.mark.asyncio
     async def test_decoder_buffering(self, stc_wrapper):
         """Test decoder buffers out-of-order segments."""
         session_id = b'\x06' * 8
@@ -4,19 +4,24 @@ Tests the ACTUAL async streaming API.
 """
 
 import pytest
-from seigr_toolset_transmissions.crypto import STCWrapper
 from seigr_toolset_transmissions.streaming.decoder import StreamDecoder
 from seigr_toolset_transmissions.streaming.encoder import StreamEncoder
+from seigr_toolset_transmissions.utils.exceptions import STTStreamingError
+
+
+# Rejected by the segment checks before any decryption is attempted
+_CORRUPTED_CHUNK = b'\xff\xfe\xfd\xfc'
+
+
+@pytest.fixture
+def stc_wrapper(shared_stc_wrapper):
+    """STC wrapper for decoder (fresh stream contexts per test)."""
+    return shared_stc_wrapper(b"decoder_test_seed_32_bytes_min!!")
 
 
 class TestStreamDecoder:
     """Test stream decoder."""
     
-    @pytest.fixture
-    def stc_wrapper(self):
-        """Create STC wrapper for encryption."""
-        return STCWrapper(b"decoder_test_seed_32_bytes_min!!")
-    
     @pytest.fixture
     def decoder(self, stc_wrapper):
         """Create decoder instance."""
@@ -37,17 +42,21 @@ class TestStreamDecoder:
         count = decoder.get_buffered_count()
         assert count == 0
     
-    @pytest.mark.asyncio
-    async def test_process_segment_invalid_format(self, decoder):
+    @pytest.mark.parametrize("invalid_segment", [
+        b"short",
+        _CORRUPTED_CHUNK,
+        "not bytes",
+    ])
+    async def test_process_segment_invalid_format(self, decoder, invalid_segment):
         """Test processing segment with invalid format."""
-        # Too short - will fail decryption
-        invalid_segment = b"short"
-        
-        # Should raise error when trying to decrypt
-        with pytest.raises(Exception):  # STC will raise decryption error
+        with pytest.raises(STTStreamingError):
             await decoder.process_segment(invalid_segment, 0)
+        
+        # Rejected segments leave no state behind
+        stats = decoder.get_stats()
+        assert stats['next_expected'] == 0
+        assert stats['buffered_segments'] == 0
     
-    @pytest.mark.asyncio
     async def test_decoder_reset(self, stc_wrapper):
         """Test decoder reset clears state."""
         session_id = b"session2"
@@ -5,17 +5,16 @@ UDP transport comprehensive coverage tests.
 import pytest
 import asyncio
 from seigr_toolset_transmissions.transport.udp import UDPTransport
-from seigr_toolset_transmissions.crypto import STCWrapper
 
 
 class TestUDPCoverage:
     """UDP transport coverage tests."""
     
     @pytest.fixture
-    def stc_wrapper(self):
-        return STCWrapper(b"udp_coverage_32_bytes_minimum!!")
+    def stc_wrapper(self, shared_stc_wrapper):
+        """STC wrapper for UDP tests (fresh stream contexts per test)."""
+        return shared_stc_wrapper(b"udp_coverage_32_bytes_minimum!!")
     
-    @pytest.mark.asyncio
     async def test_udp_start_stop(self, stc_wrapper):
         """Test UDP start and stop."""
         udp = UDPTransport("127.0.0.1", 0, stc_wrapper)
@@ -23,26 +22,27 @@ class TestUDPCoverage:
         assert isinstance(port, int)
         await udp.stop()
     
-    @pytest.mark.asyncio
     async def test_udp_send_frame(self, stc_wrapper):
         """Test sending UDP frame."""
+        from seigr_toolset_transmissions.frame import STTFrame
+        
         udp = UDPTransport("127.0.0.1", 0, stc_wrapper)
         await udp.start()
         try:
-            from seigr_toolset_transmissions.frame import STTFrame
             frame = STTFrame(
                 session_id=b"12345678",
+                sequence=1,
                 stream_id=1,
                 frame_type=1,
                 flags=0,
                 payload=b"test"
             )
+            # No listener on the port is not a send-time error for UDP
             await udp.send_frame(frame, ("127.0.0.1", 9999))
-        except Exception:
-            pass  # Expected - no listener on port
-        await udp.stop()
+            assert udp.packets_sent == 1
+        finally:
+            await udp.stop()
     
-    @pytest.mark.asyncio
     async def test_udp_receive_timeout(self, stc_wrapper):
         """Test UDP receive with timeout."""
         udp = UDPTransport("127.0.0.1", 0, stc_wrapper)
@@ -53,18 +53,18 @@ class TestUDPCoverage:
             pass  # Expected - no incoming frames
         await udp.stop()
     
-    @pytest.mark.asyncio
     async def test_udp_double_start(self, stc_wrapper):
         """Test double start."""
+        from seigr_toolset_transmissions.utils.exceptions import STTTransportError
+        
         udp = UDPTransport("127.0.0.1", 0, stc_wrapper)
         await udp.start()
         try:
-            await udp.start()  # Should raise error
-        except Exception:
-            pass  # Expected - already started
-        await udp.stop()
+            with pytest.raises(STTTransportError, match="already running"):
+                await udp.start()
+        finally:
+            await udp.stop()
     
-    @pytest.mark.asyncio
     async def test_udp_reuse_port_unix(self, stc_wrapper):
         """Test reuse_port on Unix platforms (line 105)."""
         import sys
@@ -81,7 +81,6 @@ class TestUDPCoverage:
         
         await udp.stop()
     
-    @pytest.mark.asyncio
     async def test_udp_stop_when_not_running(self, stc_wrapper):
         """Test stopping when not running (line 130-131)."""
         udp = UDPTransport("127.0.0.1", 0, stc_wrapper)
@@ -90,7 +89,6 @@ class TestUDPCoverage:
         await udp.stop()
         assert not udp.running
     
-    @pytest.mark.asyncio
     async def test_udp_send_frame_error(self, stc_wrapper):
         """Test send frame error handling (line 187-189)."""
         from seigr_toolset_transmissions.utils.exceptions import STTTransportError
@@ -111,7 +109,6 @@ class TestUDPCoverage:
         with pytest.raises(STTTransportError, match="Transport not running"):
             await udp.send_frame(frame, ("127.0.0.1", 9999))
     
-    @pytest.mark.asyncio
     async def test_udp_send_raw_not_running(self, stc_wrapper):
         """Test send_raw when not running (line 204)."""
         from seigr_toolset_transmissions.utils.exceptions import STTTransportError
@@ -122,7 +119,6 @@ class TestUDPCoverage:
         with pytest.raises(STTTransportError, match="Transport not running"):
             await udp.send_raw(b"test", ("127.0.0.1", 9999))
     
-    @pytest.mark.asyncio
     async def test_udp_send_raw(self, stc_wrapper):
         """Test sending raw data (line 212)."""
         udp = UDPTransport("127.0.0.1", 0, stc_wrapper)
@@ -136,7 +132,6 @@ class TestUDPCoverage:
         
         await udp.stop()
     
-    @pytest.mark.asyncio
     async def test_udp_receive_frame_not_running(self, stc_wrapper):
         """Test receive when not running (line 236)."""
         from seigr_toolset_transmissions.utils.exceptions import STTTransportError
@@ -147,29 +142,29 @@ class TestUDPCoverage:
         with pytest.raises((STTTransportError, AttributeError)):
             await udp.receive_frame()
     
-    @pytest.mark.asyncio
     async def test_udp_protocol_async_callback(self, stc_wrapper):
         """Test protocol with async callback (line 315, 319-322)."""
         received_data = []
+        received = asyncio.Event()
         
         async def async_callback(data, addr):
             received_data.append((data, addr))
+            received.set()
         
         udp = UDPTransport("127.0.0.1", 0, stc_wrapper, on_frame_received=async_callback)
         local_addr = await udp.start()
         
-        # Send data to ourselves
-        await udp.send_raw(b"test_async", local_addr)
-        
-        # Give time for callback
-        await asyncio.sleep(0.1)
-        
-        await udp.stop()
-        
-        # Should have received the data
-        assert len(received_data) >= 0  # May or may not receive based on timing
+        try:
+            # Send data to ourselves
+            await udp.send_raw(b"test_async", local_addr)
+            
+            # Wait for the scheduled callback to run
+            await asyncio.wait_for(received.wait(), timeout=1.0)
+        finally:
+            await udp.stop()
+        
+        assert received_data[0] == (b"test_async", local_addr)
     
-    @pytest.mark.asyncio
     async def test_udp_protocol_error_received(self, stc_wrapper):
         """Test protocol error_received (line 333)."""
         udp = UDPTransport("127.0.0.1", 0, stc_wrapper)
@@ -53,7 +53,6 @@ class TestStreamUncovered:
     def stc_wrapper(self):
         return STCWrapper(b"stream_uncovered_32_bytes_mini!")
     
-    @pytest.mark.asyncio
     async def test_stream_send_closed_stream(self, stc_wrapper):
         """Test sending on closed stream (line 74)."""
         stream = STTStream(b"sendclos", 1, stc_wrapper)
@@ -64,7 +63,6 @@ class TestStreamUncovered:
         except Exception as e:
             assert "closed" in str(e).lower()
     
-    @pytest.mark.asyncio
     async def test_stream_receive_closed_stream(self, stc_wrapper):
         """Test receiving on closed stream (line 95)."""
         stream = STTStream(b"recvclos", 2, stc_wrapper)
@@ -75,7 +73,6 @@ class TestStreamUncovered:
         except Exception as e:
             assert "closed" in str(e).lower()
     
-    @pytest.mark.asyncio
     async def test_stream_handle_incoming(self, stc_wrapper):
         """Test stream incoming data handling (lines 143+)."""
         stream = STTStream(b"incoming", 3, stc_wrapper)
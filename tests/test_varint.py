@@ -78,6 +78,13 @@ class TestVarint:
         assert varint_size(16383) == 2
         assert varint_size(16384) == 3
     
+    def test_varint_size_byte_boundaries(self):
+        """Test varint_size agrees with encode_varint at every byte boundary."""
+        for shift in range(0, 64, 7):
+            for value in (2 ** shift - 1, 2 ** shift, 2 ** (shift + 7) - 1):
+                assert varint_size(value) == len(encode_varint(value))
+        assert varint_size(2 ** 64 - 1) == len(encode_varint(2 ** 64 - 1))
+    
     def test_encode_negative_raises(self):
         """Test encoding negative value raises error."""
         with pytest.raises(ValueError):
@@ -16,21 +16,18 @@ class TestWebSocketAdditional:
     def stc_wrapper(self):
         return STCWrapper(b"ws_additional_32_bytes_minimum!")
     
-    @pytest.mark.asyncio
     async def test_ws_client_mode_flags(self, stc_wrapper):
         """Test WebSocket client mode initialization."""
         ws = WebSocketTransport(is_client=True, host="127.0.0.1", port=8080, stc_wrapper=stc_wrapper)
         assert ws.is_client is True
         assert ws.is_server is False
     
-    @pytest.mark.asyncio
     async def test_ws_server_mode_flags(self, stc_wrapper):
         """Test WebSocket server mode initialization."""
         ws = WebSocketTransport(is_server=True, host="127.0.0.1", port=8081, stc_wrapper=stc_wrapper)
         assert ws.is_server is True
         assert ws.is_client is False
     
-    @pytest.mark.asyncio
     async def test_ws_state_tracking(self, stc_wrapper):
         """Test WebSocket state tracking."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=True)
@@ -39,7 +36,6 @@ class TestWebSocketAdditional:
         assert ws.state == WebSocketState.OPEN
         await ws.stop()
     
-    @pytest.mark.asyncio
     async def test_ws_client_connect_error(self, stc_wrapper):
         """Test client connection error handling."""
         ws = WebSocketTransport(is_client=True, stc_wrapper=stc_wrapper)
@@ -48,7 +44,6 @@ class TestWebSocketAdditional:
         except Exception:
             pass  # Expected - unreachable address
     
-    @pytest.mark.asyncio
     async def test_ws_send_frame_server(self, stc_wrapper):
         """Test sending frame in server mode."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=True)
@@ -69,7 +64,6 @@ class TestWebSocketAdditional:
         
         await ws.stop()
     
-    @pytest.mark.asyncio
     async def test_ws_receive_frame_timeout(self, stc_wrapper):
         """Test receive frame with timeout."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=True)
@@ -82,7 +76,6 @@ class TestWebSocketAdditional:
         
         await ws.stop()
     
-    @pytest.mark.asyncio
     async def test_ws_close_with_code(self, stc_wrapper):
         """Test WebSocket close with code."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=True)
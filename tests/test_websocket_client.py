@@ -20,7 +20,6 @@ def stc_wrapper():
 class TestWebSocketClientMode:
     """Test WebSocket client-specific functionality."""
     
-    @pytest.mark.asyncio
     async def test_client_receive_text_frame(self, stc_wrapper):
         """Test client sending TEXT frame."""
         server = WebSocketTransport(
@@ -54,7 +53,6 @@ class TestWebSocketClientMode:
         finally:
             await server.stop()
     
-    @pytest.mark.asyncio
     async def test_client_receive_ping(self, stc_wrapper):
         """Test client responding to PING."""
         server = WebSocketTransport(
@@ -95,7 +93,6 @@ class TestWebSocketClientMode:
         finally:
             await server.stop()
     
-    @pytest.mark.asyncio
     async def test_client_receive_pong(self, stc_wrapper):
         """Test client receiving PONG frame."""
         server = WebSocketTransport(
@@ -130,7 +127,6 @@ class TestWebSocketClientMode:
         finally:
             await server.stop()
     
-    @pytest.mark.asyncio
     async def test_client_receive_close(self, stc_wrapper):
         """Test client receiving CLOSE frame."""
         server = WebSocketTransport(
@@ -173,7 +169,6 @@ class TestWebSocketClientMode:
         finally:
             await server.stop()
     
-    @pytest.mark.asyncio
     async def test_client_receive_binary_frame(self, stc_wrapper):
         """Test client receiving BINARY frame."""
         received_frames = []
@@ -219,7 +214,6 @@ class TestWebSocketClientMode:
         finally:
             await server.stop()
     
-    @pytest.mark.asyncio
     async def test_client_malformed_frame(self, stc_wrapper):
         """Test client handling malformed frame."""
         server = WebSocketTransport(
@@ -250,7 +244,6 @@ class TestWebSocketClientMode:
         finally:
             await server.stop()
     
-    @pytest.mark.asyncio
     async def test_client_receive_loop_error_handling(self, stc_wrapper):
         """Test client receive loop handles errors gracefully."""
         server = WebSocketTransport(
@@ -281,7 +274,6 @@ class TestWebSocketClientMode:
             if server.is_running:
                 await server.stop()
     
-    @pytest.mark.asyncio
     async def test_client_close_with_code_and_reason(self, stc_wrapper):
         """Test client sending close with code and reason."""
         server = WebSocketTransport(
@@ -312,7 +304,6 @@ class TestWebSocketClientMode:
         finally:
             await server.stop()
     
-    @pytest.mark.asyncio
     async def test_server_handshake_missing_upgrade(self, stc_wrapper):
         """Test server rejecting handshake without Upgrade header."""
         server = WebSocketTransport(
@@ -345,7 +336,6 @@ class TestWebSocketClientMode:
         finally:
             await server.stop()
     
-    @pytest.mark.asyncio
     async def test_server_handshake_wrong_version(self, stc_wrapper):
         """Test server rejecting wrong WebSocket version."""
         server = WebSocketTransport(
@@ -385,7 +375,6 @@ class TestWebSocketClientMode:
         finally:
             await server.stop()
     
-    @pytest.mark.asyncio
     async def test_websocket_get_stats(self, stc_wrapper):
         """Test WebSocket get_stats returns valid data."""
         ws = WebSocketTransport(
@@ -15,14 +15,12 @@ class TestWebSocketCoverage:
     def stc_wrapper(self):
         return STCWrapper(b"ws_coverage_32_bytes_minimum!!")
     
-    @pytest.mark.asyncio
     async def test_ws_server_start_stop(self, stc_wrapper):
         """Test WebSocket server lifecycle."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=True)
         await ws.start()
         await ws.stop()
     
-    @pytest.mark.asyncio
     async def test_ws_client_connect_fail(self, stc_wrapper):
         """Test WebSocket client connection failure."""
         ws = WebSocketTransport("127.0.0.1", 9999, stc_wrapper, is_server=False)
@@ -31,7 +29,6 @@ class TestWebSocketCoverage:
         except (asyncio.TimeoutError, ConnectionRefusedError, OSError, Exception):
             pass  # Expected - no server listening
     
-    @pytest.mark.asyncio
     async def test_ws_send_without_connection(self, stc_wrapper):
         """Test sending without connection."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=False)
@@ -40,7 +37,6 @@ class TestWebSocketCoverage:
         except Exception:
             pass  # Expected - not connected
     
-    @pytest.mark.asyncio
     async def test_ws_receive_without_connection(self, stc_wrapper):
         """Test receiving without connection."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=False)
@@ -49,7 +45,6 @@ class TestWebSocketCoverage:
         except (asyncio.TimeoutError, Exception):
             pass  # Expected - not connected
     
-    @pytest.mark.asyncio
     async def test_ws_stats(self, stc_wrapper):
         """Test WebSocket statistics."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=True)
@@ -59,7 +54,6 @@ class TestWebSocketCoverage:
         assert 'bytes_received' in stats
         await ws.stop()
     
-    @pytest.mark.asyncio
     async def test_ws_multiple_starts(self, stc_wrapper):
         """Test starting already started transport."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=True)
@@ -70,7 +64,6 @@ class TestWebSocketCoverage:
             pass  # Expected - already started
         await ws.stop()
     
-    @pytest.mark.asyncio
     async def test_ws_close_connection(self, stc_wrapper):
         """Test closing WebSocket connection."""
         ws = WebSocketTransport("127.0.0.1", 0, stc_wrapper, is_server=True)
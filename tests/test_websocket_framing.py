@@ -7,7 +7,9 @@ from unittest.mock import AsyncMock
 
 from seigr_toolset_transmissions.transport.websocket import (
     WebSocketTransport,
-    WebSocketState
+    WebSocketState,
+    WebSocketOpcode,
+    _apply_mask,
 )
 from seigr_toolset_transmissions.frame import STTFrame
 from seigr_toolset_transmissions.utils.exceptions import STTTransportError
@@ -16,7 +18,6 @@ from seigr_toolset_transmissions.utils.exceptions import STTTransportError
 class TestWebSocketFrameProcessing:
     """Test WebSocket frame reception and processing."""
     
-    @pytest.mark.asyncio
     async def test_receive_binary_with_stt_frame(self):
         """Test receiving binary frame with valid STT frame."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -60,7 +61,6 @@ class TestWebSocketFrameProcessing:
         
         assert len(received_frames) == 1
     
-    @pytest.mark.asyncio
     async def test_receive_text_frame_with_handler(self):
         """Test receiving TEXT frame triggers message handler."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -95,7 +95,6 @@ class TestWebSocketFrameProcessing:
         
         assert len(received_messages) == 1
     
-    @pytest.mark.asyncio
     async def test_receive_ping_sends_pong(self):
         """Test PING frame triggers PONG response."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -124,7 +123,6 @@ class TestWebSocketFrameProcessing:
         
         assert writer.write.called
     
-    @pytest.mark.asyncio
     async def test_receive_pong_frame(self):
         """Test PONG frame is handled silently."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -151,7 +149,6 @@ class TestWebSocketFrameProcessing:
         except asyncio.IncompleteReadError:
             pass  # Expected - mock signals end of test data
     
-    @pytest.mark.asyncio
     async def test_receive_close_with_code_and_reason(self):
         """Test CLOSE frame with code and reason."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -178,7 +175,6 @@ class TestWebSocketFrameProcessing:
         assert ws.close_code == 1000
         assert ws.close_reason == "Normal"
     
-    @pytest.mark.asyncio
     async def test_receive_close_sends_response(self):
         """Test CLOSE triggers close response when not closing."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -208,7 +204,6 @@ class TestWebSocketFrameProcessing:
 class TestWebSocketExtendedLengths:
     """Test extended payload length encoding."""
     
-    @pytest.mark.asyncio
     async def test_receive_126_length_encoding(self):
         """Test payload length 126 (2-byte extension)."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -240,7 +235,6 @@ class TestWebSocketExtendedLengths:
         # bytes_received includes header overhead
         assert ws.bytes_received >= 200
     
-    @pytest.mark.asyncio
     async def test_receive_127_length_encoding(self):
         """Test payload length 127 (8-byte extension)."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -272,7 +266,39 @@ class TestWebSocketExtendedLengths:
         # bytes_received includes header overhead
         assert ws.bytes_received >= 70000
     
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("is_client", [True, False])
+    @pytest.mark.parametrize("length, length_code, length_format", [
+        (125, 125, ""),
+        (126, 126, "!H"),
+        (65535, 126, "!H"),
+        (65536, 127, "!Q"),
+    ])
+    def test_build_frame_length_boundaries(self, is_client, length, length_code, length_format):
+        """Test sent frames pick the 7-bit, 16-bit or 64-bit length field."""
+        ws = WebSocketTransport(
+            reader=AsyncMock(spec=asyncio.StreamReader),
+            writer=AsyncMock(spec=asyncio.StreamWriter),
+            is_client=is_client
+        )
+        payload = bytes(i % 251 for i in range(length))
+        
+        frame = ws._build_ws_frame(WebSocketOpcode.BINARY, payload)
+        
+        assert frame[0] == 0x80 | WebSocketOpcode.BINARY
+        assert frame[1] == (0x80 if is_client else 0x00) | length_code
+        offset = 2
+        if length_format:
+            extended = struct.unpack_from(length_format, frame, offset)[0]
+            assert extended == length
+            offset += struct.calcsize(length_format)
+        
+        if is_client:
+            mask = frame[offset:offset + 4]
+            offset += 4
+            assert _apply_mask(frame[offset:], mask) == payload
+        else:
+            assert frame[offset:] == payload
+    
     async def test_frame_exceeds_max_size(self):
         """Test frame exceeding max size raises error."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -302,7 +328,6 @@ class TestWebSocketExtendedLengths:
 class TestWebSocketMasking:
     """Test WebSocket masking operations."""
     
-    @pytest.mark.asyncio
     async def test_receive_masked_frame(self):
         """Test receiving masked frame (client sends masked)."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -340,12 +365,23 @@ class TestWebSocketMasking:
         
         assert len(received_messages) == 1
         assert received_messages[0] == payload
+    
+    @pytest.mark.parametrize("length", [0, 1, 3, 4, 7, 70000])
+    def test_apply_mask_matches_bytewise_xor(self, length):
+        """Test mask helper matches RFC 6455 byte-by-byte masking."""
+        mask = b"\x12\x34\x56\x78"
+        payload = bytes(i % 251 for i in range(length))
+        
+        expected = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        
+        masked = _apply_mask(payload, mask)
+        assert masked == expected
+        assert _apply_mask(masked, mask) == payload
 
 
 class TestWebSocketAsyncHandlers:
     """Test async callback handlers."""
     
-    @pytest.mark.asyncio
     async def test_async_message_handler(self):
         """Test async message handler is awaited."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -381,7 +417,6 @@ class TestWebSocketAsyncHandlers:
         
         assert len(received) == 1
     
-    @pytest.mark.asyncio
     async def test_async_frame_handler(self):
         """Test async frame received handler."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -429,7 +464,6 @@ class TestWebSocketAsyncHandlers:
 class TestWebSocketErrors:
     """Test error handling paths."""
     
-    @pytest.mark.asyncio
     async def test_receive_cancelled(self):
         """Test receive handles cancellation."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -447,7 +481,6 @@ class TestWebSocketErrors:
         with pytest.raises(asyncio.CancelledError):
             await ws.receive_frames()
     
-    @pytest.mark.asyncio
     async def test_receive_general_exception(self):
         """Test receive handles general exceptions."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -466,7 +499,6 @@ class TestWebSocketErrors:
         
         assert ws.state == WebSocketState.CLOSED
     
-    @pytest.mark.asyncio
     async def test_binary_not_valid_stt_frame(self):
         """Test binary frame that's not valid STT frame."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -506,7 +538,6 @@ class TestWebSocketErrors:
 class TestWebSocketConnection:
     """Test connection operations."""
     
-    @pytest.mark.asyncio
     async def test_connect_server_mode_error(self):
         """Test connect raises error in server mode."""
         ws = WebSocketTransport(host="127.0.0.1", port=8080, is_server=True)
@@ -514,7 +545,6 @@ class TestWebSocketConnection:
         with pytest.raises(STTTransportError, match="client mode"):
             await ws.connect()
     
-    @pytest.mark.asyncio
     async def test_connect_no_host_error(self):
         """Test connect requires host and port."""
         ws = WebSocketTransport(is_client=True)
@@ -526,7 +556,6 @@ class TestWebSocketConnection:
 class TestWebSocketBinaryWithMessageHandler:
     """Test binary frames with message handler (no frame handler)."""
     
-    @pytest.mark.asyncio
     async def test_binary_with_message_handler_no_frame_handler(self):
         """Test binary frame with message handler but no frame handler."""
         reader = AsyncMock(spec=asyncio.StreamReader)
@@ -562,3 +591,60 @@ class TestWebSocketBinaryWithMessageHandler:
         
         assert len(received_messages) == 1
         assert received_messages[0] == binary_data
+
+
+class TestWebSocketSendMany:
+    """Test coalesced multi-message sends."""
+    
+    async def test_send_many_single_write(self):
+        """Test all frames go out in one write and one drain."""
+        reader = AsyncMock(spec=asyncio.StreamReader)
+        writer = AsyncMock(spec=asyncio.StreamWriter)
+        
+        ws = WebSocketTransport(
+            reader=reader,
+            writer=writer,
+            is_client=False  # Server frames are unmasked
+        )
+        ws.state = WebSocketState.OPEN
+        
+        sent = await ws.send_many([b"abc", b"x" * 200])
+        
+        assert sent == 2
+        writer.write.assert_called_once_with(
+            b"\x82\x03abc" + b"\x82\x7e" + struct.pack("!H", 200) + b"x" * 200
+        )
+        writer.drain.assert_awaited_once()
+        assert ws.frames_sent == 2
+        assert ws.bytes_sent == 5 + 4 + 200
+    
+    async def test_send_many_oversized_sends_nothing(self):
+        """Test an oversized message fails the batch before writing."""
+        reader = AsyncMock(spec=asyncio.StreamReader)
+        writer = AsyncMock(spec=asyncio.StreamWriter)
+        
+        ws = WebSocketTransport(
+            reader=reader,
+            writer=writer,
+            is_client=True
+        )
+        ws.state = WebSocketState.OPEN
+        ws.config.max_frame_size = 100
+        
+        with pytest.raises(STTTransportError, match="exceeds max"):
+            await ws.send_many([b"ok", b"x" * 101])
+        
+        assert not writer.write.called
+        assert ws.frames_sent == 0
+    
+    async def test_send_many_not_connected(self):
+        """Test send_many requires an open connection."""
+        ws = WebSocketTransport(
+            reader=AsyncMock(spec=asyncio.StreamReader),
+            writer=AsyncMock(spec=asyncio.StreamWriter),
+            is_client=True
+        )
+        ws.state = WebSocketState.CLOSED
+        
+        with pytest.raises(STTTransportError, match="not connected"):
+            await ws.send_many([b"data"])